@@ -0,0 +1,73 @@
+"""
+Compares the explicit stack DepthFirstSearch with the original recursive one.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/dfs_benchmark.py
+
+The graphs are kept small enough for the recursive search to run within the recursion limit,
+that is raised for the occasion.
+"""
+
+import random
+import sys
+import time
+
+from graph import Graph, DepthFirstSearch
+
+
+class RecursiveDepthFirstSearch(DepthFirstSearch):
+    """The original DepthFirstSearch, recurring once per vertex."""
+
+    def _depth_first_search(self, graph: Graph, vertex: int):
+        count = 0
+        self._visited[vertex] = True
+
+        for v in graph.adjacents(vertex):
+            if not self._visited[v]:
+                self._predecessor[v] = vertex
+                count += self._depth_first_search(graph, v)
+
+        return count + 1
+
+
+def random_graph(numvertices: int, numedges: int, seed=42):
+    rnd = random.Random(seed)
+    g = Graph(numvertices)
+    for _ in range(numedges):
+        g.add_edge(rnd.randrange(numvertices), rnd.randrange(numvertices))
+    return g
+
+
+def path_graph(numvertices: int):
+    g = Graph(numvertices)
+    for v in range(numvertices - 1):
+        g.add_edge(v, v + 1)
+    return g
+
+
+def best_time(search, g, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        search(g, 0)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    sys.setrecursionlimit(100000)
+    graphs = (
+        ("random V=20000 E=100000", random_graph(20000, 100000)),
+        ("path V=20000", path_graph(20000)),
+    )
+    for name, g in graphs:
+        recursive = best_time(RecursiveDepthFirstSearch, g)
+        iterative = best_time(DepthFirstSearch, g)
+        assert RecursiveDepthFirstSearch(g, 0)._predecessor == DepthFirstSearch(g, 0)._predecessor
+        print("{:24}: recursive {:7.4f} s, explicit stack {:7.4f} s ({:.2f}x)".format(
+            name, recursive, iterative, recursive / iterative))
+
+
+if __name__ == '__main__':
+    main()
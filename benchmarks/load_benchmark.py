@@ -0,0 +1,78 @@
+"""
+Compares the bulk loader of Graph.from_file with the original line by line loader.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/load_benchmark.py [graph_file] [--directed]
+
+Without a graph file a random graph with 200000 vertexes and 1500000 edges is generated in a temporary file.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from graph import Graph, CSRGraph
+
+
+def line_by_line_from_file(filename: str, directed=False):
+    """The original Graph.from_file: one line, one split and one add_edge at a time."""
+    with open(filename) as fh:
+        vertnum = int(fh.readline().strip())
+        int(fh.readline().strip())
+        graph = Graph(vertnum, directed)
+
+        for line in fh:
+            numstr = line.split()
+            v1 = int(numstr[0])
+            v2 = int(numstr[1])
+            graph.add_edge(v1, v2)
+
+    return graph
+
+
+def write_random_graph(filename: str, numvertices: int, numedges: int, seed=42):
+    rnd = random.Random(seed)
+    with open(filename, 'w') as fh:
+        fh.write(str(numvertices) + "\n" + str(numedges) + "\n")
+        for _ in range(numedges):
+            fh.write(str(rnd.randrange(numvertices)) + " " + str(rnd.randrange(numvertices)) + "\n")
+
+
+def best_time(function, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('filename', nargs='?')
+    parser.add_argument('--directed', action='store_true')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    filename = args.filename
+    if filename is None:
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+        write_random_graph(filename, 200000, 1500000)
+
+    try:
+        baseline = best_time(line_by_line_from_file, filename, args.directed, repeat=args.repeat)
+        print("line by line loader  : {:8.3f} s".format(baseline))
+        for name, loader in (("Graph.from_file", Graph.from_file), ("CSRGraph.from_file", CSRGraph.from_file)):
+            elapsed = best_time(loader, filename, args.directed, repeat=args.repeat)
+            print("{:21}: {:8.3f} s  ({:.2f}x)".format(name, elapsed, baseline / elapsed))
+    finally:
+        if args.filename is None:
+            os.remove(filename)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Reproducible benchmark suite: times the hot paths of the library on seeded synthetic graphs of increasing size.
+
+For every generator and scale a graph is written to a temporary file in the format read by Graph.from_file,
+then loading it, adding its edges one at a time with add_edge, a DepthFirstSearch and a BreadthFirstSearch from
+vertex 0 and the ConnectedComponents are timed (best of --repeat runs) and their peak memory is measured with
+tracemalloc (in a separate run, as tracing slows things down).
+
+The results are printed and, with --output, saved as JSON; with --baseline they are compared with the results
+saved by a previous run, and the exit status is 1 if any benchmark got slower than the baseline by more than
+--tolerance.
+
+Usage (from the repository root):
+    PYTHONPATH=. python benchmarks/suite.py [--scales 1000 10000 100000] [--output results.json]
+                                            [--baseline baseline.json] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from graph import Graph, DepthFirstSearch, BreadthFirstSearch, ConnectedComponents
+from graph import generators
+
+SEED = 42
+
+# Every generator builds a graph with about the given number of vertexes.
+GENERATORS = {
+    'erdos-renyi': lambda scale: generators.erdos_renyi(scale, 4 * scale, SEED),
+    'preferential': lambda scale: generators.preferential_attachment(scale, 3, SEED),
+    'grid': lambda scale: generators.grid(int(scale ** 0.5), int(scale ** 0.5)),
+    'path': lambda scale: generators.path(scale),
+    'components': lambda scale: generators.components(max(scale // 10, 1), 10, SEED),
+}
+
+
+def add_edges_one_at_a_time(numvertices, endpoints):
+    graph = Graph(numvertices)
+    vertexes = iter(endpoints)
+    for v, w in zip(vertexes, vertexes):
+        graph.add_edge(v, w)
+    return graph
+
+
+def benchmarks(filename, numvertices, endpoints):
+    """:return: a list of (name, function) pairs, the functions running the timed code with no arguments."""
+    graph = Graph.from_file(filename)
+    return [
+        ('from_file', lambda: Graph.from_file(filename)),
+        ('add_edge', lambda: add_edges_one_at_a_time(numvertices, endpoints)),
+        ('dfs', lambda: DepthFirstSearch(graph, 0)),
+        ('bfs', lambda: BreadthFirstSearch(graph, 0)),
+        ('connected_components', lambda: ConnectedComponents(graph)),
+    ]
+
+
+def best_time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(names, scales, repeat):
+    results = []
+    for name in names:
+        for scale in scales:
+            numvertices, endpoints = GENERATORS[name](scale)
+            numedges = len(endpoints) // 2
+            fd, filename = tempfile.mkstemp(suffix='.txt')
+            os.close(fd)
+            try:
+                generators.write_edge_list(filename, numvertices, endpoints)
+                for benchmark, function in benchmarks(filename, numvertices, endpoints):
+                    seconds = best_time(function, repeat)
+                    result = {
+                        'generator': name,
+                        'vertices': numvertices,
+                        'edges': numedges,
+                        'benchmark': benchmark,
+                        'seconds': seconds,
+                        'edges_per_second': numedges / seconds if seconds > 0 else None,
+                        'peak_bytes': peak_memory(function),
+                    }
+                    results.append(result)
+                    print("{generator:12} V={vertices:<8} E={edges:<8} {benchmark:21} {seconds:9.4f} s "
+                          "{peak_bytes:>12} B".format(**result))
+            finally:
+                os.remove(filename)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Prints the comparison with the baseline results.
+
+    :return: the number of benchmarks slower than the baseline by more than the tolerance.
+    """
+    previous = {(r['generator'], r['vertices'], r['benchmark']): r for r in baseline['results']}
+    regressions = 0
+    for result in results:
+        old = previous.get((result['generator'], result['vertices'], result['benchmark']))
+        if old is None:
+            continue
+        ratio = result['seconds'] / old['seconds'] if old['seconds'] > 0 else 1.0
+        regressed = ratio > 1 + tolerance
+        regressions += regressed
+        print("{:12} V={:<8} {:21} {:6.2f}x time {:6.2f}x memory{}".format(
+            result['generator'], result['vertices'], result['benchmark'], ratio,
+            result['peak_bytes'] / old['peak_bytes'] if old['peak_bytes'] else 1.0,
+            "  REGRESSION" if regressed else ""))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--generators', nargs='+', choices=sorted(GENERATORS), default=list(GENERATORS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output')
+    parser.add_argument('--baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run(args.generators, args.scales, args.repeat)
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'seed': SEED,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(str(regressions) + " benchmark(s) slower than the baseline by more than "
+                  + str(int(args.tolerance * 100)) + "%")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
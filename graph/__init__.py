@@ -2,7 +2,21 @@
 Undirected graph data type and procedures for its manipulation.
 """
 
-from graph.graph import Graph, DepthFirstSearch, BreadthFirstSearch, ConnectedComponents
+from graph.graph import Graph, DepthFirstSearch, BreadthFirstSearch, ConnectedComponents, CycleDetector
+from graph.csr import CSRGraph
+from graph.unionfind import UnionFind
+from graph.multisource import MultiSourceBreadthFirstSearch
+from graph.shortestpath import PointToPointSearch
+from graph.directed import StronglyConnectedComponents
+from graph.dag import TopologicalSort
+from graph.cache import SearchCache
+from graph.oracle import LandmarkIndex
+from graph.weighted import WeightedGraph, DijkstraSearch, AStarSearch
+from graph.stats import TraversalStats
+from graph.symbol import SymbolGraph
 
-__all__ = ['Graph', 'DepthFirstSearch', 'BreadthFirstSearch', 'ConnectedComponents']
+__all__ = ['Graph', 'CSRGraph', 'DepthFirstSearch', 'BreadthFirstSearch', 'ConnectedComponents', 'CycleDetector',
+           'UnionFind', 'MultiSourceBreadthFirstSearch', 'PointToPointSearch', 'StronglyConnectedComponents',
+           'TopologicalSort', 'SearchCache', 'LandmarkIndex', 'WeightedGraph', 'DijkstraSearch', 'AStarSearch',
+           'TraversalStats', 'SymbolGraph']
 
@@ -0,0 +1,212 @@
+"""
+Optional NumPy accelerated traversals over the CSR representation of a graph.
+
+When NumPy is not installed HAVE_NUMPY is False and the factory functions breadth_first_search()
+and connected_components() fall back to the pure Python BreadthFirstSearch and ConnectedComponents.
+"""
+
+import sys
+
+from graph.csr import CSRGraph
+from graph.graph import BreadthFirstSearch, ConnectedComponents
+
+try:
+    import numpy
+except ImportError:     # pragma: no cover - depends on the environment
+    numpy = None
+
+HAVE_NUMPY = numpy is not None
+
+
+def breadth_first_search(graph, source_vertex: int):
+    """Navigate the given Graph from the given source vertex with the fastest available Breadth First Search.
+
+    :param graph: the graph we want to navigate.
+    :param source_vertex: the vertex where we start the navigation.
+    :return: a VectorizedBreadthFirstSearch if NumPy is installed, a BreadthFirstSearch otherwise.
+    """
+    if HAVE_NUMPY:
+        return VectorizedBreadthFirstSearch(graph, source_vertex)
+    return BreadthFirstSearch(graph, source_vertex)
+
+
+def connected_components(graph):
+    """Determines the connected components in an undirected graph with the fastest available procedure.
+
+    :param graph: The Graph to analyze
+    :return: a VectorizedConnectedComponents if NumPy is installed, a ConnectedComponents otherwise.
+    """
+    if HAVE_NUMPY:
+        return VectorizedConnectedComponents(graph)
+    return ConnectedComponents(graph)
+
+
+def _csr_arrays(graph):
+    """:return: the offsets and the neighbours of the CSR representation of the graph, as NumPy arrays."""
+    if not HAVE_NUMPY:
+        raise ImportError("NumPy is required for the vectorized traversals.")
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    offsets = numpy.asarray(csr._offsets, dtype=numpy.int64)
+    neighbours = numpy.asarray(csr._neighbours, dtype=numpy.int64)
+    return offsets, neighbours
+
+
+def _expand(offsets, neighbours, frontier):
+    """Gathers the adjacents of all the vertexes of the frontier at once.
+
+    :return: two arrays with the adjacents and the frontier vertex they are adjacent to, in frontier order.
+    """
+    starts = offsets[frontier]
+    lengths = offsets[frontier + 1] - starts
+    first = numpy.cumsum(lengths) - lengths
+    positions = numpy.arange(lengths.sum()) + numpy.repeat(starts - first, lengths)
+    return neighbours[positions], numpy.repeat(frontier, lengths)
+
+
+class VectorizedBreadthFirstSearch:
+    """
+    Finds the vertexes connected with the given source vertex and a the shortest path to reach each,
+    expanding every level of the search with vectorized NumPy operations.\n
+    The results are the same of BreadthFirstSearch, including the predecessor of every vertex.
+
+    **Implementation notes**:
+    For every level the adjacents of the whole frontier are gathered at once from the CSR arrays,
+    the visited ones are masked out and the remaining ones are deduplicated keeping the first occurrence,
+    so that the next frontier is in the same order of the queue of a serial search.
+    """
+
+    def __init__(self, graph, source_vertex: int):
+        """Navigate the given Graph from the given source vertex using Breadth First Search.
+
+        :param graph: the graph we want to navigate.
+        :param source_vertex: the vertex where we start the navigation.
+        :return: a VectorizedBreadthFirstSearch object to query the graph starting from the given source vertex.
+        """
+        offsets, neighbours = _csr_arrays(graph)
+        numvertices = len(offsets) - 1
+        self._source = source_vertex
+        self._distance = numpy.full(numvertices, -1, dtype=numpy.int64)
+        self._predecessor = numpy.full(numvertices, -1, dtype=numpy.int64)
+
+        self._distance[source_vertex] = 0
+        self._predecessor[source_vertex] = source_vertex
+        frontier = numpy.array([source_vertex], dtype=numpy.int64)
+        count = 0
+        level = 0
+        while len(frontier) > 0:
+            count += len(frontier)
+            level += 1
+            targets, parents = _expand(offsets, neighbours, frontier)
+            unvisited = self._distance[targets] == -1
+            targets = targets[unvisited]
+            parents = parents[unvisited]
+            _, first = numpy.unique(targets, return_index=True)
+            first.sort()
+            frontier = targets[first]
+            self._distance[frontier] = level
+            self._predecessor[frontier] = parents[first]
+        self._count = count
+
+    def connected(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
+        :return: True if the given vertex is connected to the source, False otherwise.
+        """
+        return bool(self._distance[vertex] != -1)
+
+    def count(self) -> int:
+        """:return: How many vertexes are connected with the source, including the source in the count."""
+        return self._count
+
+    def path_to(self, vertex: int):
+        """Find a path from the given vertex to the source.
+
+        :param vertex: the vertex to find a path to the source
+        :return: a list with the vertexes to navigate to get to the source if it is connected or None otherwise
+        """
+        path = None
+        if self.connected(vertex):
+            path = []
+            while vertex != self._source:
+                path.append(vertex)
+                vertex = int(self._predecessor[vertex])
+            path.append(self._source)
+
+        return path
+
+    def distance(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
+        :return: the distance between the given vertex and the source.
+        """
+        d = int(self._distance[vertex])
+        return d if d != -1 else sys.maxsize
+
+
+class VectorizedConnectedComponents:
+    """
+    Determines the connected components in an undirected graph with vectorized NumPy operations.\n
+    The results are the same of ConnectedComponents: every component is identified by its smallest vertex.
+
+    **Implementation notes**:
+    Every vertex starts as the label of itself; then, until nothing changes, every vertex (and the vertex it points to)
+    takes the smallest label among its adjacents and labels are shortcut pointing each to the label of its label.
+    Labels only decrease and always belong to the same component, so they end up all equal to its smallest vertex.
+    """
+
+    def __init__(self, graph):
+        """ Analyzes the given graph and store the results to be ready to answer for queries on connected components.
+
+        :param graph: The Graph to analyze
+        """
+        offsets, neighbours = _csr_arrays(graph)
+        numvertices = len(offsets) - 1
+        sources = numpy.repeat(numpy.arange(numvertices, dtype=numpy.int64), numpy.diff(offsets))
+
+        label = numpy.arange(numvertices, dtype=numpy.int64)
+        while True:
+            previous = label.copy()
+            numpy.minimum.at(label, label[sources], label[neighbours])
+            numpy.minimum.at(label, sources, label[neighbours])
+            while True:
+                shortcut = label[label]
+                if numpy.array_equal(shortcut, label):
+                    break
+                label = shortcut
+            if numpy.array_equal(previous, label):
+                break
+
+        self._group = label
+        self._size = numpy.bincount(label, minlength=numvertices)
+        self._count = int(numpy.count_nonzero(self._size))
+
+    def count(self):
+        """:return: The number of different connected components. """
+        return self._count
+
+    def connected(self, v: int, w: int) -> bool:
+        """ :return: True if the two vertexes are connected, False otherwise."""
+        return bool(self._group[v] == self._group[w])
+
+    def group(self, vertex: int) -> int:
+        """:return: The id of the connected component the given vertex is part of."""
+        return int(self._group[vertex])
+
+    def groupsize(self, vertex: int) -> int:
+        """:return: The size of the connected component the given vertex is part of."""
+        return int(self._size[self._group[vertex]])
+
+    def groups(self) -> list:
+        """:return: A list with the id of the connected component of every vertex."""
+        return self._group.tolist()
+
+    def group_sizes(self) -> dict:
+        """:return: A dictionary with the size of every connected component, by component id."""
+        ids = numpy.flatnonzero(self._size)
+        return dict(zip(ids.tolist(), self._size[ids].tolist()))
+
+    def members(self, group: int) -> list:
+        """:return: A list with all the vertexes of the connected component with the given id."""
+        if group < 0 or group >= len(self._group) or self._group[group] != group:
+            raise ValueError("There is no connected component with id " + str(group))
+        return numpy.flatnonzero(self._group == group).tolist()
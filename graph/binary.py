@@ -0,0 +1,140 @@
+"""
+Versioned binary file formats, made of a fixed header and typed sections that can be memory mapped.
+"""
+
+from array import array
+from mmap import mmap as memory_map, ACCESS_READ
+import struct
+import sys
+
+
+# Header flag of the files written on big endian machines; the other bits are free for every format.
+FLAG_BIG_ENDIAN = 2
+
+
+class BinaryFormat:
+    """
+    A versioned binary file format: a fixed little endian header followed by sections of typed values,
+    one after the other, written in the byte order of the machine saving them.\n
+    The header holds the magic string of the format, its version, the flags (with the byte order),
+    the fields specific to the format and the item size of every typecode of the sections.
+
+    **Implementation notes**:
+    Loading with a memory map gives memoryviews over the mapped file, so the sections are not copied
+    and processes loading the same file share a single copy of it in the OS page cache;
+    files written with the other byte order are read in private arrays and swapped.
+    """
+
+    def __init__(self, magic: bytes, version: int, fields: str, typecodes: str, name: str):
+        """Defines a format.
+
+        :param magic: the 8 bytes starting every file of this format.
+        :param version: the version of the format, written in the files and checked when reading them.
+        :param fields: the struct codes of the header fields specific to the format, e.g. 'qq' for two counts.
+        :param typecodes: the typecodes of the values stored in the sections, whose item sizes are checked when reading.
+        :param name: the name of the format, for the error messages.
+        """
+        self._header = struct.Struct('<8sII' + fields + 'I' * len(typecodes))
+        self._magic = magic
+        self._version = version
+        self._numfields = len(fields)
+        self._itemsizes = tuple(array(typecode).itemsize for typecode in typecodes)
+        self._name = name
+
+    def save(self, path: str, flags: int, fields, sections):
+        """Writes a file of this format.
+
+        :param path: the name of the file to write.
+        :param flags: the flags specific to the format; the byte order flag is added here.
+        :param fields: the values of the header fields specific to the format.
+        :param sections: the typed buffers to write after the header, in order.
+        :return: None
+        """
+        if sys.byteorder == 'big':
+            flags |= FLAG_BIG_ENDIAN
+        with open(path, 'wb') as fh:
+            fh.write(self._header.pack(self._magic, self._version, flags, *fields, *self._itemsizes))
+            for section in sections:
+                fh.write(section)
+
+    def open(self, path: str, mmap=True):
+        """Opens a file of this format, checking its header; use the result in a with statement.
+
+        :param path: the name of the file to read.
+        :param mmap: True to map the file in memory, False to read it in private arrays.
+        :return: a reader of the sections of the file
+        :rtype: BinaryReader
+        """
+        return BinaryReader(self, path, mmap)
+
+    def _read_header(self, fh, path: str):
+        """:return: the flags and the fields specific to the format read from the header of the given file."""
+        header = fh.read(self._header.size)
+        if len(header) < self._header.size:
+            raise ValueError("File " + path + " is not a " + self._name + " file.")
+        values = self._header.unpack(header)
+        if values[0] != self._magic:
+            raise ValueError("File " + path + " is not a " + self._name + " file.")
+        if values[1] != self._version:
+            raise ValueError("Unsupported " + self._name + " version " + str(values[1]) + " in file " + path)
+        if values[3 + self._numfields:] != self._itemsizes:
+            raise ValueError("Unsupported item sizes in " + self._name + " file " + path)
+        return values[2], values[3:3 + self._numfields]
+
+
+class BinaryReader:
+    """
+    Reads the header and then, one after the other, the sections of a file of a BinaryFormat.\n
+    After reading, mapped is the memory map backing the sections, or None if they were read in arrays;
+    pass it to release() with the sections when they are not needed anymore.
+    """
+
+    def __init__(self, binary_format: BinaryFormat, path: str, mmap=True):
+        self._fh = open(path, 'rb')
+        try:
+            self.flags, self.fields = binary_format._read_header(self._fh, path)
+        except BaseException:
+            self._fh.close()
+            raise
+        self._native = bool(self.flags & FLAG_BIG_ENDIAN) == (sys.byteorder == 'big')
+        self._position = self._fh.tell()
+        self._buffer = None
+        self.mapped = None
+        if mmap and self._native:
+            self.mapped = memory_map(self._fh.fileno(), 0, access=ACCESS_READ)
+            self._buffer = memoryview(self.mapped)
+
+    def section(self, typecode: str, count: int):
+        """:return: a typed buffer with the next count values of the file."""
+        if self._buffer is not None:
+            start = self._position
+            self._position += count * array(typecode).itemsize
+            return self._buffer[start:self._position].cast(typecode)
+        values = array(typecode)
+        values.fromfile(self._fh, count)
+        if not self._native:
+            values.byteswap()
+        return values
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+        self._fh.close()
+        return False
+
+
+def release(mapped, sections):
+    """Releases the given sections read from a memory mapped file, then the memory map itself.
+
+    :param mapped: the memory map of a BinaryReader, None if the sections were read in arrays.
+    :param sections: the sections read from the file.
+    :return: None
+    """
+    if mapped is not None:
+        for section in sections:
+            section.release()
+        mapped.close()
@@ -0,0 +1,174 @@
+"""
+Cache of breadth first searches, to answer repeated queries from the same sources without navigating the graph again.
+"""
+
+from array import array
+from collections import OrderedDict
+import sys
+
+from graph.loader import VERTEX_TYPECODE
+
+
+# The default memory budget of a SearchCache, in bytes.
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+
+class SearchCache:
+    """
+    Answers path_to and distance queries from any source, as BreadthFirstSearch would,
+    keeping the searches from the most recently used sources within a memory budget.\n
+    The first query from a source runs a full search (a miss), later ones only walk the stored arrays (hits),
+    so that a path costs its length. The counts of hits, misses and evictions are available as attributes.
+
+    **Implementation notes**:
+    Every search is stored as two arrays of V machine integers, the distance and the predecessor of every vertex,
+    in a dictionary ordered by last use: when the budget is exceeded the least recently used searches are evicted.
+    The cache attaches itself to the graph, if it can be changed, to drop the searches made stale by a change:
+    a new edge only matters to the searches where it makes a vertex nearer to the source,
+    a removed edge only to the searches whose tree of shortest paths goes through it.
+    """
+
+    def __init__(self, graph, budget: int = DEFAULT_BUDGET):
+        """Creates an empty cache of searches on the given graph.
+
+        :param graph: the graph we want to navigate.
+        :param budget: the maximum number of bytes taken by the stored searches.
+        :return: a SearchCache to query the graph from any source.
+        """
+        self._graph = graph
+        self._budget = budget
+        self._used = 0
+        self._searches = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if hasattr(graph, 'attach'):
+            graph.attach(self)
+
+    def close(self):
+        """Detaches the cache from the graph and drops all the stored searches."""
+        if hasattr(self._graph, 'detach'):
+            self._graph.detach(self)
+        self.invalidate()
+
+    def _search(self, source: int):
+        """:return: the (distance, predecessor) arrays of the search from the given source, running it if needed."""
+        search = self._searches.get(source)
+        if search is not None:
+            self.hits += 1
+            self._searches.move_to_end(source)
+            return search
+
+        self.misses += 1
+        numvertices = self._graph.num_vertices()
+        adjacents = self._graph.adjacents
+        distance = array(VERTEX_TYPECODE, [-1]) * numvertices
+        predecessor = array(VERTEX_TYPECODE, [-1]) * numvertices
+        distance[source] = 0
+        predecessor[source] = source
+        queue = [source]
+        i = 0
+        while i < len(queue):
+            v = queue[i]
+            d = distance[v] + 1
+            for w in adjacents(v):
+                if distance[w] == -1:
+                    distance[w] = d
+                    predecessor[w] = v
+                    queue.append(w)
+            i += 1
+
+        search = (distance, predecessor)
+        size = self._sizeof(search)
+        if size <= self._budget:
+            self._searches[source] = search
+            self._used += size
+            self._evict()
+        return search
+
+    @staticmethod
+    def _sizeof(search) -> int:
+        return sum(len(values) * values.itemsize for values in search)
+
+    def _evict(self):
+        while self._used > self._budget:
+            _, search = self._searches.popitem(last=False)
+            self._used -= self._sizeof(search)
+            self.evictions += 1
+
+    def _drop(self, stale):
+        for source in stale:
+            self._used -= self._sizeof(self._searches.pop(source))
+
+    def invalidate(self):
+        """Drops all the stored searches."""
+        self._searches.clear()
+        self._used = 0
+
+    def edge_added(self, vertex1: int, vertex2: int):
+        """Called by the graph this cache is attached to when an edge is added."""
+        directed = self._graph.is_directed()
+        stale = []
+        for source, (distance, _) in self._searches.items():
+            d1 = distance[vertex1]
+            d2 = distance[vertex2]
+            if d1 != -1 and (d2 == -1 or d2 > d1 + 1):
+                stale.append(source)
+            elif not directed and d2 != -1 and (d1 == -1 or d1 > d2 + 1):
+                stale.append(source)
+        self._drop(stale)
+
+    def edge_removed(self, vertex1: int, vertex2: int):
+        """Called by the graph this cache is attached to when an edge is removed."""
+        directed = self._graph.is_directed()
+        stale = []
+        for source, (_, predecessor) in self._searches.items():
+            if predecessor[vertex2] == vertex1 or (not directed and predecessor[vertex1] == vertex2):
+                stale.append(source)
+        self._drop(stale)
+
+    def vertices_added(self, count: int):
+        """Called by the graph this cache is attached to when vertices are added."""
+        for search in self._searches.values():
+            for values in search:
+                values.extend(array(VERTEX_TYPECODE, [-1]) * count)
+                self._used += count * values.itemsize
+        self._evict()
+
+    def cached(self, source: int) -> bool:
+        """:return: True if the search from the given source is stored, so that queries from it are hits."""
+        return source in self._searches
+
+    def memory(self) -> int:
+        """:return: the number of bytes taken by the stored searches."""
+        return self._used
+
+    def connected(self, source: int, vertex: int) -> bool:
+        """:return: True if the given vertex is connected to the given source, False otherwise."""
+        return self._search(source)[0][vertex] != -1
+
+    def path_to(self, source: int, vertex: int):
+        """Find a shortest path from the given vertex to the given source.
+
+        :param source: the vertex where the navigation starts.
+        :param vertex: the vertex to find a path to the source
+        :return: a list with the vertexes to navigate to get to the source if it is connected or None otherwise
+        """
+        _, predecessor = self._search(source)
+        path = None
+        if predecessor[vertex] != -1:
+            path = [vertex]
+            while vertex != source:
+                vertex = predecessor[vertex]
+                path.append(vertex)
+
+        return path
+
+    def distance(self, source: int, vertex: int):
+        """
+        :param source: the vertex where the navigation starts.
+        :param vertex: the vertex we want to know the distance from the source.
+        :return: the distance between the given vertex and the source, sys.maxsize if it is not connected.
+        """
+        d = self._search(source)[0][vertex]
+        return d if d != -1 else sys.maxsize
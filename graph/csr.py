@@ -0,0 +1,229 @@
+"""
+Compact, read-only graph representation in compressed sparse row (CSR) layout.
+"""
+
+from array import array
+from itertools import accumulate
+
+from graph.binary import BinaryFormat, release
+from graph.loader import VERTEX_TYPECODE, read_edge_list
+
+
+# Typecode of the offsets backing a CSRGraph: they can grow up to 2E so they get 64 bits.
+OFFSET_TYPECODE = 'q'
+
+# Binary format: a header with the number of vertexes and edges followed by the offsets and then the neighbours.
+BINARY_MAGIC = b'CSRGRAPH'
+BINARY_VERSION = 1
+_FORMAT = BinaryFormat(BINARY_MAGIC, BINARY_VERSION, 'qq', OFFSET_TYPECODE + VERTEX_TYPECODE, "binary graph")
+_FLAG_DIRECTED = 1
+
+
+class CSRGraph:
+    """
+    Frozen, memory efficient version of a Graph, meant for read-mostly graphs.\n
+    It exposes the same query API of Graph (adjacents(), num_vertices(), num_edges(), is_directed())
+    so that all the search procedures work on it unchanged, but edges can not be added anymore.
+
+    **Implementation notes**:
+    The adjacency lists of all the vertexes are stored one after the other in a single typed buffer of neighbours;
+    a second typed buffer of V+1 offsets tells where the adjacents of every vertex start and end:
+    the adjacents of vertex v are neighbours[offsets[v]:offsets[v+1]].
+    Compared to a list of Python lists of boxed ints this takes a small fraction of the memory
+    and keeps the adjacents of a vertex contiguous in memory.
+    """
+
+    def __init__(self, offsets, neighbours, numedges: int, directed=False):
+        """Creates a graph on top of already built CSR buffers.
+
+        Usually you do not call this directly, but get a CSRGraph from Graph.freeze().
+
+        :param offsets: a typed buffer (array or memoryview) with the V+1 offsets into neighbours.
+        :param neighbours: a typed buffer (array or memoryview) with the adjacents of all the vertexes.
+        :param numedges: the number of edges of the graph.
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :return: a graph reading its structure from the given buffers
+        :rtype: CSRGraph
+        """
+        if len(offsets) < 1 or offsets[-1] != len(neighbours):
+            raise ValueError("Offsets do not match the number of neighbours.")
+        self._numvertices = len(offsets) - 1
+        self._numedges = numedges
+        self._directed = directed
+        self._offsets = offsets
+        self._neighbours = neighbours
+        self._mmap = None
+        self._reverse = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Builds the CSR representation of the given graph.
+
+        The order of the adjacents of every vertex is preserved, so searches give the same results on both.
+
+        :param graph: the graph to convert.
+        :return: a frozen copy of the given graph
+        :rtype: CSRGraph
+        """
+        numvertices = graph.num_vertices()
+        offsets = array(OFFSET_TYPECODE, [0]) * (numvertices + 1)
+        neighbours = array(VERTEX_TYPECODE)
+        for v in range(numvertices):
+            neighbours.extend(graph.adjacents(v))
+            offsets[v + 1] = len(neighbours)
+
+        return cls(offsets, neighbours, graph.num_edges(), graph.is_directed())
+
+    @classmethod
+    def from_file(cls, filename: str, directed=False):
+        """Loads a graph definition from a file straight into the CSR representation.
+
+        The file format is the same read by Graph.from_file.
+        The edges are parsed in bulk and the graph is built in two passes, first counting the degree of every vertex,
+        then filling the neighbours in place in typed buffers, so no list of boxed ints is ever allocated.
+
+        :param filename: the name of the file containing the graph definition.
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :return: a graph built from the information stored in the file
+        :rtype: CSRGraph
+        """
+        numvertices, _, endpoints = read_edge_list(filename)
+        return cls.from_endpoints(numvertices, endpoints, directed)
+
+    @classmethod
+    def from_endpoints(cls, numvertices: int, endpoints, directed=False):
+        """Builds a graph from a flat sequence of edges, two vertexes per edge.
+
+        The adjacents of every vertex are in the same order they would be if the edges were added to a Graph one by one.
+
+        :param numvertices: the number of vertices of the graph.
+        :param endpoints: the two vertexes of every edge, one edge after the other.
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :return: a graph with the given edges
+        :rtype: CSRGraph
+        """
+        sources = endpoints[0::2]
+        targets = endpoints[1::2]
+
+        # First pass: count the degree of every vertex and turn the degrees in offsets.
+        degree = array(OFFSET_TYPECODE, [0]) * (numvertices + 1)
+        for v in (sources if directed else endpoints):
+            degree[v + 1] += 1
+        offsets = array(OFFSET_TYPECODE, accumulate(degree))
+
+        # Second pass: put every neighbour in the next free slot of its vertex, straight into typed buffers.
+        position = offsets[:-1]
+        neighbours = array(VERTEX_TYPECODE, [0]) * offsets[-1]
+        if directed:
+            for v, w in zip(sources, targets):
+                neighbours[position[v]] = w
+                position[v] += 1
+        else:
+            for v, w in zip(sources, targets):
+                neighbours[position[v]] = w
+                position[v] += 1
+                neighbours[position[w]] = v
+                position[w] += 1
+
+        return cls(offsets, neighbours, len(targets), directed)
+
+    @classmethod
+    def load_binary(cls, path: str, mmap=True):
+        """Loads a graph saved with save_binary.
+
+        When memory mapping, the adjacents are read straight from the mapped file without copying it,
+        so that processes loading the same file share a single copy of it in the OS page cache.
+
+        :param path: the name of the file containing the graph.
+        :param mmap: True to map the file in memory, False to read it in private arrays.
+        :return: the graph stored in the file
+        :rtype: CSRGraph
+        """
+        with _FORMAT.open(path, mmap) as reader:
+            numvertices, numedges = reader.fields
+            offsets = reader.section(OFFSET_TYPECODE, numvertices + 1)
+            neighbours = reader.section(VERTEX_TYPECODE, offsets[-1])
+
+        graph = cls(offsets, neighbours, numedges, bool(reader.flags & _FLAG_DIRECTED))
+        graph._mmap = reader.mapped
+        return graph
+
+    def save_binary(self, path: str):
+        """Saves this graph in a versioned binary file, to be loaded back quickly with load_binary.
+
+        :param path: the name of the file to write.
+        :return: None
+        """
+        _FORMAT.save(path, _FLAG_DIRECTED if self._directed else 0, (self._numvertices, self._numedges),
+                     (_typed(self._offsets, OFFSET_TYPECODE), _typed(self._neighbours, VERTEX_TYPECODE)))
+
+    def close(self):
+        """Releases the memory mapped file backing this graph, if any.
+
+        The graph can not be used anymore after closing it,
+        and any sequence returned by adjacents() must have been discarded before.
+        """
+        release(self._mmap, (self._offsets, self._neighbours))
+        self._mmap = None
+
+    def is_directed(self):
+        """:return: True if the graph is a directed graph, False if is an undirected graph."""
+        return self._directed
+
+    def num_vertices(self) -> int:
+        """:return: the number of vertices of this Graph."""
+        return self._numvertices
+
+    def num_edges(self) -> int:
+        """:return: the number of edges of this Graph."""
+        return self._numedges
+
+    def adjacents(self, vertex):
+        """:return: a read only sequence with the vertexes adjacent to the given vertex."""
+        return self._neighbours[self._offsets[vertex]:self._offsets[vertex + 1]]
+
+    def degree(self, vertex) -> int:
+        """:return: the number of adjacents of the given vertex."""
+        return self._offsets[vertex + 1] - self._offsets[vertex]
+
+    def predecessors(self, vertex):
+        """
+        :return: the vertexes with an edge to the given vertex; for undirected graphs they are its adjacents.
+        """
+        if not self._directed:
+            return self.adjacents(vertex)
+        if self._reverse is None:
+            self._reverse = self.reverse()
+        return self._reverse.adjacents(vertex)
+
+    def in_degree(self, vertex) -> int:
+        """:return: the number of edges to the given vertex."""
+        return len(self.predecessors(vertex))
+
+    def reverse(self):
+        """Builds the reverse (or transpose) of this graph, where every edge has the opposite direction.
+
+        :return: a new graph with the same vertexes and all the edges reversed; for undirected graphs, itself.
+        :rtype: CSRGraph
+        """
+        if not self._directed:
+            return self
+        endpoints = array(VERTEX_TYPECODE)
+        for v in range(self._numvertices):
+            for w in self.adjacents(v):
+                endpoints.append(w)
+                endpoints.append(v)
+        return CSRGraph.from_endpoints(self._numvertices, endpoints, True)
+
+    def __str__(self):
+        lines = []
+        for v in range(self._numvertices):
+            lines.append(str(v) + " => " + str(list(self.adjacents(v))) + "\n")
+        return "".join(lines)
+
+
+def _typed(values, typecode):
+    """:return: the given values as a typed buffer with the given typecode, copying them only if needed."""
+    if getattr(values, 'typecode', None) == typecode or getattr(values, 'format', None) == typecode:
+        return values
+    return array(typecode, values)
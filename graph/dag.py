@@ -0,0 +1,187 @@
+"""
+Topological sort of directed graphs and single pass analytics of directed acyclic graphs (DAG).
+"""
+
+from array import array
+
+from graph.loader import VERTEX_TYPECODE
+
+
+class TopologicalSort:
+    """
+    Orders the vertexes of a directed graph so that every edge goes from a vertex to a later one.\n
+    Such an order exists if and only if the graph is a DAG: if it has a cycle, one of them is reported instead.
+    On a DAG, longest (critical) paths and reachability counts are computed with a single pass in topological order.
+
+    **Implementation notes**:
+    This is Kahn's algorithm: the vertexes with no incoming edges are taken one after the other,
+    removing their edges by decrementing the in-degree of their adjacents; it takes time proportional to V + E
+    and needs no recursion. When some vertexes are never freed, each of them has a predecessor among them,
+    so walking back from any of them along those predecessors eventually goes around a cycle.
+    """
+
+    def __init__(self, graph):
+        """ Sorts the given graph and store the results to be ready to answer for queries on its order.
+
+        :param graph: The directed Graph to sort
+        """
+        if not graph.is_directed():
+            raise ValueError("Topological sorts and critical paths are computed on directed graphs.")
+        self._graph = graph
+        numvertices = graph.num_vertices()
+        adjacents = graph.adjacents
+        indegree = array(VERTEX_TYPECODE, [0]) * numvertices
+        for v in range(numvertices):
+            for w in adjacents(v):
+                indegree[w] += 1
+
+        order = [v for v in range(numvertices) if indegree[v] == 0]
+        i = 0
+        while i < len(order):
+            for w in adjacents(order[i]):
+                indegree[w] -= 1
+                if indegree[w] == 0:
+                    order.append(w)
+            i += 1
+
+        self._rank = None
+        self._cycle = None
+        if len(order) == numvertices:
+            self._order = order
+        else:
+            self._order = None
+            self._cycle = self._find_cycle(indegree)
+
+    def _find_cycle(self, indegree):
+        """:return: a cycle among the vertexes left with a positive in-degree."""
+        numvertices = self._graph.num_vertices()
+        predecessor = array(VERTEX_TYPECODE, [-1]) * numvertices
+        start = -1
+        for v in range(numvertices):
+            if indegree[v] > 0:
+                start = v
+                for w in self._graph.adjacents(v):
+                    if indegree[w] > 0:
+                        predecessor[w] = v
+
+        seen = bytearray(numvertices)
+        vertex = start
+        while not seen[vertex]:
+            seen[vertex] = 1
+            vertex = predecessor[vertex]
+
+        cycle = [vertex]
+        w = predecessor[vertex]
+        while w != vertex:
+            cycle.append(w)
+            w = predecessor[w]
+        cycle.append(vertex)
+        cycle.reverse()
+        return cycle
+
+    def is_dag(self) -> bool:
+        """:return: True if the graph is a directed acyclic graph, False if it has a cycle."""
+        return self._order is not None
+
+    def order(self):
+        """:return: a list with the vertexes in topological order, None if the graph has a cycle."""
+        return list(self._order) if self._order is not None else None
+
+    def rank(self, vertex: int):
+        """:return: the position of the given vertex in the topological order, None if the graph has a cycle."""
+        if self._order is None:
+            return None
+        if self._rank is None:
+            self._rank = array(VERTEX_TYPECODE, [0]) * len(self._order)
+            for i, v in enumerate(self._order):
+                self._rank[v] = i
+        return self._rank[vertex]
+
+    def cycle(self):
+        """:return: a list with the vertexes of a directed cycle, starting and ending with the same vertex,
+            None if the graph is a DAG."""
+        return list(self._cycle) if self._cycle is not None else None
+
+    def _check_dag(self):
+        if self._order is None:
+            raise ValueError("The graph has a cycle: " + str(self._cycle))
+
+    def critical_path(self, durations=None):
+        """Finds the critical path of the DAG, i.e. the path with the largest total duration of its vertexes.
+
+        :param durations: a sequence with the duration of every vertex; by default every vertex lasts 1.
+        :return: a tuple with the total duration of the critical path and the list of its vertexes, in order.
+        """
+        self._check_dag()
+        if not self._order:
+            return 0, []
+        adjacents = self._graph.adjacents
+        start = [0] * len(self._order)
+        predecessor = array(VERTEX_TYPECODE, [-1]) * len(self._order)
+        last = None
+        longest = None
+        for v in self._order:
+            finish = start[v] + (durations[v] if durations is not None else 1)
+            if longest is None or finish > longest:
+                longest = finish
+                last = v
+            for w in adjacents(v):
+                if finish > start[w]:
+                    start[w] = finish
+                    predecessor[w] = v
+
+        path = [last]
+        while predecessor[path[-1]] != -1:
+            path.append(predecessor[path[-1]])
+        path.reverse()
+        return longest, path
+
+    def longest_path(self) -> list:
+        """:return: a list with the vertexes of a path of the DAG with the most edges, in order."""
+        return self.critical_path()[1]
+
+    def reachable_counts(self) -> list:
+        """Counts how many vertexes can be reached from every vertex of the DAG, itself excluded.
+
+        The reachable sets are kept as bitsets, processing the vertexes in reverse topological order;
+        the bitset of a vertex is dropped as soon as all its predecessors have used it.
+
+        :return: a list with the number of vertexes reachable from every vertex.
+        """
+        self._check_dag()
+        graph = self._graph
+        adjacents = graph.adjacents
+        pending = array(VERTEX_TYPECODE, [0]) * len(self._order)
+        for v in self._order:
+            for w in adjacents(v):
+                pending[w] += 1
+
+        # A vertex is bit number i of the bitsets if it is the i-th one processed, so that the vertexes reached
+        # from a vertex have nearby bits; every bitset is also shifted to start at its lowest bit,
+        # and holds the vertex it belongs to, added only when some predecessor will use the bitset.
+        counts = [0] * len(self._order)
+        reachable = {}
+        for i, v in enumerate(reversed(self._order)):
+            bits, low = 0, i
+            for w in adjacents(v):
+                other, start = reachable[w]
+                if start < low:
+                    bits <<= low - start
+                    low = start
+                bits |= other << (start - low)
+                pending[w] -= 1
+                if pending[w] == 0:
+                    del reachable[w]
+            counts[v] = _bit_count(bits)
+            if pending[v] > 0:
+                reachable[v] = (bits | (1 << (i - low)), low)
+        return counts
+
+
+def _bin_count(bits: int) -> int:
+    """:return: the number of bits set in the given integer."""
+    return bin(bits).count('1')
+
+
+# int.bit_count is available from Python 3.10; before, the bits are counted in the binary string.
+_bit_count = getattr(int, 'bit_count', _bin_count)
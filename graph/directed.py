@@ -0,0 +1,140 @@
+"""
+Connectivity of directed graphs: strongly connected components and the condensation of a graph.
+"""
+
+from array import array
+
+from graph.graph import Graph
+from graph.loader import VERTEX_TYPECODE
+
+
+class StronglyConnectedComponents:
+    """
+    Determines the strongly connected components in a directed graph,
+    i.e. the maximal sets of vertexes where every vertex can reach every other one.\n
+    Components are numbered from 0 to count()-1 in topological order of the condensation of the graph:
+    an edge between different components always goes from a smaller component id to a larger one.
+
+    **Implementation notes**:
+    This is Tarjan's algorithm, driven by explicit stacks instead of recursion,
+    so it runs in time proportional to V + E on graphs of any depth.
+    """
+
+    def __init__(self, graph):
+        """ Analyzes the given graph and store the results to be ready to answer for queries on its components.
+
+        :param graph: The Graph to analyze
+        """
+        self._graph = graph
+        numvertices = graph.num_vertices()
+        adjacents = graph.adjacents
+        index = array(VERTEX_TYPECODE, [-1]) * numvertices
+        low = array(VERTEX_TYPECODE, [0]) * numvertices
+        on_stack = bytearray(numvertices)
+        group = array(VERTEX_TYPECODE, [-1]) * numvertices
+        stack = []
+        counter = 0
+        count = 0
+
+        for source in range(numvertices):
+            if index[source] != -1:
+                continue
+            index[source] = low[source] = counter
+            counter += 1
+            stack.append(source)
+            on_stack[source] = 1
+            vertexes = []
+            iterators = []
+            v, remaining = source, iter(adjacents(source))
+            while True:
+                for w in remaining:
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        vertexes.append(v)
+                        iterators.append(remaining)
+                        v, remaining = w, iter(adjacents(w))
+                        break
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                else:
+                    if low[v] == index[v]:
+                        while True:
+                            w = stack.pop()
+                            on_stack[w] = 0
+                            group[w] = count
+                            if w == v:
+                                break
+                        count += 1
+                    if not vertexes:
+                        break
+                    u, remaining = vertexes.pop(), iterators.pop()
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                    v = u
+
+        # Tarjan finds the components in reverse topological order.
+        size = array(VERTEX_TYPECODE, [0]) * count
+        for v in range(numvertices):
+            group[v] = count - 1 - group[v]
+            size[group[v]] += 1
+
+        self._count = count
+        self._group = group
+        self._size = size
+        self._members = None
+
+    def count(self):
+        """:return: The number of different strongly connected components. """
+        return self._count
+
+    def connected(self, v: int, w: int) -> bool:
+        """ :return: True if the two vertexes are strongly connected, False otherwise."""
+        return self._group[v] == self._group[w]
+
+    def group(self, vertex: int) -> int:
+        """:return: The id of the strongly connected component the given vertex is part of."""
+        return self._group[vertex]
+
+    def groupsize(self, vertex: int) -> int:
+        """:return: The size of the strongly connected component the given vertex is part of."""
+        return self._size[self._group[vertex]]
+
+    def groups(self) -> list:
+        """:return: A list with the id of the strongly connected component of every vertex."""
+        return self._group.tolist()
+
+    def group_sizes(self) -> dict:
+        """:return: A dictionary with the size of every strongly connected component, by component id."""
+        return dict(enumerate(self._size))
+
+    def members(self, group: int) -> list:
+        """:return: A list with all the vertexes of the strongly connected component with the given id."""
+        if group < 0 or group >= self._count:
+            raise ValueError("There is no strongly connected component with id " + str(group))
+        if self._members is None:
+            self._members = [[] for _ in range(self._count)]
+            for v, g in enumerate(self._group):
+                self._members[g].append(v)
+        return list(self._members[group])
+
+    def condensation(self) -> Graph:
+        """Builds the condensation of the graph, that is always a directed acyclic graph.
+
+        :return: a simple directed Graph with a vertex per strongly connected component
+            and an edge between two components when an edge of the graph goes from one to the other.
+        :rtype: Graph
+        """
+        group = self._group
+        dag = Graph(self._count, directed=True, simple=True)
+        endpoints = array(VERTEX_TYPECODE)
+        for v in range(len(group)):
+            gv = group[v]
+            for w in self._graph.adjacents(v):
+                if group[w] != gv:
+                    endpoints.append(gv)
+                    endpoints.append(group[w])
+        dag.add_edges(endpoints)
+        return dag
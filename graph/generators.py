@@ -0,0 +1,116 @@
+"""
+Seeded generators of synthetic graphs, to test and benchmark the procedures on graphs of any size and shape.
+"""
+
+from array import array
+import random
+
+from graph.loader import VERTEX_TYPECODE
+
+
+def erdos_renyi(numvertices: int, numedges: int, seed=None):
+    """Generates a random graph where every edge connects two vertexes picked uniformly at random.
+
+    :param numvertices: the number of vertexes.
+    :param numedges: the number of edges; self loops and parallel edges are possible.
+    :param seed: the seed of the random generator, to get the same graph every time.
+    :return: a tuple (numvertices, endpoints) where endpoints is a typed array
+        with the two vertexes of every edge, one edge after the other.
+    """
+    rnd = random.Random(seed)
+    endpoints = array(VERTEX_TYPECODE, (rnd.randrange(numvertices) for _ in range(2 * numedges)))
+    return numvertices, endpoints
+
+
+def preferential_attachment(numvertices: int, edges_per_vertex: int = 3, seed=None):
+    """Generates a scale free graph, with a power law degree distribution, growing it by preferential attachment
+    (the Barabási–Albert model): every new vertex connects to edges_per_vertex different existing vertexes,
+    picked with a probability proportional to their degree.
+
+    :param numvertices: the number of vertexes.
+    :param edges_per_vertex: how many edges connect every new vertex to the existing ones.
+    :param seed: the seed of the random generator, to get the same graph every time.
+    :return: a tuple (numvertices, endpoints) where endpoints is a typed array
+        with the two vertexes of every edge, one edge after the other.
+    """
+    rnd = random.Random(seed)
+    endpoints = array(VERTEX_TYPECODE)
+    targets = list(range(edges_per_vertex))
+    repeated = []       # every vertex appears once per edge it has: sampling from it follows the degrees
+    for v in range(edges_per_vertex, numvertices):
+        for w in targets:
+            endpoints.append(v)
+            endpoints.append(w)
+        repeated.extend(targets)
+        repeated.extend([v] * edges_per_vertex)
+        chosen = set()
+        while len(chosen) < edges_per_vertex:
+            chosen.add(rnd.choice(repeated))
+        targets = list(chosen)
+    return numvertices, endpoints
+
+
+def grid(rows: int, columns: int):
+    """Generates a grid graph, where every vertex is connected to the ones on its right and below it.
+
+    :param rows: the number of rows of the grid.
+    :param columns: the number of columns of the grid.
+    :return: a tuple (numvertices, endpoints) where endpoints is a typed array
+        with the two vertexes of every edge, one edge after the other.
+    """
+    endpoints = array(VERTEX_TYPECODE)
+    for row in range(rows):
+        for column in range(columns):
+            v = row * columns + column
+            if column + 1 < columns:
+                endpoints.append(v)
+                endpoints.append(v + 1)
+            if row + 1 < rows:
+                endpoints.append(v)
+                endpoints.append(v + columns)
+    return rows * columns, endpoints
+
+
+def path(numvertices: int):
+    """Generates a single long path from vertex 0 to the last one, the worst case for the depth of a search.
+
+    :param numvertices: the number of vertexes.
+    :return: a tuple (numvertices, endpoints) where endpoints is a typed array
+        with the two vertexes of every edge, one edge after the other.
+    """
+    endpoints = array(VERTEX_TYPECODE, [0]) * (2 * max(numvertices - 1, 0))
+    endpoints[0::2] = array(VERTEX_TYPECODE, range(numvertices - 1))
+    endpoints[1::2] = array(VERTEX_TYPECODE, range(1, numvertices))
+    return numvertices, endpoints
+
+
+def components(numcomponents: int, size: int, seed=None):
+    """Generates many small connected components, each one a random tree.
+
+    :param numcomponents: the number of connected components.
+    :param size: the number of vertexes of every component.
+    :param seed: the seed of the random generator, to get the same graph every time.
+    :return: a tuple (numvertices, endpoints) where endpoints is a typed array
+        with the two vertexes of every edge, one edge after the other.
+    """
+    rnd = random.Random(seed)
+    endpoints = array(VERTEX_TYPECODE)
+    for first in range(0, numcomponents * size, size):
+        for v in range(first + 1, first + size):
+            endpoints.append(rnd.randrange(first, v))
+            endpoints.append(v)
+    return numcomponents * size, endpoints
+
+
+def write_edge_list(filename: str, numvertices: int, endpoints):
+    """Writes a graph in the text format read by Graph.from_file.
+
+    :param filename: the name of the file to write.
+    :param numvertices: the number of vertexes.
+    :param endpoints: a sequence with the two vertexes of every edge, one edge after the other.
+    :return: None
+    """
+    with open(filename, 'w') as fh:
+        fh.write(str(numvertices) + "\n" + str(len(endpoints) // 2) + "\n")
+        vertexes = iter(endpoints)
+        fh.writelines(str(v) + " " + str(w) + "\n" for v, w in zip(vertexes, vertexes))
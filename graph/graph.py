@@ -2,8 +2,15 @@
 Undirected graph data type and procedures for its manipulation.
 """
 
+from array import array
 from collections import deque
 import sys
+import time
+
+from graph.csr import CSRGraph
+from graph.loader import VERTEX_TYPECODE, read_edge_list
+from graph.stats import TraversalStats
+from graph.streaming import BATCH_SIZE, EdgeReader
 
 
 class Graph:
@@ -12,54 +19,82 @@ class Graph:
     Vertexes are named with consecutive numbers starting from 0
     (the last is V-1, being V the number of vertexes in the graph).
 
+    By default the graph is a multigraph, where the same edge can be added many times;
+    a simple graph keeps a single copy of every edge.
+
     **Implementation notes**:
     This implementation is based on an adjacency-list representation of the graph:
     for every vertex V we maintain a list of adjacent vertexes,
     i.e. vertexes reachable from V with a direct connection (an edge).
+    In a simple graph the list is replaced by a dictionary used as an insertion ordered set,
+    so checking, adding or removing an edge takes constant time.
+    For directed graphs the predecessors of every vertex are indexed the same way the first time they are asked for,
+    and the index is then kept up to date by every change to the graph.
     """
 
-    def __init__(self, numvertices, directed=False):
+    def __init__(self, numvertices, directed=False, simple=False):
         """Creates a graph with the given number of vertices and no edges.
 
         :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :param simple: True if the graph keeps a single copy of every edge; default is False, i.e. a multigraph.
         :return: an empty graph with a structure to hold edges for the given number of vertexes
         :rtype: Graph
         """
         self._numvertices = numvertices
         self._directed = directed
+        self._simple = simple
         self._numedges = 0
-        self._adjacents = [list() for _ in range(0, numvertices)]
+        self._adjacents = [dict() if simple else list() for _ in range(0, numvertices)]
+        self._reverse = None
+        self._listeners = []
 
     @classmethod
-    def from_file(cls, filename: str, directed = False):
+    def from_file(cls, filename: str, directed = False, simple=False):
         """Loads a graph definition from a file.
 
         First line must contain the number of vertexes;
         second line must contain the number of edges;
         from third line onward there must be two integers representing the two vertexes to be connected by and edge.
+        The file is parsed in large chunks and the edges are added in bulk (see read_edge_list).
 
         :param filename: the name of the file containing the graph definition.
         :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :param simple: True if the graph keeps a single copy of every edge; default is False, i.e. a multigraph.
         :return: a graph built from the information stored in the file
         :rtype: Graph
         """
-        with open(filename) as fh:
-            vertnum = int(fh.readline().strip())
-            int(fh.readline().strip())
-            graph = Graph(vertnum, directed)
+        numvertices, _, endpoints = read_edge_list(filename)
+        graph = Graph(numvertices, directed, simple)
+        graph._add_endpoints(endpoints)
 
-            for line in fh:
-                numstr = line.split()
-                v1 = int(numstr[0])
-                v2 = int(numstr[1])
-                graph.add_edge(v1, v2)
+        return graph
+
+    @classmethod
+    def from_stream(cls, source, directed=False, numvertices=0, grow=True, batch_size=BATCH_SIZE, simple=False):
+        """Loads a graph from a stream of edges, reading and adding them in batches of bounded size.
 
+        :param source: a file name (possibly compressed, "-" for the standard input), a file object
+            or an iterable of (vertex1, vertex2) pairs; see EdgeReader.
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :param numvertices: the initial number of vertices, raised by the header of the stream if it has one.
+        :param grow: True to add vertices when an edge refers to a vertex past the last one.
+        :param batch_size: the maximum number of edges read and added in one go.
+        :param simple: True if the graph keeps a single copy of every edge; default is False, i.e. a multigraph.
+        :return: a graph with the edges read from the stream
+        :rtype: Graph
+        """
+        graph = Graph(numvertices, directed, simple)
+        graph.add_stream(source, grow, batch_size)
         return graph
 
     def is_directed(self):
         """:return: True if the graph is a directed graph, False if is an undirected graph."""
         return self._directed
 
+    def is_simple(self):
+        """:return: True if the graph keeps a single copy of every edge, False if it is a multigraph."""
+        return self._simple
+
     def num_vertices(self) -> int:
         """:return: the number of vertices of this Graph."""
         return self._numvertices
@@ -71,25 +106,249 @@ class Graph:
     def add_edge(self, vertex1, vertex2):
         """
         Add and edge connecting vertex1 to vertex2.
-        An edge is not added if it is already present.
+        In a simple graph an edge is not added if it is already present.
 
         :param vertex1: the first vertex of the edge being added.
         :param vertex2: the second vertex of the edge being added.
         :return: None
         """
+        if self._simple:
+            if vertex2 in self._adjacents[vertex1]:
+                return
+            self._adjacents[vertex1][vertex2] = None
+            if not self._directed:
+                self._adjacents[vertex2][vertex1] = None
+        else:
+            self._adjacents[vertex1].append(vertex2)
+            if not self._directed:
+                self._adjacents[vertex2].append(vertex1)
+        if self._reverse is not None:
+            self._add_predecessor(vertex2, vertex1)
         self._numedges += 1
-        self._adjacents[vertex1].append(vertex2)
-        if not self._directed:
-            self._adjacents[vertex2].append(vertex1)
+        for listener in self._listeners:
+            listener.edge_added(vertex1, vertex2)
+
+    def has_edge(self, vertex1, vertex2) -> bool:
+        """
+        :return: True if there is an edge connecting vertex1 to vertex2;
+            it takes constant time in a simple graph, time proportional to the degree of vertex1 in a multigraph.
+        """
+        return vertex2 in self._adjacents[vertex1]
+
+    def remove_edge(self, vertex1, vertex2):
+        """
+        Remove an edge connecting vertex1 to vertex2; in a multigraph only one of the copies of the edge is removed.
+
+        :param vertex1: the first vertex of the edge being removed.
+        :param vertex2: the second vertex of the edge being removed.
+        :return: None
+        """
+        if not self.has_edge(vertex1, vertex2):
+            raise ValueError("There is no edge from " + str(vertex1) + " to " + str(vertex2))
+        if self._simple:
+            del self._adjacents[vertex1][vertex2]
+            if not self._directed and vertex1 != vertex2:
+                del self._adjacents[vertex2][vertex1]
+        else:
+            self._adjacents[vertex1].remove(vertex2)
+            if not self._directed:
+                self._adjacents[vertex2].remove(vertex1)
+        if self._reverse is not None:
+            if self._simple:
+                del self._reverse[vertex2][vertex1]
+            else:
+                self._reverse[vertex2].remove(vertex1)
+        self._numedges -= 1
+        for listener in self._listeners:
+            listener.edge_removed(vertex1, vertex2)
+
+    def add_edges(self, edges, grow=False):
+        """
+        Add in bulk many edges, notifying the listeners as add_edge would do for each.
+
+        :param edges: an iterable of (vertex1, vertex2) pairs,
+            or an array with the two vertexes of every edge, one edge after the other.
+        :param grow: True to add vertices when an edge refers to a vertex past the last one,
+            False to raise an IndexError leaving the graph unchanged.
+        :return: None
+        """
+        if isinstance(edges, array):
+            endpoints = edges
+        else:
+            endpoints = array(VERTEX_TYPECODE)
+            for v, w in edges:
+                endpoints.append(v)
+                endpoints.append(w)
+        if not endpoints:
+            return
+
+        if min(endpoints) < 0:
+            raise IndexError("Vertexes can not be negative.")
+        last = max(endpoints)
+        if last >= self._numvertices:
+            if not grow:
+                raise IndexError("Vertex " + str(last) + " is not in the graph.")
+            self.add_vertices(last + 1 - self._numvertices)
+        self._add_endpoints(endpoints)
+
+    def add_stream(self, source, grow=True, batch_size=BATCH_SIZE):
+        """
+        Add all the edges read from a stream, in batches of bounded size.
+
+        :param source: a file name (possibly compressed, "-" for the standard input), a file object
+            or an iterable of (vertex1, vertex2) pairs; see EdgeReader.
+        :param grow: True to add vertices when an edge refers to a vertex past the last one.
+        :param batch_size: the maximum number of edges read and added in one go.
+        :return: None
+        """
+        reader = EdgeReader(source, batch_size)
+        for batch in reader:
+            self._grow_to(reader.numvertices)
+            self.add_edges(batch, grow)
+        self._grow_to(reader.numvertices)
+
+    def _grow_to(self, numvertices):
+        if numvertices is not None and numvertices > self._numvertices:
+            self.add_vertices(numvertices - self._numvertices)
+
+    def add_vertices(self, count: int):
+        """
+        Add new vertices, with no edges, after the last one.
+
+        :param count: how many vertices to add.
+        :return: None
+        """
+        self._adjacents.extend(dict() if self._simple else list() for _ in range(count))
+        if self._reverse is not None:
+            self._reverse.extend(dict() if self._simple else list() for _ in range(count))
+        self._numvertices += count
+        for listener in self._listeners:
+            listener.vertices_added(count)
+
+    def _add_endpoints(self, endpoints):
+        """Adds in bulk the edges listed in endpoints, two vertexes per edge, without a call to add_edge per edge."""
+        adjacents = self._adjacents
+        vertexes = iter(endpoints)
+        if self._simple:
+            added = array(VERTEX_TYPECODE)
+            for v, w in zip(vertexes, vertexes):
+                if w not in adjacents[v]:
+                    adjacents[v][w] = None
+                    if not self._directed:
+                        adjacents[w][v] = None
+                    added.append(v)
+                    added.append(w)
+            endpoints = added
+        elif self._directed:
+            for v, w in zip(vertexes, vertexes):
+                adjacents[v].append(w)
+        else:
+            for v, w in zip(vertexes, vertexes):
+                adjacents[v].append(w)
+                adjacents[w].append(v)
+        self._numedges += len(endpoints) // 2
+        if self._reverse is not None:
+            vertexes = iter(endpoints)
+            for v, w in zip(vertexes, vertexes):
+                self._add_predecessor(w, v)
+        if self._listeners:
+            vertexes = iter(endpoints)
+            for v, w in zip(vertexes, vertexes):
+                for listener in self._listeners:
+                    listener.edge_added(v, w)
+
+    def attach(self, listener):
+        """Attaches a listener that is notified of every change to this graph,
+        to keep up to date a structure derived from the graph.
+
+        :param listener: an object with an edge_added(vertex1, vertex2) method, called after an edge is added,
+            an edge_removed(vertex1, vertex2) method, called after an edge is removed,
+            and a vertices_added(count) method, called after vertices are added.
+        :return: None
+        """
+        self._listeners.append(listener)
+
+    def detach(self, listener):
+        """Detaches a listener previously attached with attach.
+
+        :param listener: the listener to remove.
+        :return: None
+        """
+        self._listeners.remove(listener)
 
     def adjacents(self, vertex):
         return self._adjacents[vertex]
 
+    def predecessors(self, vertex):
+        """
+        :return: the vertexes with an edge to the given vertex; for undirected graphs they are its adjacents.
+        """
+        if not self._directed:
+            return self._adjacents[vertex]
+        if self._reverse is None:
+            self._reverse = [dict() if self._simple else list() for _ in range(self._numvertices)]
+            for v, adjacents in enumerate(self._adjacents):
+                for w in adjacents:
+                    self._add_predecessor(w, v)
+        return self._reverse[vertex]
+
+    def _add_predecessor(self, vertex, predecessor):
+        if self._simple:
+            self._reverse[vertex][predecessor] = None
+        else:
+            self._reverse[vertex].append(predecessor)
+
+    def in_degree(self, vertex) -> int:
+        """:return: the number of edges to the given vertex."""
+        return len(self.predecessors(vertex))
+
+    def reverse(self):
+        """Builds the reverse (or transpose) of this graph, where every edge has the opposite direction.
+
+        :return: a new graph with the same vertexes and all the edges reversed; for undirected graphs, a copy.
+        :rtype: Graph
+        """
+        reverse = Graph(self._numvertices, self._directed, self._simple)
+        copy = dict.fromkeys if self._simple else list
+        reverse._adjacents = [copy(self.predecessors(v)) for v in range(self._numvertices)]
+        reverse._numedges = self._numedges
+        return reverse
+
+    def freeze(self) -> CSRGraph:
+        """Builds a compact, read only copy of this graph, to be used when no more edges will be added.
+
+        :return: a CSRGraph with the same vertexes and edges (in the same order) of this graph.
+        :rtype: CSRGraph
+        """
+        return CSRGraph.from_graph(self)
+
+    def save_binary(self, path: str):
+        """Saves this graph in a versioned binary file, to be loaded back quickly with load_binary.
+
+        :param path: the name of the file to write.
+        :return: None
+        """
+        self.freeze().save_binary(path)
+
+    @staticmethod
+    def load_binary(path: str, mmap=True) -> CSRGraph:
+        """Loads a graph saved with save_binary.
+
+        The graph is loaded in its frozen representation as, when memory mapping,
+        it reads its adjacents straight from the mapped file.
+
+        :param path: the name of the file containing the graph.
+        :param mmap: True to map the file in memory, False to read it in private arrays.
+        :return: the graph stored in the file
+        :rtype: CSRGraph
+        """
+        return CSRGraph.load_binary(path, mmap)
+
     def __str__(self):
         lines = []
         for v, adjacents in enumerate(self._adjacents):
             if len(adjacents) > 0:
-                adjstr = str(adjacents)
+                adjstr = str(list(adjacents))
             else:
                 adjstr = "[]"
             lines.append(str(v) + " => " + adjstr + "\n")
@@ -99,38 +358,112 @@ class Graph:
 class DepthFirstSearch:
     """
     Finds the vertexes connected with the given source vertex and a path (not necessarily the shortest) to reach it.
+
+    **Implementation notes**:
+    The results take a byte per vertex for the visited flags and a machine integer per vertex for the predecessors.
     """
-    def __init__(self, graph: Graph, source_vertex: int):
+
+    __slots__ = ('_source', '_visited', '_predecessor', '_count')
+
+    def __init__(self, graph: Graph, source_vertex: int, stats: TraversalStats = None):
         """Navigate the given Graph from the given source vertex using Depth First Search.
 
         :param graph: the graph we want to navigate.
         :param source_vertex: the vertex where we start the navigation.
+        :param stats: a TraversalStats to collect the statistics of the search, if any.
         :return: a DepthFirstSearch object to query the graph starting from the given source vertex.
         """
         self._source = source_vertex
-        self._visited = [False] * graph.num_vertices()
-        self._predecessor = [-1] * graph.num_vertices()
+        if stats is None:
+            self._allocate(graph.num_vertices())
+            self._count = self._depth_first_search(graph, source_vertex)
+        else:
+            stats.start(type(self).__name__)
+            with stats.phase('allocate'):
+                self._allocate(graph.num_vertices())
+            with stats.phase('search'):
+                self._count = self._instrumented_depth_first_search(graph, source_vertex, stats)
+            stats.finish()
 
-        self._predecessor[source_vertex] = source_vertex
-        self._count = self._depth_first_search(graph, source_vertex)
+    def _allocate(self, numvertices: int):
+        self._visited = bytearray(numvertices)
+        self._predecessor = array(VERTEX_TYPECODE, [-1]) * numvertices
+        self._predecessor[self._source] = self._source
 
     def _depth_first_search(self, graph: Graph, vertex: int):
-        count = 0
-        self._visited[vertex] = True
+        # Explicit stacks of vertexes and iterators over their adjacents replace the recursion,
+        # visiting the vertexes in the same order so to build the same predecessor tree.
+        visited = self._visited
+        predecessor = self._predecessor
+        adjacents = graph.adjacents
 
-        for v in graph.adjacents(vertex):
-            if not self._visited[v]:
-                self._predecessor[v] = vertex
-                count += self._depth_first_search(graph, v)
+        visited[vertex] = 1
+        count = 1
+        vertexes = []
+        iterators = []
+        v, remaining = vertex, iter(adjacents(vertex))
+        while True:
+            for w in remaining:
+                if not visited[w]:
+                    visited[w] = 1
+                    predecessor[w] = v
+                    count += 1
+                    vertexes.append(v)
+                    iterators.append(remaining)
+                    v, remaining = w, iter(adjacents(w))
+                    break
+            else:
+                if not vertexes:
+                    break
+                v, remaining = vertexes.pop(), iterators.pop()
+
+        return count
+
+    def _instrumented_depth_first_search(self, graph: Graph, vertex: int, stats: TraversalStats):
+        # The same as _depth_first_search, counting what it does.
+        visited = self._visited
+        predecessor = self._predecessor
+        adjacents = graph.adjacents
+
+        visited[vertex] = 1
+        count = 1
+        edges = 0
+        redundant = 0
+        peak = 0
+        vertexes = []
+        iterators = []
+        v, remaining = vertex, iter(adjacents(vertex))
+        while True:
+            for w in remaining:
+                edges += 1
+                if not visited[w]:
+                    visited[w] = 1
+                    predecessor[w] = v
+                    count += 1
+                    vertexes.append(v)
+                    iterators.append(remaining)
+                    if len(vertexes) > peak:
+                        peak = len(vertexes)
+                    v, remaining = w, iter(adjacents(w))
+                    break
+                redundant += 1
+            else:
+                if not vertexes:
+                    break
+                v, remaining = vertexes.pop(), iterators.pop()
 
-        return count + 1
+        stats.vertices_visited += count
+        stats.edges_scanned += edges
+        stats.redundant_checks += redundant
+        stats.auxiliary((visited, predecessor), 2 * peak)
+        return count
 
     def connected(self, vertex: int):
         """
         :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
         :return: True if the given vertex is connected to the source, False otherwise.
         """
-        return self._visited[vertex]
+        return bool(self._visited[vertex])
 
     def count(self) -> int:
         """:return: How many vertexes are connected with the source, including the source in the count."""
@@ -152,48 +485,219 @@ class DepthFirstSearch:
 
         return path
 
+    def paths_to(self, vertices) -> list:
+        """Find a path from each of the given vertexes to the source, walking only once the parts they share.
+
+        :param vertices: the vertexes to find a path to the source
+        :return: a list with, for every given vertex, the path that path_to would return
+        """
+        return _paths_to(self._visited, self._predecessor, self._source, vertices)
+
 
 class BreadthFirstSearch:
     """
     Finds the vertexes connected with the given source vertex and a the shortest path to reach each.
+
+    **Implementation notes**:
+    In the default TOP_DOWN mode every vertex of the queue checks its adjacents for unvisited ones.
+    In the DIRECTION_OPTIMIZING mode the search proceeds one level at a time and, when the frontier gets large,
+    switches to bottom-up steps where every unvisited vertex looks for a parent in the frontier,
+    stopping at the first one found: on low diameter graphs this skips most of the checks of already visited vertexes.
+    It switches back to top-down steps when the frontier shrinks.
+    Bottom-up steps need the predecessors of a vertex, so on directed graphs they are only taken
+    when the graph provides them with a predecessors() method.
+    Distances are the same in both modes, predecessors may differ among equally short paths.
+    The results take a byte per vertex for the visited flags
+    and a machine integer per vertex for the predecessors and for the distances.
     """
-    def __init__(self, graph: Graph, source_vertex: int):
+
+    __slots__ = ('_graph', '_source', '_queue', '_visited', '_predecessor', '_distance', '_count')
+
+    TOP_DOWN = 'top-down'
+    DIRECTION_OPTIMIZING = 'direction-optimizing'
+
+    # Go bottom-up when the edges to check from the frontier exceed 1/ALPHA of the edges still unexplored,
+    # go back top-down when the frontier gets smaller than 1/BETA of the vertexes.
+    ALPHA = 14
+    BETA = 24
+
+    def __init__(self, graph: Graph, source_vertex: int, mode=TOP_DOWN, stats: TraversalStats = None):
         """Navigate the given Graph from the given source vertex using Breadth First Search.
 
         :param graph: the graph we want to navigate.
         :param source_vertex: the vertex where we start the navigation.
+        :param mode: how to expand the search, TOP_DOWN (the default) or DIRECTION_OPTIMIZING.
+        :param stats: a TraversalStats to collect the statistics of the search, if any.
+            In DIRECTION_OPTIMIZING mode the edges checked by the bottom-up steps are not counted.
         :return: a BreadthFirstSearch object to query the graph starting from the given source vertex.
         """
+        if mode not in (BreadthFirstSearch.TOP_DOWN, BreadthFirstSearch.DIRECTION_OPTIMIZING):
+            raise ValueError("Unknown breadth first search mode " + str(mode))
         self._graph = graph
         self._source = source_vertex
-        self._queue = deque()
-        self._visited = [False] * self._graph.num_vertices()
-        self._predecessor = [-1] * self._graph.num_vertices()
-        self._distance = [sys.maxsize] * self._graph.num_vertices()
         self._count = 0
-        self._breadth_first_search(self._source)
+        if stats is None:
+            self._allocate(graph.num_vertices())
+            if mode == BreadthFirstSearch.TOP_DOWN:
+                self._breadth_first_search(self._source)
+            else:
+                self._direction_optimizing_search(self._source)
+        else:
+            stats.start(type(self).__name__)
+            with stats.phase('allocate'):
+                self._allocate(graph.num_vertices())
+            if mode == BreadthFirstSearch.TOP_DOWN:
+                with stats.phase('search'):
+                    self._instrumented_breadth_first_search(self._source, stats)
+            else:
+                self._direction_optimizing_search(self._source, stats)
+            stats.finish()
+
+    def _allocate(self, numvertices: int):
+        self._queue = deque()
+        self._visited = bytearray(numvertices)
+        self._predecessor = array(VERTEX_TYPECODE, [-1]) * numvertices
+        self._distance = array(VERTEX_TYPECODE, [-1]) * numvertices
 
     def _breadth_first_search(self, source):
-        self._visited[source] = True
-        self._predecessor[source] = source
-        self._distance[source] = 0
-        self._queue.append(source)
-        while len(self._queue) > 0:
-            v = self._queue.popleft()
+        visited = self._visited
+        predecessor = self._predecessor
+        distance = self._distance
+        queue = self._queue
+        adjacents = self._graph.adjacents
+
+        visited[source] = 1
+        predecessor[source] = source
+        distance[source] = 0
+        queue.append(source)
+        count = 0
+        while queue:
+            v = queue.popleft()
+            count += 1
+            d = distance[v] + 1
+            for adj in adjacents(v):
+                if not visited[adj]:
+                    visited[adj] = 1
+                    predecessor[adj] = v
+                    distance[adj] = d
+                    queue.append(adj)
+        self._count += count
+
+    def _instrumented_breadth_first_search(self, source, stats: TraversalStats):
+        # The same as _breadth_first_search, counting what it does.
+        visited = self._visited
+        predecessor = self._predecessor
+        distance = self._distance
+        queue = self._queue
+        adjacents = self._graph.adjacents
+        frontier_sizes = stats.frontier_sizes
+        edges = 0
+        redundant = 0
+        peak = 0
+
+        visited[source] = 1
+        predecessor[source] = source
+        distance[source] = 0
+        queue.append(source)
+        while len(queue) > 0:
+            if len(queue) > peak:
+                peak = len(queue)
+            v = queue.popleft()
             self._count += 1
-            for adj in self._graph.adjacents(v):
-                if not self._visited[adj]:
-                    self._visited[adj] = True
-                    self._predecessor[adj] = v
-                    self._distance[adj] = self._distance[v] + 1
-                    self._queue.append(adj)
+            d = distance[v]
+            if d == len(frontier_sizes):
+                frontier_sizes.append(0)
+            frontier_sizes[d] += 1
+            for adj in adjacents(v):
+                edges += 1
+                if not visited[adj]:
+                    visited[adj] = 1
+                    predecessor[adj] = v
+                    distance[adj] = d + 1
+                    queue.append(adj)
+                else:
+                    redundant += 1
+
+        stats.vertices_visited += self._count
+        stats.edges_scanned += edges
+        stats.redundant_checks += redundant
+        stats.auxiliary((visited, predecessor, distance), peak)
+
+    def _direction_optimizing_search(self, source, stats: TraversalStats = None):
+        graph = self._graph
+        numvertices = graph.num_vertices()
+        adjacents = graph.adjacents
+        parents = adjacents if not graph.is_directed() else getattr(graph, 'predecessors', None)
+        visited = self._visited
+        predecessor = self._predecessor
+        distance = self._distance
+
+        visited[source] = 1
+        predecessor[source] = source
+        distance[source] = 0
+        frontier = [source]
+        in_frontier = bytearray(numvertices)
+        unexplored_edges = graph.num_edges() * (1 if graph.is_directed() else 2)
+        bottom_up = False
+        level = 0
+        peak = 0
+        while frontier:
+            if stats is not None:
+                # statistics are collected a level at a time, out of the loops on vertexes and edges
+                started = time.perf_counter()
+                stats.frontier_sizes.append(len(frontier))
+                peak = max(peak, len(frontier))
+            self._count += len(frontier)
+            level += 1
+            frontier_edges = sum(len(adjacents(v)) for v in frontier)
+            unexplored_edges -= frontier_edges
+            if parents is not None:
+                if not bottom_up and frontier_edges > unexplored_edges / BreadthFirstSearch.ALPHA:
+                    bottom_up = True
+                elif bottom_up and len(frontier) < numvertices / BreadthFirstSearch.BETA:
+                    bottom_up = False
+
+            next_frontier = []
+            if bottom_up:
+                for v in frontier:
+                    in_frontier[v] = 1
+                for v in range(numvertices):
+                    if not visited[v]:
+                        for w in parents(v):
+                            if in_frontier[w]:
+                                visited[v] = 1
+                                predecessor[v] = w
+                                distance[v] = level
+                                next_frontier.append(v)
+                                break
+                for v in frontier:
+                    in_frontier[v] = 0
+            else:
+                for v in frontier:
+                    for w in adjacents(v):
+                        if not visited[w]:
+                            visited[w] = 1
+                            predecessor[w] = v
+                            distance[w] = level
+                            next_frontier.append(w)
+                if stats is not None:
+                    stats.edges_scanned += frontier_edges
+                    stats.redundant_checks += frontier_edges - len(next_frontier)
+            if stats is not None:
+                phase = 'bottom-up' if bottom_up else 'top-down'
+                stats.phases[phase] = stats.phases.get(phase, 0.0) + time.perf_counter() - started
+            frontier = next_frontier
+
+        if stats is not None:
+            stats.vertices_visited += self._count
+            stats.auxiliary((visited, predecessor, distance, in_frontier), 2 * peak)
 
     def connected(self, vertex: int):
         """
         :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
         :return: True if the given vertex is connected to the source, False otherwise.
         """
-        return self._visited[vertex]
+        return bool(self._visited[vertex])
 
     def count(self) -> int:
         """:return: How many vertexes are connected with the source, including the source in the count."""
@@ -215,40 +719,126 @@ class BreadthFirstSearch:
 
         return path
 
+    def paths_to(self, vertices) -> list:
+        """Find a path from each of the given vertexes to the source, walking only once the parts they share.
+
+        :param vertices: the vertexes to find a path to the source
+        :return: a list with, for every given vertex, the path that path_to would return
+        """
+        return _paths_to(self._visited, self._predecessor, self._source, vertices)
+
     def distance(self, vertex: int):
         """
         :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
-        :return: the distance between the given vertex and the source.
+        :return: the distance between the given vertex and the source, sys.maxsize if it is not connected.
         """
-        return self._distance[vertex]
+        d = self._distance[vertex]
+        return d if d != -1 else sys.maxsize
 
 
 class ConnectedComponents:
-    """Determines the connected components in an undirected graph."""
+    """Determines the connected components in an undirected graph.
 
-    def __init__(self, graph: Graph):
+    **Implementation notes**:
+    The results take a few machine integers per vertex: its component, the size of the component it is the id of,
+    if any, and its position in the list of the vertexes grouped by component.
+    """
+
+    __slots__ = ('_count', '_group', '_group_size', '_start', '_order')
+
+    def __init__(self, graph: Graph, stats: TraversalStats = None):
         """ Analyzes the given graph and store the results to be ready to answer for queries on connected components.
 
+        All the components are labelled with a single traversal sharing the same state, in time proportional to V + E.
+        Every component is identified by its smallest vertex.
+
         :param graph: The Graph to analyze
+        :param stats: a TraversalStats to collect the statistics of the traversal, if any.
         """
-        self._visited = [False] * graph.num_vertices()
-        self._group = [-1] * graph.num_vertices()
-        self._group_size = [-1] * graph.num_vertices()
-        self._count = 0
+        if stats is None:
+            self._group_size = self._label(graph)
+        else:
+            stats.start(type(self).__name__)
+            with stats.phase('label'):
+                self._group_size = self._instrumented_label(graph, stats)
+            stats.finish()
+
+    def _label(self, graph: Graph):
+        """Labels every vertex with its component.
+
+        :return: an array with the size of every component, by component id.
+        """
+        numvertices = graph.num_vertices()
+        adjacents = graph.adjacents
+        # group and order are lists while labelling, as they are faster to access than arrays, then made compact
+        group = [-1] * numvertices
+        start = array(VERTEX_TYPECODE, [-1]) * numvertices
+        size = array(VERTEX_TYPECODE, [0]) * numvertices
+        order = []      # the vertexes, one component after the other; doubles as the queue of the traversal
+        count = 0
+
+        for v in range(numvertices):
+            if group[v] == -1:
+                count += 1
+                group[v] = v
+                first = len(order)
+                start[v] = first
+                order.append(v)
+                i = first
+                while i < len(order):
+                    for w in adjacents(order[i]):
+                        if group[w] == -1:
+                            group[w] = v
+                            order.append(w)
+                    i += 1
+                size[v] = len(order) - first
+
+        self._count = count
+        self._group = array(VERTEX_TYPECODE, group)
+        self._start = start
+        self._order = array(VERTEX_TYPECODE, order)
+        return size
 
-        for v in range(graph.num_vertices()):
-            if not self._visited[v]:
-                self._visited[v] = True
-                self._group[v] = v
-                self._count += 1
-                print("Checking CC for vertex ", v)
-                dfs = DepthFirstSearch(graph, v)
-                self._group_size[v] = dfs.count()
-                for w in range(v+1, graph.num_vertices()):
-                    if dfs.connected(w):
-                        self._visited[w] = True
-                        self._group[w] = v
-                        self._group_size[w] = dfs.count()
+    def _instrumented_label(self, graph: Graph, stats: TraversalStats):
+        # The same as _label, counting what it does.
+        numvertices = graph.num_vertices()
+        adjacents = graph.adjacents
+        group = [-1] * numvertices
+        start = array(VERTEX_TYPECODE, [-1]) * numvertices
+        size = array(VERTEX_TYPECODE, [0]) * numvertices
+        order = []
+        count = 0
+        edges = 0
+        redundant = 0
+
+        for v in range(numvertices):
+            if group[v] == -1:
+                count += 1
+                group[v] = v
+                first = len(order)
+                start[v] = first
+                order.append(v)
+                i = first
+                while i < len(order):
+                    for w in adjacents(order[i]):
+                        edges += 1
+                        if group[w] == -1:
+                            group[w] = v
+                            order.append(w)
+                        else:
+                            redundant += 1
+                    i += 1
+                size[v] = len(order) - first
+
+        self._count = count
+        self._group = array(VERTEX_TYPECODE, group)
+        self._start = start
+        self._order = array(VERTEX_TYPECODE, order)
+        stats.vertices_visited += len(order)
+        stats.edges_scanned += edges
+        stats.redundant_checks += redundant
+        stats.auxiliary((group, start, size, order), 0)
+        return size
 
     def count(self):
         """:return: The number of different connected components. """
@@ -264,14 +854,184 @@ class ConnectedComponents:
 
     def groupsize(self, vertex: int) -> int:
         """:return: The size of the connected component the given vertex is part of."""
-        return self._group_size[vertex]
+        return self._group_size[self._group[vertex]]
+
+    def groups(self) -> list:
+        """:return: A list with the id of the connected component of every vertex."""
+        return self._group.tolist()
+
+    def group_sizes(self) -> dict:
+        """:return: A dictionary with the size of every connected component, by component id."""
+        group = self._group
+        return {g: size for g, size in enumerate(self._group_size) if size and group[g] == g}
+
+    def members(self, group: int) -> list:
+        """:return: A list with all the vertexes of the connected component with the given id."""
+        if group < 0 or group >= len(self._group) or self._group[group] != group:
+            raise ValueError("There is no connected component with id " + str(group))
+        first = self._start[group]
+        return self._order[first:first + self._group_size[group]].tolist()
+
+
+def _paths_to(visited, predecessor, source: int, vertices) -> list:
+    """:return: a list with the path from every given vertex to the source, None for the vertexes not visited,
+        reusing the part of a path already walked for a previous vertex."""
+    walked = {}     # vertex => (path, index of the vertex in the path)
+    paths = []
+    for vertex in vertices:
+        if not visited[vertex]:
+            paths.append(None)
+            continue
+        path = []
+        v = vertex
+        while v not in walked and v != source:
+            path.append(v)
+            v = predecessor[v]
+        if v in walked:
+            shared, index = walked[v]
+            path.extend(shared[index:])
+        else:
+            path.append(source)
+        for i in range(len(path)):
+            if path[i] in walked:
+                break
+            walked[path[i]] = (path, i)
+        paths.append(path)
+    return paths
 
 
 class CycleDetector:
     """A class to detect cycles in undirected graphs.
     Cycles can be self loops, parallel edges or multi vertec circular paths.
+
+    The same traversal also finds out whether the graph is bipartite (two-colorable), returning an odd cycle
+    when it is not, and which edges are bridges and which vertexes are articulation points.
+
+    **Implementation notes**:
+    A single depth first search, driven by explicit stacks, covers all the components of the graph
+    in time proportional to V + E. Every edge not in the search tree goes back to an ancestor and closes a cycle,
+    that is odd when both its endpoints have the same color, i.e. the same depth parity.
+    The low link of a vertex is the earliest discovered vertex reachable from its subtree with a single back edge:
+    the tree edge to a vertex whose low link is past its parent is a bridge,
+    and a parent is an articulation point when it is not earlier than its own discovery.
+    Only the first occurrence of the edge to the parent is the tree edge, so parallel edges are back edges.
     """
-    pass
+
+    def __init__(self, graph: Graph):
+        """ Analyzes the given graph and store the results to be ready to answer for queries on its cycles.
+
+        :param graph: The undirected Graph to analyze
+        """
+        if graph.is_directed():
+            raise ValueError("Cycles, bipartitions, bridges and articulation points are computed on undirected graphs.")
+        numvertices = graph.num_vertices()
+        adjacents = graph.adjacents
+        pre = array(VERTEX_TYPECODE, [-1]) * numvertices
+        low = array(VERTEX_TYPECODE, [0]) * numvertices
+        parent = array(VERTEX_TYPECODE, [-1]) * numvertices
+        color = bytearray(numvertices)
+        articulation = bytearray(numvertices)
+        bridges = []
+        self._cycle = None
+        self._odd_cycle = None
+        counter = 0
+
+        for source in range(numvertices):
+            if pre[source] != -1:
+                continue
+            pre[source] = low[source] = counter
+            counter += 1
+            children = 0
+            vertexes = []
+            iterators = []
+            skip_parent = []
+            v, remaining, skip = source, iter(adjacents(source)), False
+            while True:
+                for w in remaining:
+                    if pre[w] == -1:
+                        pre[w] = low[w] = counter
+                        counter += 1
+                        parent[w] = v
+                        color[w] = 1 - color[v]
+                        vertexes.append(v)
+                        iterators.append(remaining)
+                        skip_parent.append(skip)
+                        v, remaining, skip = w, iter(adjacents(w)), True
+                        break
+                    elif skip and w == parent[v]:
+                        skip = False
+                    elif pre[w] <= pre[v]:
+                        if pre[w] < low[v]:
+                            low[v] = pre[w]
+                        if self._cycle is None:
+                            self._cycle = self._back_edge_cycle(parent, v, w)
+                        if self._odd_cycle is None and color[w] == color[v]:
+                            self._odd_cycle = self._back_edge_cycle(parent, v, w)
+                else:
+                    if not vertexes:
+                        break
+                    u = vertexes.pop()
+                    remaining, skip = iterators.pop(), skip_parent.pop()
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                    if low[v] > pre[u]:
+                        bridges.append((u, v))
+                    if u == source:
+                        children += 1
+                    elif low[v] >= pre[u]:
+                        articulation[u] = 1
+                    v = u
+            if children > 1:
+                articulation[source] = 1
+
+        self._color = color
+        self._bridges = bridges
+        self._articulation = articulation
+
+    @staticmethod
+    def _back_edge_cycle(parent, v: int, w: int) -> list:
+        """:return: the cycle made by the back edge from v to its ancestor w and the tree path from w to v."""
+        cycle = [v]
+        vertex = v
+        while vertex != w:
+            vertex = parent[vertex]
+            cycle.append(vertex)
+        cycle.append(v)
+        return cycle
+
+    def has_cycle(self) -> bool:
+        """:return: True if the graph has a cycle, False if it is acyclic (a forest)."""
+        return self._cycle is not None
+
+    def cycle(self):
+        """:return: a list with the vertexes of a cycle, starting and ending with the same vertex,
+            None if the graph is acyclic."""
+        return list(self._cycle) if self._cycle is not None else None
+
+    def is_bipartite(self) -> bool:
+        """:return: True if the vertexes can be colored with two colors so that no edge joins two of the same color."""
+        return self._odd_cycle is None
+
+    def color(self, vertex: int) -> int:
+        """:return: the color, 0 or 1, of the given vertex in the two-coloring of a bipartite graph."""
+        return self._color[vertex]
+
+    def odd_cycle(self):
+        """:return: a list with the vertexes of a cycle of odd length, starting and ending with the same vertex,
+            that proves the graph is not bipartite; None if the graph is bipartite."""
+        return list(self._odd_cycle) if self._odd_cycle is not None else None
+
+    def bridges(self) -> list:
+        """:return: a list with the (vertex1, vertex2) pairs of the edges whose removal disconnects their endpoints."""
+        return list(self._bridges)
+
+    def articulation_points(self) -> list:
+        """:return: a sorted list with the vertexes whose removal increases the number of connected components."""
+        return [v for v, articulation in enumerate(self._articulation) if articulation]
+
+    def is_biconnected(self) -> bool:
+        """:return: True if the graph has no articulation point."""
+        return not any(self._articulation)
 
 
 """
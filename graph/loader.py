@@ -0,0 +1,96 @@
+"""
+Bulk reader for the text format used to store graphs.
+"""
+
+from array import array
+import os
+
+
+# Typecode of the typed buffers holding vertexes.
+VERTEX_TYPECODE = 'i'
+
+# How many bytes of the file are parsed in one go, at most: large enough to amortize the per chunk overhead,
+# small enough that the tokens of a chunk do not take more memory than the parsed edges.
+CHUNK_SIZE = 1 << 16
+
+
+def read_edge_list(filename: str, chunk_size: int = CHUNK_SIZE):
+    """Reads a graph definition from a file, parsing it in large chunks instead of one line at a time.
+
+    First line must contain the number of vertexes;
+    second line must contain the number of edges, that is used to preallocate the storage for the edges;
+    from third line onward there must be two integers representing the two vertexes to be connected by and edge.
+
+    :param filename: the name of the file containing the graph definition.
+    :param chunk_size: how many bytes to read and parse in one go.
+    :return: a tuple (numvertices, numedges, endpoints) where endpoints is a typed array
+        with the two vertexes of every edge, one edge after the other, in the order they are in the file.
+    """
+    with open(filename, 'rb') as fh:
+        numvertices = int(fh.readline())
+        numedges = int(fh.readline())
+        endpoints = array(VERTEX_TYPECODE, [0]) * (2 * numedges)
+        size = 0
+        chunk_size = _capped(fh, chunk_size)
+
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            chunk += fh.readline()      # never split a line across two chunks
+            values = array(VERTEX_TYPECODE, map(int, chunk.split()))
+            endpoints[size:size + len(values)] = values
+            size += len(values)
+
+    if size % 2 != 0:
+        raise ValueError("File " + filename + " contains an edge with a single vertex.")
+    del endpoints[size:]
+
+    return numvertices, size // 2, endpoints
+
+
+# Typecode of the typed buffers holding edge weights.
+WEIGHT_TYPECODE = 'd'
+
+
+def read_weighted_edge_list(filename: str, chunk_size: int = CHUNK_SIZE):
+    """Reads a weighted graph definition from a file, parsing it in large chunks instead of one line at a time.
+
+    The format is the same read by read_edge_list, but every edge line has a third column with the weight of the edge.
+
+    :param filename: the name of the file containing the graph definition.
+    :param chunk_size: how many bytes to read and parse in one go.
+    :return: a tuple (numvertices, numedges, endpoints, weights) where endpoints is a typed array
+        with the two vertexes of every edge, one edge after the other, and weights a typed array
+        with the weight of every edge, in the order they are in the file.
+    """
+    with open(filename, 'rb') as fh:
+        numvertices = int(fh.readline())
+        fh.readline()       # the number of edges is counted while reading them
+        endpoints = array(VERTEX_TYPECODE)
+        weights = array(WEIGHT_TYPECODE)
+        chunk_size = _capped(fh, chunk_size)
+
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            chunk += fh.readline()      # never split a line across two chunks
+            values = chunk.split()
+            if len(values) % 3 != 0:
+                raise ValueError("File " + filename + " contains an edge without two vertexes and a weight.")
+            vertexes = array(VERTEX_TYPECODE, map(int, values[0::3]))
+            others = array(VERTEX_TYPECODE, map(int, values[1::3]))
+            edges = array(VERTEX_TYPECODE, [0]) * (2 * len(vertexes))
+            edges[0::2] = vertexes
+            edges[1::2] = others
+            endpoints.extend(edges)
+            weights.extend(array(WEIGHT_TYPECODE, map(float, values[2::3])))
+
+    return numvertices, len(weights), endpoints, weights
+
+
+def _capped(fh, chunk_size: int) -> int:
+    """:return: the given chunk size, reduced to what is left to read of the file so that small files
+        do not allocate a buffer of the whole chunk size."""
+    return max(1, min(chunk_size, os.fstat(fh.fileno()).st_size - fh.tell()))
@@ -0,0 +1,130 @@
+"""
+Breadth first search from many sources at once, and from many sources one after the other reusing the same buffers.
+"""
+
+from array import array
+import sys
+
+from graph.loader import VERTEX_TYPECODE
+
+
+class MultiSourceBreadthFirstSearch:
+    """
+    Finds the vertexes connected with any of a set of source vertexes, the nearest source to each
+    and a shortest path to reach it from that source.\n
+    Vertexes at the same distance from more sources are assigned to the source that comes first in the set.
+
+    **Implementation notes**:
+    The object owns buffers of size V that are allocated once and reused by every search:
+    to start a new search only the vertexes reached by the previous one are reset,
+    so that a batch of searches on a large sparse graph costs what the searches touch, not V per search.
+    """
+
+    def __init__(self, graph, sources=None):
+        """Prepares the buffers to navigate the given Graph and, if sources are given, runs the first search.
+
+        :param graph: the graph we want to navigate.
+        :param sources: the vertex or the iterable of vertexes where we start the navigation, if any.
+        :return: a MultiSourceBreadthFirstSearch object to query the graph starting from the given sources.
+        """
+        self._graph = graph
+        self._distance = array(VERTEX_TYPECODE, [-1]) * graph.num_vertices()
+        self._predecessor = array(VERTEX_TYPECODE, [-1]) * graph.num_vertices()
+        self._source = array(VERTEX_TYPECODE, [-1]) * graph.num_vertices()
+        self._order = []    # the reached vertexes, in order of distance; doubles as the queue of the search
+        if sources is not None:
+            self.search(sources)
+
+    def search(self, sources):
+        """Navigates the graph from the given sources, replacing the results of the previous search.
+
+        :param sources: the vertex or the iterable of vertexes where we start the navigation.
+        :return: this object, to query the results of the search.
+        """
+        if isinstance(sources, int):
+            sources = (sources,)
+        distance = self._distance
+        predecessor = self._predecessor
+        source = self._source
+        adjacents = self._graph.adjacents
+
+        order = self._order
+        for v in order:
+            distance[v] = -1
+        del order[:]
+
+        for s in sources:
+            if distance[s] == -1:
+                distance[s] = 0
+                predecessor[s] = s
+                source[s] = s
+                order.append(s)
+
+        i = 0
+        while i < len(order):
+            v = order[i]
+            d = distance[v] + 1
+            s = source[v]
+            for w in adjacents(v):
+                if distance[w] == -1:
+                    distance[w] = d
+                    predecessor[w] = v
+                    source[w] = s
+                    order.append(w)
+            i += 1
+
+        return self
+
+    def searches(self, batch):
+        """Runs a search for every item in the batch, one after the other, reusing the same buffers.
+
+        :param batch: an iterable of sources, each one a vertex or an iterable of vertexes.
+        :return: a generator that yields this object after each search, to query its results before the next one.
+        """
+        for sources in batch:
+            yield self.search(sources)
+
+    def connected(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know if it is connected to any source for the current Graph.
+        :return: True if the given vertex is connected to a source, False otherwise.
+        """
+        return self._distance[vertex] != -1
+
+    def count(self) -> int:
+        """:return: How many vertexes are connected with the sources, including the sources in the count."""
+        return len(self._order)
+
+    def reached(self) -> list:
+        """:return: a list with the vertexes connected with the sources, in order of distance."""
+        return list(self._order)
+
+    def source(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know the nearest source of.
+        :return: the source nearest to the given vertex if it is connected, None otherwise.
+        """
+        return self._source[vertex] if self.connected(vertex) else None
+
+    def path_to(self, vertex: int):
+        """Find a path from the given vertex to its nearest source.
+
+        :param vertex: the vertex to find a path to the source
+        :return: a list with the vertexes to navigate to get to the source if it is connected or None otherwise
+        """
+        path = None
+        if self.connected(vertex):
+            path = [vertex]
+            while self._predecessor[vertex] != vertex:
+                vertex = self._predecessor[vertex]
+                path.append(vertex)
+
+        return path
+
+    def distance(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know the distance from the nearest source.
+        :return: the distance between the given vertex and its nearest source, sys.maxsize if it is not connected.
+        """
+        d = self._distance[vertex]
+        return d if d != -1 else sys.maxsize
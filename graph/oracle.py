@@ -0,0 +1,250 @@
+"""
+Landmark distance oracle: bounds on the distance between any two vertexes from distances precomputed to a few landmarks.
+"""
+
+from array import array
+import heapq
+import sys
+
+from graph.binary import BinaryFormat, release
+from graph.loader import VERTEX_TYPECODE
+
+
+# How many landmarks are picked by default.
+DEFAULT_LANDMARKS = 16
+
+# Binary format: a header with the number of vertexes and landmarks followed by the landmarks,
+# the distances from every landmark and, for directed graphs, the distances to every landmark.
+BINARY_MAGIC = b'LANDMARK'
+BINARY_VERSION = 1
+_FORMAT = BinaryFormat(BINARY_MAGIC, BINARY_VERSION, 'qI', VERTEX_TYPECODE, "landmark index")
+_FLAG_DIRECTED = 1
+
+
+class LandmarkIndex:
+    """
+    Answers lower and upper bounds on the distance (number of edges) between any two vertexes in time O(k),
+    from the distances between every vertex and k landmark vertexes computed in advance.\n
+    When the graph is at hand, the bounds also drive an exact search that skips the vertexes
+    which can not be on a shortest path; when the bounds match no search is needed at all.
+
+    **Implementation notes**:
+    For every landmark L the index stores d(L, v) and, on directed graphs, d(v, L) for every vertex v
+    in flat typed arrays of k * V machine integers, -1 meaning unreachable.
+    By the triangle inequality d(s, t) <= d(s, L) + d(L, t), d(s, t) >= d(L, t) - d(L, s)
+    and d(s, t) >= d(s, L) - d(t, L): the best of these over all the landmarks are the bounds.
+    Landmarks are the vertexes of highest degree, which lie on many shortest paths.
+    The index can be saved to a binary file and memory mapped, so that processes loading it share one copy.
+    """
+
+    def __init__(self, landmarks, forward, backward, directed=False, graph=None):
+        """Creates an index on top of already computed distance buffers.
+
+        Usually you do not call this directly, but get a LandmarkIndex from from_graph() or load_binary().
+
+        :param landmarks: a typed buffer with the k landmark vertexes.
+        :param forward: a typed buffer with the k * V distances from the landmarks, one landmark after the other.
+        :param backward: a typed buffer with the k * V distances to the landmarks; the same as forward if undirected.
+        :param directed: True if the distances are on a directed graph.
+        :param graph: the graph the index was built on, needed by the exact searches.
+        :return: an index answering distance bounds
+        :rtype: LandmarkIndex
+        """
+        if len(forward) != len(backward) or (landmarks and len(forward) % len(landmarks) != 0):
+            raise ValueError("Distances do not match the number of landmarks.")
+        self._landmarks = landmarks
+        self._forward = forward
+        self._backward = backward
+        self._numvertices = len(forward) // len(landmarks) if landmarks else 0
+        self._directed = directed
+        self._graph = graph
+        self._mmap = None
+
+    @classmethod
+    def from_graph(cls, graph, k: int = DEFAULT_LANDMARKS, landmarks=None):
+        """Builds the index of the given graph, with a breadth first search from (and to) every landmark.
+
+        :param graph: the graph to index.
+        :param k: how many landmarks to pick, among the vertexes of highest degree.
+        :param landmarks: the landmark vertexes to use instead of picking them.
+        :return: the index of the graph
+        :rtype: LandmarkIndex
+        """
+        numvertices = graph.num_vertices()
+        if landmarks is None:
+            landmarks = heapq.nlargest(min(k, numvertices), range(numvertices),
+                                       key=lambda v: len(graph.adjacents(v)))
+        landmarks = array(VERTEX_TYPECODE, landmarks)
+        if not landmarks:
+            raise ValueError("A landmark index needs at least a landmark.")
+
+        directed = graph.is_directed()
+        forward = array(VERTEX_TYPECODE, [-1]) * (len(landmarks) * numvertices)
+        backward = array(VERTEX_TYPECODE, [-1]) * (len(landmarks) * numvertices) if directed else forward
+        for i, landmark in enumerate(landmarks):
+            _distances(graph.adjacents, landmark, forward, i * numvertices)
+            if directed:
+                _distances(graph.predecessors, landmark, backward, i * numvertices)
+        return cls(landmarks, forward, backward, directed, graph)
+
+    @classmethod
+    def load_binary(cls, path: str, graph=None, mmap=True):
+        """Loads an index saved with save_binary; when memory mapping, the distances are not copied.
+
+        :param path: the name of the file containing the index.
+        :param graph: the graph the index was built on, needed by the exact searches.
+        :param mmap: True to map the file in memory, False to read it in private arrays.
+        :return: the index stored in the file
+        :rtype: LandmarkIndex
+        """
+        with _FORMAT.open(path, mmap) as reader:
+            numvertices, numlandmarks = reader.fields
+            if graph is not None and graph.num_vertices() != numvertices:
+                raise ValueError("The landmark index in " + path + " is not for a graph with "
+                                 + str(graph.num_vertices()) + " vertexes.")
+            directed = bool(reader.flags & _FLAG_DIRECTED)
+            size = numlandmarks * numvertices
+            landmarks = reader.section(VERTEX_TYPECODE, numlandmarks)
+            forward = reader.section(VERTEX_TYPECODE, size)
+            backward = reader.section(VERTEX_TYPECODE, size) if directed else forward
+
+        index = cls(landmarks, forward, backward, directed, graph)
+        index._mmap = reader.mapped
+        return index
+
+    def save_binary(self, path: str):
+        """Saves this index in a versioned binary file, to be loaded back quickly with load_binary.
+
+        :param path: the name of the file to write.
+        :return: None
+        """
+        sections = [self._landmarks, self._forward]
+        if self._directed:
+            sections.append(self._backward)
+        _FORMAT.save(path, _FLAG_DIRECTED if self._directed else 0, (self._numvertices, len(self._landmarks)),
+                     sections)
+
+    def close(self):
+        """Releases the memory mapped file backing this index, if any.
+
+        The index can not be used anymore after closing it.
+        """
+        release(self._mmap, (self._landmarks, self._forward, self._backward))
+        self._mmap = None
+
+    def landmarks(self) -> list:
+        """:return: a list with the landmark vertexes."""
+        return list(self._landmarks)
+
+    def num_vertices(self) -> int:
+        """:return: the number of vertexes of the indexed graph."""
+        return self._numvertices
+
+    def upper_bound(self, source: int, target: int):
+        """
+        :return: an upper bound on the distance from source to target,
+            sys.maxsize if no landmark is on a path between them.
+        """
+        if source == target:
+            return 0
+        forward = self._forward
+        backward = self._backward
+        best = sys.maxsize
+        for offset in range(0, len(forward), self._numvertices):
+            to_landmark = backward[offset + source]
+            from_landmark = forward[offset + target]
+            if to_landmark != -1 and from_landmark != -1 and to_landmark + from_landmark < best:
+                best = to_landmark + from_landmark
+        return best
+
+    def lower_bound(self, source: int, target: int):
+        """
+        :return: a lower bound on the distance from source to target,
+            sys.maxsize if the landmarks prove that target can not be reached from source.
+        """
+        forward = self._forward
+        backward = self._backward
+        best = 0
+        for offset in range(0, len(forward), self._numvertices):
+            from_source = forward[offset + source]
+            from_target = forward[offset + target]
+            if from_source != -1:
+                if from_target == -1:
+                    return sys.maxsize
+                if from_target - from_source > best:
+                    best = from_target - from_source
+            to_target = backward[offset + target]
+            to_source = backward[offset + source]
+            if to_target != -1:
+                if to_source == -1:
+                    return sys.maxsize
+                if to_source - to_target > best:
+                    best = to_source - to_target
+        return best
+
+    def path(self, source: int, target: int):
+        """Finds a shortest path from source to target with a breadth first search
+        that does not expand the vertexes whose lower bound to the target exceeds the best known path.
+
+        :return: a list with the vertexes of the path, from the source to the target, or None if there is no path.
+        """
+        if self._graph is None:
+            raise ValueError("Exact searches need the graph the landmark index was built on.")
+        lower = self.lower_bound(source, target)
+        if lower == sys.maxsize:
+            return None
+        upper = self.upper_bound(source, target)
+        adjacents = self._graph.adjacents
+        lower_bound = self.lower_bound
+
+        parent = {source: source}
+        distance = {source: 0}
+        frontier = [source]
+        while frontier and target not in parent:
+            level = []
+            for v in frontier:
+                d = distance[v] + 1
+                for w in adjacents(v):
+                    if w not in parent:
+                        if w != target and d + lower_bound(w, target) > upper:
+                            continue
+                        parent[w] = v
+                        distance[w] = d
+                        level.append(w)
+            frontier = level
+
+        if target not in parent:
+            return None
+        path = [target]
+        while path[-1] != source:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+    def distance(self, source: int, target: int):
+        """
+        :return: the exact distance from source to target, sys.maxsize if target can not be reached;
+            when the bounds match it is answered without searching.
+        """
+        lower = self.lower_bound(source, target)
+        if lower == sys.maxsize:
+            return sys.maxsize
+        if lower == self.upper_bound(source, target):
+            return lower
+        path = self.path(source, target)
+        return len(path) - 1 if path is not None else sys.maxsize
+
+
+def _distances(adjacents, source: int, distance, offset: int):
+    """Writes the distances from source, found with a breadth first search, into distance[offset:offset + V]."""
+    distance[offset + source] = 0
+    queue = [source]
+    i = 0
+    while i < len(queue):
+        v = queue[i]
+        d = distance[offset + v] + 1
+        for w in adjacents(v):
+            if distance[offset + w] == -1:
+                distance[offset + w] = d
+                queue.append(w)
+        i += 1
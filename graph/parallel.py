@@ -0,0 +1,225 @@
+"""
+Level synchronous breadth first search, expanding every level of the search across a pool of processes.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import os
+import sys
+
+from graph.csr import CSRGraph, OFFSET_TYPECODE
+from graph.loader import VERTEX_TYPECODE
+
+
+# Graphs with less vertexes than this are searched serially, as starting the processes would cost more than the search.
+PARALLEL_THRESHOLD = 100000
+
+# Levels with less vertexes than this are expanded by the calling process, as shipping them would cost more.
+MIN_CHUNK_SIZE = 2048
+
+
+class SharedGraphPool:
+    """
+    A pool of worker processes sharing the CSR layout of a graph and the distances of the current search.\n
+    The adjacency data is copied once in shared memory, that the workers map without copying it,
+    so the same pool can run many searches on the same graph.
+    Use it as a context manager, or call close() when done, to stop the workers and free the shared memory.
+    """
+
+    def __init__(self, graph, workers=None):
+        """Shares the given graph with a new pool of worker processes.
+
+        :param graph: the graph to share; it is frozen in the CSR representation if it is not already.
+        :param workers: the number of worker processes; default is the number of CPUs.
+        :return: a pool ready to run ParallelBreadthFirstSearch on the graph.
+        """
+        csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        self._graph = csr
+        self._workers = workers or os.cpu_count() or 1
+        numvertices = csr.num_vertices()
+
+        offsets = array(OFFSET_TYPECODE, csr._offsets)
+        neighbours = array(VERTEX_TYPECODE, csr._neighbours)
+        self._memories = [_share(offsets), _share(neighbours),
+                          _share(array(VERTEX_TYPECODE, [-1]) * numvertices)]
+        self._distance = memoryview(self._memories[2].buf).cast(VERTEX_TYPECODE)[:numvertices]
+
+        layout = [(memory.name, typecode, size) for memory, typecode, size in
+                  zip(self._memories, (OFFSET_TYPECODE, VERTEX_TYPECODE, VERTEX_TYPECODE),
+                      (numvertices + 1, len(neighbours), numvertices))]
+        self._executor = ProcessPoolExecutor(self._workers, initializer=_attach, initargs=(layout,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def workers(self) -> int:
+        """:return: the number of worker processes of this pool."""
+        return self._workers
+
+    def close(self):
+        """Stops the worker processes and frees the shared memory."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._distance.release()
+            for memory in self._memories:
+                memory.close()
+                memory.unlink()
+
+    def _expand(self, frontier):
+        """:return: the (vertex, predecessor) pairs of the unvisited vertexes adjacent to the frontier, in order."""
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(frontier) // (4 * self._workers)))
+        chunks = [frontier[i:i + chunk_size].tobytes() for i in range(0, len(frontier), chunk_size)]
+        for found in self._executor.map(_expand_chunk, chunks):
+            pairs = array(VERTEX_TYPECODE)
+            pairs.frombytes(found)
+            yield from zip(pairs[0::2], pairs[1::2])
+
+
+class ParallelBreadthFirstSearch:
+    """
+    Finds the vertexes connected with the given source vertex and a the shortest path to reach each,
+    expanding the levels of the search in parallel across processes.\n
+    The results are the same of BreadthFirstSearch, including the predecessor of every vertex.
+
+    **Implementation notes**:
+    The search proceeds one level (frontier) at a time. Every large enough frontier is split in chunks
+    that the worker processes expand reading the adjacency data and the distances from shared memory;
+    the calling process then merges the chunks in frontier order, so the first vertex of the frontier reaching
+    an unvisited vertex becomes its predecessor, exactly as in a serial search.
+    """
+
+    def __init__(self, graph, source_vertex: int, workers=None, threshold=PARALLEL_THRESHOLD, pool=None):
+        """Navigate the given Graph from the given source vertex using a parallel Breadth First Search.
+
+        :param graph: the graph we want to navigate.
+        :param source_vertex: the vertex where we start the navigation.
+        :param workers: the number of worker processes; default is the number of CPUs.
+        :param threshold: graphs with less vertexes than this are searched serially, without starting any process.
+        :param pool: a SharedGraphPool for the same graph, to reuse its processes across searches.
+        :return: a ParallelBreadthFirstSearch object to query the graph starting from the given source vertex.
+        """
+        self._source = source_vertex
+        self._predecessor = array(VERTEX_TYPECODE, [-1]) * graph.num_vertices()
+        self._count = 0
+        if pool is not None:
+            self._distance = self._breadth_first_search(graph, pool._distance, pool._expand)
+        elif graph.num_vertices() < threshold or workers == 1:
+            distance = array(VERTEX_TYPECODE, [-1]) * graph.num_vertices()
+            self._distance = self._breadth_first_search(graph, distance, None)
+        else:
+            with SharedGraphPool(graph, workers) as pool:
+                self._distance = self._breadth_first_search(graph, pool._distance, pool._expand)
+
+    def _breadth_first_search(self, graph, distance, parallel_expand):
+        """Runs the search, keeping the distances in the given buffer.
+
+        :return: a private copy of the distances.
+        """
+        distance[:] = array(VERTEX_TYPECODE, [-1]) * len(distance)
+        predecessor = self._predecessor
+        adjacents = graph.adjacents
+
+        source = self._source
+        distance[source] = 0
+        predecessor[source] = source
+        frontier = array(VERTEX_TYPECODE, [source])
+        level = 0
+        while frontier:
+            self._count += len(frontier)
+            level += 1
+            if parallel_expand is None or len(frontier) < MIN_CHUNK_SIZE:
+                found = ((w, v) for v in frontier for w in adjacents(v))
+            else:
+                found = parallel_expand(frontier)
+
+            next_frontier = array(VERTEX_TYPECODE)
+            for w, v in found:
+                if distance[w] == -1:
+                    distance[w] = level
+                    predecessor[w] = v
+                    next_frontier.append(w)
+            frontier = next_frontier
+
+        return array(VERTEX_TYPECODE, distance)
+
+    def connected(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
+        :return: True if the given vertex is connected to the source, False otherwise.
+        """
+        return self._distance[vertex] != -1
+
+    def count(self) -> int:
+        """:return: How many vertexes are connected with the source, including the source in the count."""
+        return self._count
+
+    def path_to(self, vertex: int):
+        """Find a path from the given vertex to the source.
+
+        :param vertex: the vertex to find a path to the source
+        :return: a list with the vertexes to navigate to get to the source if it is connected or None otherwise
+        """
+        path = None
+        if self.connected(vertex):
+            path = []
+            while vertex != self._source:
+                path.append(vertex)
+                vertex = self._predecessor[vertex]
+            path.append(self._source)
+
+        return path
+
+    def distance(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
+        :return: the distance between the given vertex and the source.
+        """
+        d = self._distance[vertex]
+        return d if d != -1 else sys.maxsize
+
+
+def _share(values: array) -> SharedMemory:
+    """:return: a new block of shared memory holding a copy of the given array."""
+    memory = SharedMemory(create=True, size=max(1, len(values) * values.itemsize))
+    memory.buf[:len(values) * values.itemsize] = values.tobytes()
+    return memory
+
+
+# State of a worker process: the shared memory blocks and the typed views over them.
+_worker_memories = None
+_worker_views = None
+
+
+def _attach(layout):
+    """Initializer of the worker processes: maps the shared memory blocks of the pool."""
+    global _worker_memories, _worker_views
+    _worker_memories = [SharedMemory(name=name) for name, _, _ in layout]
+    _worker_views = [memoryview(memory.buf).cast(typecode)[:size]
+                     for memory, (_, typecode, size) in zip(_worker_memories, layout)]
+
+
+def _expand_chunk(chunk: bytes) -> bytes:
+    """Expands a chunk of the frontier in a worker process.
+
+    :return: the (vertex, predecessor) pairs of the unvisited vertexes adjacent to the chunk, flattened in an array.
+    """
+    offsets, neighbours, distance = _worker_views
+    frontier = array(VERTEX_TYPECODE)
+    frontier.frombytes(chunk)
+
+    found = {}
+    for v in frontier:
+        for w in neighbours[offsets[v]:offsets[v + 1]]:
+            if distance[w] == -1 and w not in found:
+                found[w] = v
+
+    pairs = array(VERTEX_TYPECODE)
+    for w, v in found.items():
+        pairs.append(w)
+        pairs.append(v)
+    return pairs.tobytes()
@@ -0,0 +1,138 @@
+"""
+Point to point shortest paths, exploring only the part of the graph needed to connect the two vertexes.
+"""
+
+
+class PointToPointSearch:
+    """
+    Finds a shortest path between a source and a target vertex, stopping as soon as the target is reached.\n
+    The search is bidirectional, growing from both ends, on undirected graphs
+    and on directed graphs that provide the predecessors of a vertex with a predecessors() method.
+
+    **Implementation notes**:
+    The state of the search is kept in dictionaries, so the cost of a query depends on the vertexes explored
+    and not on the size of the graph.
+    The bidirectional search expands a whole level of the smaller frontier at a time;
+    when a level meets the other side it picks, among all the meeting vertexes, the one closest to the other end,
+    which gives a shortest path.
+    """
+
+    def __init__(self, graph, source_vertex: int, target_vertex: int, bidirectional=None):
+        """Searches the shortest path between the given vertexes.
+
+        :param graph: the graph we want to navigate.
+        :param source_vertex: the vertex where the path starts.
+        :param target_vertex: the vertex where the path ends.
+        :param bidirectional: True to search from both ends, False to search from the source only;
+            by default the search is bidirectional when the graph allows it.
+        :return: a PointToPointSearch object to query the path found.
+        """
+        reverse_adjacents = graph.adjacents if not graph.is_directed() else getattr(graph, 'predecessors', None)
+        if bidirectional is None:
+            bidirectional = reverse_adjacents is not None
+        elif bidirectional and reverse_adjacents is None:
+            raise ValueError("A bidirectional search on a directed graph needs the predecessors of its vertexes.")
+
+        self._source = source_vertex
+        self._target = target_vertex
+        self._forward = {source_vertex: source_vertex}
+        self._backward = {}
+        self._meet = None
+        if bidirectional:
+            self._bidirectional_search(graph.adjacents, reverse_adjacents)
+        else:
+            self._search(graph.adjacents)
+
+    def _search(self, adjacents):
+        target = self._target
+        parent = self._forward
+        if self._source == target:
+            self._meet = target
+            return
+        frontier = [self._source]
+        while frontier:
+            level = []
+            for v in frontier:
+                for w in adjacents(v):
+                    if w not in parent:
+                        parent[w] = v
+                        if w == target:
+                            self._meet = target
+                            return
+                        level.append(w)
+            frontier = level
+
+    def _bidirectional_search(self, adjacents, reverse_adjacents):
+        forward_distance = {self._source: 0}
+        self._backward[self._target] = self._target
+        backward_distance = {self._target: 0}
+        forward_frontier = [self._source]
+        backward_frontier = [self._target]
+        if self._source == self._target:
+            self._meet = self._target
+            return
+
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meet = self._expand(forward_frontier, adjacents,
+                                                      self._forward, forward_distance, backward_distance)
+            else:
+                backward_frontier, meet = self._expand(backward_frontier, reverse_adjacents,
+                                                       self._backward, backward_distance, forward_distance)
+            if meet is not None:
+                self._meet = meet
+                return
+
+    @staticmethod
+    def _expand(frontier, adjacents, parent, distance, other_distance):
+        """Expands a whole level of one side of the search.
+
+        :return: the next frontier and the meeting vertex closest to the other end, or None if the sides did not meet.
+        """
+        level = []
+        meet = None
+        d = distance[frontier[0]] + 1
+        for v in frontier:
+            for w in adjacents(v):
+                if w not in parent:
+                    parent[w] = v
+                    distance[w] = d
+                    level.append(w)
+                    if w in other_distance and (meet is None or other_distance[w] < other_distance[meet]):
+                        meet = w
+        return level, meet
+
+    def connected(self) -> bool:
+        """:return: True if the target can be reached from the source, False otherwise."""
+        return self._meet is not None
+
+    def count(self) -> int:
+        """:return: How many vertexes have been explored to answer the query."""
+        return len(self._forward.keys() | self._backward.keys())
+
+    def path(self):
+        """Find a shortest path from the source to the target.
+
+        :return: a list with the vertexes to navigate from the source to the target if connected or None otherwise
+        """
+        if self._meet is None:
+            return None
+
+        path = []
+        vertex = self._meet
+        while vertex != self._source:
+            path.append(vertex)
+            vertex = self._forward[vertex]
+        path.append(self._source)
+        path.reverse()
+
+        vertex = self._meet
+        while vertex != self._target:
+            vertex = self._backward[vertex]
+            path.append(vertex)
+
+        return path
+
+    def distance(self):
+        """:return: the length of a shortest path from the source to the target, None if they are not connected."""
+        return len(self.path()) - 1 if self._meet is not None else None
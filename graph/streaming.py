@@ -0,0 +1,116 @@
+"""
+Streaming reader of edges from iterables, file objects, the standard input and compressed files.
+"""
+
+from array import array
+import bz2
+import gzip
+from itertools import islice
+import lzma
+import os
+import sys
+
+from graph.loader import VERTEX_TYPECODE
+
+
+# How many edges are read and handed over in one batch.
+BATCH_SIZE = 65536
+
+_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+class EdgeReader:
+    """
+    Reads the edges of a graph in batches of bounded size, never holding the whole graph definition in memory.\n
+    The source can be:
+
+     * the name of a file, decompressed on the fly if it ends with .gz, .bz2 or .xz; "-" is the standard input;
+     * a file object opened in text or binary mode;
+     * any other iterable of (vertex1, vertex2) pairs.
+
+    Files contain an edge per line, as two integers separated by blanks; any further column is ignored.
+    The header with the number of vertexes and of edges used by Graph.from_file is optional:
+    when present, it is made available as numvertices and numedges.
+    """
+
+    def __init__(self, source, batch_size: int = BATCH_SIZE):
+        """Prepares to read edges from the given source.
+
+        :param source: a file name, a file object or an iterable of (vertex1, vertex2) pairs.
+        :param batch_size: the maximum number of edges in a batch.
+        :return: an EdgeReader to iterate over for batches of edges.
+        """
+        self._source = source
+        self._batch_size = batch_size
+        self.numvertices = None
+        self.numedges = None
+
+    def __iter__(self):
+        """Reads the edges, in batches.
+
+        :return: a generator of arrays, each holding the two vertexes of every edge of a batch, one edge after the other.
+        """
+        source = self._source
+        if source == '-':
+            yield from self._read_lines(sys.stdin)
+        elif isinstance(source, (str, os.PathLike)):
+            opener = _OPENERS.get(os.path.splitext(os.fspath(source))[1].lower(), open)
+            with opener(source, 'rt') as fh:
+                yield from self._read_lines(fh)
+        elif hasattr(source, 'readline'):
+            yield from self._read_lines(source)
+        else:
+            yield from self._read_pairs(iter(source))
+
+    def _read_pairs(self, pairs):
+        while True:
+            batch = array(VERTEX_TYPECODE)
+            for v, w in islice(pairs, self._batch_size):
+                batch.append(v)
+                batch.append(w)
+            if not batch:
+                return
+            yield batch
+
+    def _read_lines(self, fh):
+        lines = list(islice(fh, self._batch_size))
+        lines = self._read_header(lines, fh)
+        while lines:
+            values = lines[0][:0].join(lines).split()
+            # with 2 values per line on average, every line has exactly 2 values only if none has less than 2
+            if len(values) == 2 * len(lines) and min(map(len, map(type(lines[0]).split, lines))) == 2:
+                batch = array(VERTEX_TYPECODE, map(int, values))
+            else:
+                # blank lines or extra columns: take the first two values of every line
+                batch = array(VERTEX_TYPECODE)
+                for line in lines:
+                    fields = line.split()
+                    if len(fields) == 1:
+                        raise ValueError("Found an edge with a single vertex: " + repr(line))
+                    if fields:
+                        batch.append(int(fields[0]))
+                        batch.append(int(fields[1]))
+            if batch:
+                yield batch
+            lines = list(islice(fh, self._batch_size))
+
+    def _read_header(self, lines, fh):
+        """Consumes the optional header lines with the number of vertexes and edges.
+
+        :return: the lines left, after the header.
+        """
+        header = []
+        while lines and len(header) < 2:
+            fields = lines[0].split()
+            if len(fields) > 1:
+                break
+            if fields:
+                header.append(int(fields[0]))
+            lines.pop(0)
+            if not lines:
+                lines = list(islice(fh, self._batch_size))
+        if header:
+            self.numvertices = header[0]
+        if len(header) > 1:
+            self.numedges = header[1]
+        return lines
@@ -0,0 +1,316 @@
+"""
+Symbol graph: a Graph whose vertexes are named by arbitrary string labels instead of integers.
+"""
+
+from array import array
+import os
+
+from graph.binary import BinaryFormat, release
+from graph.csr import CSRGraph, OFFSET_TYPECODE
+from graph.graph import Graph
+from graph.loader import VERTEX_TYPECODE
+from graph.streaming import BATCH_SIZE, _OPENERS
+
+
+# The suffix of the file holding the label table, next to the binary graph saved by SymbolGraph.save_binary.
+LABELS_SUFFIX = '.labels'
+
+# Binary format of the label table: a header with the number of vertexes followed by V+1 offsets into the labels,
+# the V vertexes sorted by label and then all the labels, UTF-8 encoded, one after the other.
+BINARY_MAGIC = b'LABELTAB'
+BINARY_VERSION = 1
+_FORMAT = BinaryFormat(BINARY_MAGIC, BINARY_VERSION, 'q', OFFSET_TYPECODE + VERTEX_TYPECODE + 'B', "label table")
+
+
+class LabelTable:
+    """
+    Read only, compact map between the labels of the vertexes and their index, as stored on disk.\n
+    It answers label() in constant time and index() in time proportional to log V,
+    without building any dictionary, so a table loaded with a memory map is ready to use at once.
+
+    **Implementation notes**:
+    The labels are kept UTF-8 encoded, one after the other, in a single buffer with an array of offsets,
+    as the adjacents of a CSRGraph; a second array lists the vertexes in order of label, for binary search.
+    """
+
+    def __init__(self, offsets, order, blob):
+        """Creates a table on top of already built buffers.
+
+        Usually you do not call this directly, but get a LabelTable from from_labels() or load_binary().
+
+        :param offsets: a typed buffer with the V+1 offsets of the labels into blob.
+        :param order: a typed buffer with the V vertexes sorted by label.
+        :param blob: a bytes-like object with all the UTF-8 encoded labels, one after the other.
+        """
+        if len(offsets) != len(order) + 1 or offsets[-1] != len(blob):
+            raise ValueError("Offsets do not match the labels.")
+        self._offsets = offsets
+        self._order = order
+        self._blob = blob
+        self._mmap = None
+
+    @classmethod
+    def from_labels(cls, labels):
+        """:return: a table with the given labels, the label of vertex v being labels[v]."""
+        encoded = [label.encode('utf-8') for label in labels]
+        offsets = array(OFFSET_TYPECODE, [0])
+        for label in encoded:
+            offsets.append(offsets[-1] + len(label))
+        order = array(VERTEX_TYPECODE, sorted(range(len(encoded)), key=encoded.__getitem__))
+        return cls(offsets, order, b''.join(encoded))
+
+    @classmethod
+    def load_binary(cls, path: str, mmap=True):
+        """Loads a table saved with save_binary.
+
+        :param path: the name of the file containing the table.
+        :param mmap: True to map the file in memory, False to read it in private buffers.
+        :return: the table stored in the file
+        :rtype: LabelTable
+        """
+        with _FORMAT.open(path, mmap) as reader:
+            numvertices, = reader.fields
+            offsets = reader.section(OFFSET_TYPECODE, numvertices + 1)
+            order = reader.section(VERTEX_TYPECODE, numvertices)
+            blob = reader.section('B', offsets[-1])
+
+        table = cls(offsets, order, blob)
+        table._mmap = reader.mapped
+        return table
+
+    def save_binary(self, path: str):
+        """Saves this table in a versioned binary file, to be loaded back quickly with load_binary.
+
+        :param path: the name of the file to write.
+        :return: None
+        """
+        _FORMAT.save(path, 0, (len(self._order),), (self._offsets, self._order, self._blob))
+
+    def close(self):
+        """Releases the memory mapped file backing this table, if any.
+
+        The table can not be used anymore after closing it.
+        """
+        release(self._mmap, (self._offsets, self._order, self._blob))
+        self._mmap = None
+
+    def __len__(self):
+        return len(self._order)
+
+    def _encoded(self, vertex: int) -> bytes:
+        return bytes(self._blob[self._offsets[vertex]:self._offsets[vertex + 1]])
+
+    def label(self, vertex: int) -> str:
+        """:return: the label of the given vertex."""
+        return self._encoded(vertex).decode('utf-8')
+
+    def index(self, label: str):
+        """:return: the vertex with the given label, None if there is no such label."""
+        encoded = label.encode('utf-8')
+        order = self._order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            current = self._encoded(order[middle])
+            if current == encoded:
+                return order[middle]
+            if current < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+
+class SymbolGraph:
+    """
+    Graph whose vertexes are named by string labels, such as names or UUIDs, with no need to know their number
+    in advance.\n
+    Labels are interned into the dense integer index of an underlying Graph, available with graph(),
+    so that all the search procedures run on integers; the methods taking a search object
+    translate its results back to labels.
+
+    **Implementation notes**:
+    While the graph is built the labels are kept in a list, by vertex, and in a dictionary, by label.
+    A graph saved with save_binary and loaded back is read only: its adjacents are a CSRGraph
+    and its labels a LabelTable, both possibly memory mapped, so that loading it takes no rebuilding.
+    """
+
+    def __init__(self, directed=False, simple=False):
+        """Creates a graph with no vertexes and no edges.
+
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :param simple: True if the graph keeps a single copy of every edge; default is False, i.e. a multigraph.
+        :return: an empty graph
+        :rtype: SymbolGraph
+        """
+        self._graph = Graph(0, directed, simple)
+        self._labels = []
+        self._index = {}
+
+    @classmethod
+    def from_file(cls, filename: str, delimiter: str = None, directed=False, simple=False,
+                  batch_size: int = BATCH_SIZE):
+        """Loads a graph from a file with a line per vertex: the first label of a line is the vertex,
+        the others are its adjacents, i.e. every line "a b c" gives the edges a-b and a-c.
+
+        The file is read in a single pass, in batches of lines; it is decompressed on the fly
+        if its name ends with .gz, .bz2 or .xz. Lines with a single label add an isolated vertex.
+
+        :param filename: the name of the file containing the graph definition.
+        :param delimiter: the string separating the labels; by default any sequence of blanks.
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :param simple: True if the graph keeps a single copy of every edge; default is False, i.e. a multigraph.
+        :param batch_size: the maximum number of edges added in one go.
+        :return: a graph built from the information stored in the file
+        :rtype: SymbolGraph
+        """
+        graph = cls(directed, simple)
+        intern = graph._intern
+        opener = _OPENERS.get(os.path.splitext(os.fspath(filename))[1].lower(), open)
+        endpoints = array(VERTEX_TYPECODE)
+        with opener(filename, 'rt', encoding='utf-8') as fh:
+            for line in fh:
+                labels = line.rstrip('\r\n').split(delimiter)
+                if not labels or not labels[0]:
+                    continue
+                v = intern(labels[0])
+                for label in labels[1:]:
+                    endpoints.append(v)
+                    endpoints.append(intern(label))
+                if len(endpoints) >= 2 * batch_size:
+                    graph._add_endpoints(endpoints)
+                    endpoints = array(VERTEX_TYPECODE)
+        graph._add_endpoints(endpoints)
+        return graph
+
+    @classmethod
+    def load_binary(cls, path: str, mmap=True):
+        """Loads a graph saved with save_binary, in a read only graph.
+
+        :param path: the name of the file containing the graph; its labels are in the same name plus LABELS_SUFFIX.
+        :param mmap: True to map the files in memory, False to read them in private buffers.
+        :return: the graph stored in the files
+        :rtype: SymbolGraph
+        """
+        graph = cls.__new__(cls)
+        graph._graph = CSRGraph.load_binary(path, mmap)
+        graph._labels = LabelTable.load_binary(path + LABELS_SUFFIX, mmap)
+        graph._index = None
+        if len(graph._labels) != graph._graph.num_vertices():
+            raise ValueError("The labels in " + path + LABELS_SUFFIX + " do not match the graph in " + path)
+        return graph
+
+    def save_binary(self, path: str):
+        """Saves this graph in a versioned binary file, and its labels in a second file,
+        to be loaded back quickly with load_binary.
+
+        :param path: the name of the file to write the graph to; the labels go to the same name plus LABELS_SUFFIX.
+        :return: None
+        """
+        self._graph.save_binary(path)
+        labels = self._labels if isinstance(self._labels, LabelTable) else LabelTable.from_labels(self._labels)
+        labels.save_binary(path + LABELS_SUFFIX)
+
+    def close(self):
+        """Releases the memory mapped files backing a graph loaded with load_binary, if any."""
+        if isinstance(self._labels, LabelTable):
+            self._graph.close()
+            self._labels.close()
+
+    def _intern(self, label: str) -> int:
+        vertex = self._index.get(label)
+        if vertex is None:
+            vertex = len(self._labels)
+            self._index[label] = vertex
+            self._labels.append(label)
+        return vertex
+
+    def _add_endpoints(self, endpoints):
+        if len(self._labels) > self._graph.num_vertices():
+            self._graph.add_vertices(len(self._labels) - self._graph.num_vertices())
+        self._graph.add_edges(endpoints)
+
+    def add_edge(self, label1: str, label2: str):
+        """
+        Add an edge connecting the vertexes with the given labels, adding the vertexes if they are new.
+
+        :param label1: the label of the first vertex of the edge being added.
+        :param label2: the label of the second vertex of the edge being added.
+        :return: None
+        """
+        if self._index is None:
+            raise ValueError("A graph loaded from a binary file is read only.")
+        v = self._intern(label1)
+        w = self._intern(label2)
+        self._add_endpoints(array(VERTEX_TYPECODE, (v, w)))
+
+    def graph(self):
+        """:return: the underlying graph, whose vertexes are the indexes of the labels."""
+        return self._graph
+
+    def num_vertices(self) -> int:
+        """:return: the number of vertices of this graph."""
+        return self._graph.num_vertices()
+
+    def num_edges(self) -> int:
+        """:return: the number of edges of this graph."""
+        return self._graph.num_edges()
+
+    def contains(self, label: str) -> bool:
+        """:return: True if there is a vertex with the given label."""
+        return self.index(label) is not None
+
+    def index(self, label: str):
+        """:return: the vertex with the given label, None if there is no such label."""
+        if self._index is None:
+            return self._labels.index(label)
+        return self._index.get(label)
+
+    def label(self, vertex: int) -> str:
+        """:return: the label of the given vertex."""
+        if isinstance(self._labels, LabelTable):
+            return self._labels.label(vertex)
+        return self._labels[vertex]
+
+    def labels(self, vertices):
+        """:return: a list with the labels of the given vertexes, or None if vertices is None."""
+        if vertices is None:
+            return None
+        return [self.label(v) for v in vertices]
+
+    def adjacents(self, label: str) -> list:
+        """:return: a list with the labels of the adjacents of the vertex with the given label."""
+        return self.labels(self._graph.adjacents(self._vertex(label)))
+
+    def _vertex(self, label: str) -> int:
+        vertex = self.index(label)
+        if vertex is None:
+            raise KeyError(label)
+        return vertex
+
+    def path_to(self, search, label: str):
+        """Translates the path found by a search on graph(), e.g. a BreadthFirstSearch, to labels.
+
+        :param search: a search with a path_to(vertex) method, run on graph().
+        :param label: the label of the vertex to find a path to the source of the search.
+        :return: a list with the labels of the vertexes from the given one to the source, or None if the vertex is not connected
+        """
+        return self.labels(search.path_to(self._vertex(label)))
+
+    def group(self, components, label: str) -> str:
+        """Translates the component of a vertex found by a ConnectedComponents or a UnionFind to a label.
+
+        :param components: the ConnectedComponents or UnionFind of graph().
+        :param label: the label of the vertex.
+        :return: the label of the vertex that identifies the component of the given vertex
+        """
+        return self.label(components.group(self._vertex(label)))
+
+    def members(self, components, label: str) -> list:
+        """Translates the members of the component of a vertex found by a ConnectedComponents to labels.
+
+        :param components: the ConnectedComponents of graph().
+        :param label: the label of the vertex.
+        :return: a list with the labels of the vertexes in the same component of the given vertex
+        """
+        return self.labels(components.members(components.group(self._vertex(label))))
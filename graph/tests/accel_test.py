@@ -0,0 +1,63 @@
+import random
+import unittest
+import graph
+import graph.accel
+
+
+class AcceleratedTraversalTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testFactoriesFallBack(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        bfs = graph.accel.breadth_first_search(g, 0)
+        cc = graph.accel.connected_components(g)
+        if graph.accel.HAVE_NUMPY:
+            self.assertIsInstance(bfs, graph.accel.VectorizedBreadthFirstSearch)
+            self.assertIsInstance(cc, graph.accel.VectorizedConnectedComponents)
+        else:
+            self.assertIsInstance(bfs, graph.BreadthFirstSearch)
+            self.assertIsInstance(cc, graph.ConnectedComponents)
+        self.assertEqual(7, bfs.count())
+        self.assertEqual(3, cc.count())
+
+    @unittest.skipUnless(graph.accel.HAVE_NUMPY, "NumPy is not installed.")
+    def testVectorizedBFS(self):
+        rnd = random.Random(5)
+        sparse = graph.Graph(1000)
+        for _ in range(800):
+            sparse.add_edge(rnd.randrange(1000), rnd.randrange(1000))
+
+        for g in (graph.Graph.from_file('mediumG.txt'), graph.Graph.from_file('tinyDG.txt', directed=True), sparse):
+            for source in (0, 7):
+                bfs = graph.BreadthFirstSearch(g, source)
+                vbfs = graph.accel.VectorizedBreadthFirstSearch(g, source)
+                self.assertEqual(bfs.count(), vbfs.count())
+                for v in range(g.num_vertices()):
+                    self.assertEqual(bfs.connected(v), vbfs.connected(v))
+                    self.assertEqual(bfs.distance(v), vbfs.distance(v))
+                    self.assertEqual(bfs.path_to(v), vbfs.path_to(v))
+
+    @unittest.skipUnless(graph.accel.HAVE_NUMPY, "NumPy is not installed.")
+    def testVectorizedConnectedComponents(self):
+        rnd = random.Random(5)
+        sparse = graph.Graph(1000)
+        for _ in range(700):
+            sparse.add_edge(rnd.randrange(1000), rnd.randrange(1000))
+        path = graph.Graph(300)
+        for v in range(299, 0, -1):
+            path.add_edge(v, v - 1)
+
+        for g in (graph.Graph.from_file('tinyG.txt'), graph.Graph.from_file('mediumG.txt'), sparse, path):
+            cc = graph.ConnectedComponents(g)
+            vcc = graph.accel.VectorizedConnectedComponents(g.freeze())
+            self.assertEqual(cc.count(), vcc.count())
+            self.assertEqual(cc.groups(), vcc.groups())
+            self.assertEqual(cc.group_sizes(), vcc.group_sizes())
+            for v in range(g.num_vertices()):
+                self.assertEqual(cc.groupsize(v), vcc.groupsize(v))
+            self.assertEqual(sorted(cc.members(0)), vcc.members(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
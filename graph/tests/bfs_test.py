@@ -1,3 +1,5 @@
+import random
+import sys
 import unittest
 import graph
 
@@ -70,6 +72,52 @@ class BreadthFirstSearchTest(unittest.TestCase):
         self.assertEqual([12, 9, 6, 0], bfs.path_to(12))
         self.assertEqual(3, bfs.distance(12))
 
+    def testDirectionOptimizing(self):
+        rnd = random.Random(11)
+        dense = graph.Graph(500)
+        for _ in range(5000):
+            dense.add_edge(rnd.randrange(500), rnd.randrange(500))
+
+        for g in (graph.Graph.from_file('mediumG.txt'), graph.Graph.from_file('tinyG.txt'), dense, dense.freeze(),
+                  graph.Graph.from_file('tinyDG.txt', directed=True)):
+            bfs = graph.BreadthFirstSearch(g, 0)
+            dobfs = graph.BreadthFirstSearch(g, 0, graph.BreadthFirstSearch.DIRECTION_OPTIMIZING)
+
+            self.assertEqual(bfs.count(), dobfs.count())
+            for v in range(g.num_vertices()):
+                self.assertEqual(bfs.connected(v), dobfs.connected(v))
+                self.assertEqual(bfs.distance(v), dobfs.distance(v))
+                if dobfs.connected(v):
+                    path = dobfs.path_to(v)
+                    self.assertEqual(dobfs.distance(v) + 1, len(path))
+                    for w, u in zip(path, path[1:]):
+                        self.assertTrue(w in g.adjacents(u))
+
+    def testUnknownMode(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        with self.assertRaises(ValueError):
+            graph.BreadthFirstSearch(g, 0, 'sideways')
+
+    def testPathsTo(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        g.add_vertices(1)
+        bfs = graph.BreadthFirstSearch(g, 0)
+        vertices = [123, 246, 0, 250, 17, 123] + list(range(g.num_vertices()))
+
+        self.assertEqual([bfs.path_to(v) for v in vertices], bfs.paths_to(vertices))
+        self.assertEqual([], bfs.paths_to([]))
+
+    def testCompactResults(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        bfs = graph.BreadthFirstSearch(g, 0)
+
+        self.assertIsInstance(bfs._visited, bytearray)
+        self.assertEqual(sys.maxsize, bfs.distance(9))
+        self.assertIs(False, bfs.connected(9))
+        self.assertIs(True, bfs.connected(4))
+        with self.assertRaises(AttributeError):
+            bfs.extra = 1
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,127 @@
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from array import array
+import graph
+from graph.binary import BinaryFormat, FLAG_BIG_ENDIAN, release
+
+
+class BinaryFormatTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'graph.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testRoundTripMapped(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        g.save_binary(self.path)
+        loaded = graph.Graph.load_binary(self.path)
+
+        self.assertIsInstance(loaded, graph.CSRGraph)
+        self.assertEqual(250, loaded.num_vertices())
+        self.assertEqual(1273, loaded.num_edges())
+        self.assertFalse(loaded.is_directed())
+        self.assertEqual(str(g), str(loaded))
+
+        bfs = graph.BreadthFirstSearch(loaded, 0)
+        self.assertEqual([123, 246, 244, 207, 122, 92, 171, 165, 68, 0], bfs.path_to(123))
+        del bfs
+        loaded.close()
+
+    def testRoundTripNotMapped(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        g.save_binary(self.path)
+        loaded = graph.Graph.load_binary(self.path, mmap=False)
+
+        self.assertTrue(loaded.is_directed())
+        self.assertEqual(22, loaded.num_edges())
+        self.assertEqual(str(g), str(loaded))
+
+    def testSaveLoadedGraph(self):
+        graph.Graph.from_file('tinyG.txt').save_binary(self.path)
+        loaded = graph.CSRGraph.load_binary(self.path)
+        other = os.path.join(self.tmpdir, 'other.bin')
+        loaded.save_binary(other)
+        loaded.close()
+
+        with open(self.path, 'rb') as fh1, open(other, 'rb') as fh2:
+            self.assertEqual(fh1.read(), fh2.read())
+
+    def testEmptyGraph(self):
+        graph.Graph(3).save_binary(self.path)
+        loaded = graph.Graph.load_binary(self.path)
+        self.assertEqual(3, loaded.num_vertices())
+        self.assertEqual(0, len(loaded.adjacents(2)))
+        loaded.close()
+
+    def testNotABinaryGraph(self):
+        with open(self.path, 'wb') as fh:
+            fh.write(b'13\n13\n0 5\n4 3\n0 1\n9 12\n6 4\n5 4\n0 2\n11 12\n9 10\n0 6\n')
+        with self.assertRaises(ValueError):
+            graph.Graph.load_binary(self.path)
+
+
+class SectionsTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    FORMAT = BinaryFormat(b'TESTFILE', 3, 'q', 'qi', "test")
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'sections.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def read(self, mmap):
+        with self.FORMAT.open(self.path, mmap) as reader:
+            count, = reader.fields
+            first = reader.section('q', count)
+            second = reader.section('i', 2 * count)
+        return reader, first, second
+
+    def testRoundTrip(self):
+        self.FORMAT.save(self.path, 1, (3,), (array('q', [1, 2, 1 << 40]), array('i', range(-3, 3))))
+        for mmap in (True, False):
+            reader, first, second = self.read(mmap)
+            self.assertEqual(1, reader.flags & 1)
+            self.assertEqual(mmap, reader.mapped is not None)
+            self.assertEqual([1, 2, 1 << 40], list(first))
+            self.assertEqual([-3, -2, -1, 0, 1, 2], list(second))
+            release(reader.mapped, (first, second))
+
+    def testOtherByteOrder(self):
+        other = '>' if sys.byteorder == 'little' else '<'
+        flags = 0 if sys.byteorder == 'big' else FLAG_BIG_ENDIAN
+        with open(self.path, 'wb') as fh:
+            fh.write(struct.pack('<8sIIqII', b'TESTFILE', 3, flags, 2, 8, 4))
+            fh.write(struct.pack(other + 'qqiiii', 7, -1 << 40, 1, 2, -3, 1 << 30))
+        for mmap in (True, False):
+            reader, first, second = self.read(mmap)
+            self.assertIsNone(reader.mapped)
+            self.assertEqual([7, -1 << 40], list(first))
+            self.assertEqual([1, 2, -3, 1 << 30], list(second))
+
+    def testInvalidHeaders(self):
+        headers = [b'TESTFIL',
+                   struct.pack('<8sIIqII', b'OTHERFMT', 3, 0, 0, 8, 4),
+                   struct.pack('<8sIIqII', b'TESTFILE', 4, 0, 0, 8, 4),
+                   struct.pack('<8sIIqII', b'TESTFILE', 3, 0, 0, 4, 4)]
+        for header in headers:
+            with open(self.path, 'wb') as fh:
+                fh.write(header)
+            with self.assertRaises(ValueError):
+                self.FORMAT.open(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
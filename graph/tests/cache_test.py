@@ -0,0 +1,90 @@
+import sys
+import unittest
+import graph
+
+
+class SearchCacheTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testSameAsBFS(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        cache = graph.SearchCache(g)
+        bfs = graph.BreadthFirstSearch(g, 0)
+
+        self.assertEqual([123, 246, 244, 207, 122, 92, 171, 165, 68, 0], cache.path_to(0, 123))
+        for v in range(g.num_vertices()):
+            self.assertEqual(bfs.distance(v), cache.distance(0, v))
+            self.assertEqual(bfs.path_to(v), cache.path_to(0, v))
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(2 * g.num_vertices(), cache.hits)
+
+    def testUnreached(self):
+        cache = graph.SearchCache(graph.Graph.from_file('tinyG.txt').freeze())
+
+        self.assertFalse(cache.connected(0, 9))
+        self.assertIsNone(cache.path_to(0, 9))
+        self.assertEqual(sys.maxsize, cache.distance(0, 9))
+        self.assertTrue(cache.connected(9, 12))
+
+    def testLeastRecentlyUsedEviction(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        size = 2 * g.num_vertices() * 4
+        cache = graph.SearchCache(g, budget=2 * size)
+
+        cache.distance(0, 1)
+        cache.distance(7, 8)
+        cache.distance(0, 2)
+        cache.distance(9, 10)
+        self.assertEqual(1, cache.evictions)
+        self.assertTrue(cache.cached(0))
+        self.assertFalse(cache.cached(7))
+        self.assertTrue(cache.cached(9))
+        self.assertEqual(2 * size, cache.memory())
+
+        tiny = graph.SearchCache(g, budget=size - 1)
+        self.assertEqual(1, tiny.distance(0, 1))
+        self.assertFalse(tiny.cached(0))
+        self.assertEqual(0, tiny.memory())
+
+    def testInvalidatedByChanges(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        cache = graph.SearchCache(g)
+        self.assertEqual(sys.maxsize, cache.distance(0, 9))
+        self.assertEqual(1, cache.distance(7, 8))
+
+        g.add_edge(3, 9)
+        self.assertFalse(cache.cached(0))
+        self.assertTrue(cache.cached(7))
+        self.assertEqual([9, 3, 5, 0], cache.path_to(0, 9))
+
+        g.add_edge(1, 2)
+        self.assertTrue(cache.cached(0))
+        g.remove_edge(7, 8)
+        self.assertFalse(cache.cached(7))
+        self.assertFalse(cache.connected(7, 8))
+
+        g.add_vertices(2)
+        self.assertEqual(sys.maxsize, cache.distance(0, 14))
+        self.assertTrue(cache.cached(0))
+
+        cache.close()
+        g.add_edge(0, 14)
+        self.assertFalse(cache.cached(0))
+
+    def testDirected(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        cache = graph.SearchCache(g)
+        bfs = graph.BreadthFirstSearch(g, 0)
+        for v in range(g.num_vertices()):
+            self.assertEqual(bfs.distance(v), cache.distance(0, v))
+
+        g.add_edge(7, 0)
+        self.assertTrue(cache.cached(0))
+        g.add_edge(0, 3)
+        self.assertFalse(cache.cached(0))
+        self.assertEqual(1, cache.distance(0, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
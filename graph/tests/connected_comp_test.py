@@ -46,6 +46,41 @@ class ConnectedComponentsTest(unittest.TestCase):
         print("Groups      are:", cc._group)
         print("Group sizes are:", cc._group_size)
 
+    def testBulkAccessors(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        cc = graph.ConnectedComponents(g)
+
+        groups = cc.groups()
+        self.assertEqual(13, len(groups))
+        self.assertEqual({0: 7, 7: 2, 9: 4}, cc.group_sizes())
+        self.assertEqual([0, 1, 2, 3, 4, 5, 6], sorted(cc.members(0)))
+        self.assertEqual([7, 8], sorted(cc.members(cc.group(8))))
+        self.assertEqual([9, 10, 11, 12], sorted(cc.members(groups[12])))
+        with self.assertRaises(ValueError):
+            cc.members(1)
+
+    def testManySingletons(self):
+        n = 100000
+        g = graph.Graph(n)
+        g.add_edge(n - 2, n - 1)
+        cc = graph.ConnectedComponents(g)
+
+        self.assertEqual(n - 1, cc.count())
+        self.assertTrue(cc.connected(n - 2, n - 1))
+        self.assertFalse(cc.connected(0, 1))
+        self.assertEqual(1, cc.groupsize(0))
+        self.assertEqual(2, cc.groupsize(n - 1))
+        self.assertEqual([n - 2, n - 1], cc.members(n - 2))
+
+    def testCompactResults(self):
+        cc = graph.ConnectedComponents(graph.Graph.from_file('tinyG.txt'))
+
+        self.assertIsInstance(cc.groups(), list)
+        self.assertIsInstance(cc.members(9), list)
+        self.assertEqual(4, cc.groupsize(10))
+        with self.assertRaises(AttributeError):
+            cc.extra = 1
+
 
 if __name__ == '__main__':
     unittest.main()
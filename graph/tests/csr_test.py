@@ -0,0 +1,77 @@
+import unittest
+import graph
+
+
+class CSRGraphTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testFreezeEmptyGraph(self):
+        csr = graph.Graph(5).freeze()
+        self.assertEqual(5, csr.num_vertices())
+        self.assertEqual(0, csr.num_edges())
+        self.assertEqual(0, len(csr.adjacents(0)))
+        self.assertTrue("0 => []" in str(csr))
+
+    def testFreezeSimpleGraph(self):
+        g = graph.Graph(5)
+        g.add_edge(1, 3)
+        g.add_edge(2, 1)
+        g.add_edge(3, 3)
+        g.add_edge(4, 4)
+        csr = g.freeze()
+
+        self.assertEqual(4, csr.num_edges())
+        self.assertFalse(csr.is_directed())
+        for v in range(g.num_vertices()):
+            self.assertEqual(list(g.adjacents(v)), list(csr.adjacents(v)))
+            self.assertEqual(len(g.adjacents(v)), csr.degree(v))
+        self.assertTrue(3 in csr.adjacents(3))
+        self.assertEqual(str(g), str(csr))
+
+    def testFreezeDirected(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        csr = g.freeze()
+
+        self.assertTrue(csr.is_directed())
+        self.assertEqual(13, csr.num_vertices())
+        self.assertEqual(22, csr.num_edges())
+        self.assertTrue(1 in csr.adjacents(0))
+        self.assertFalse(2 in csr.adjacents(0))
+
+    def testSearchesOnFrozenGraph(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        csr = g.freeze()
+
+        dfs = graph.DepthFirstSearch(g, 0)
+        csr_dfs = graph.DepthFirstSearch(csr, 0)
+        self.assertEqual(dfs.count(), csr_dfs.count())
+        self.assertEqual(dfs.path_to(123), csr_dfs.path_to(123))
+
+        bfs = graph.BreadthFirstSearch(csr, 0)
+        self.assertEqual(9, bfs.distance(123))
+        self.assertEqual([123, 246, 244, 207, 122, 92, 171, 165, 68, 0], bfs.path_to(123))
+
+        cc = graph.ConnectedComponents(graph.Graph.from_file('tinyG.txt').freeze())
+        self.assertEqual(3, cc.count())
+        self.assertTrue(cc.connected(9, 12))
+
+    def testPredecessors(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        csr = g.freeze()
+        for v in range(g.num_vertices()):
+            self.assertEqual(sorted(g.predecessors(v)), list(csr.predecessors(v)))
+            self.assertEqual(g.in_degree(v), csr.in_degree(v))
+            self.assertEqual(sorted(g.reverse().adjacents(v)), sorted(csr.reverse().adjacents(v)))
+
+        undirected = graph.Graph.from_file('tinyG.txt').freeze()
+        self.assertIs(undirected, undirected.reverse())
+        self.assertEqual(list(undirected.adjacents(5)), list(undirected.predecessors(5)))
+
+    def testMismatchedBuffers(self):
+        with self.assertRaises(ValueError):
+            graph.CSRGraph([0, 1, 3], [1, 0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
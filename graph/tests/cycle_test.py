@@ -0,0 +1,121 @@
+import random
+import unittest
+import graph
+
+
+class CycleDetectorTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def assertCycle(self, g, cycle):
+        self.assertEqual(cycle[0], cycle[-1])
+        for v, w in zip(cycle, cycle[1:]):
+            self.assertTrue(w in g.adjacents(v))
+
+    def testTinyGraph(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        cd = graph.CycleDetector(g)
+
+        self.assertTrue(cd.has_cycle())
+        self.assertCycle(g, cd.cycle())
+        self.assertFalse(cd.is_bipartite())
+        odd = cd.odd_cycle()
+        self.assertCycle(g, odd)
+        self.assertEqual(1, (len(odd) - 1) % 2)
+        self.assertEqual([(0, 1), (0, 2), (7, 8), (9, 10)], sorted(tuple(sorted(e)) for e in cd.bridges()))
+        self.assertEqual([0, 9], cd.articulation_points())
+        self.assertFalse(cd.is_biconnected())
+
+    def testForest(self):
+        g = graph.Graph(6)
+        for v, w in [(0, 1), (1, 2), (1, 3), (4, 5)]:
+            g.add_edge(v, w)
+        cd = graph.CycleDetector(g)
+
+        self.assertFalse(cd.has_cycle())
+        self.assertIsNone(cd.cycle())
+        self.assertTrue(cd.is_bipartite())
+        self.assertIsNone(cd.odd_cycle())
+        for v in range(g.num_vertices()):
+            for w in g.adjacents(v):
+                self.assertNotEqual(cd.color(v), cd.color(w))
+        self.assertEqual(4, len(cd.bridges()))
+        self.assertEqual([1], cd.articulation_points())
+
+    def testSelfLoop(self):
+        g = graph.Graph(3)
+        g.add_edge(0, 1)
+        g.add_edge(1, 1)
+        g.add_edge(1, 2)
+        cd = graph.CycleDetector(g)
+
+        self.assertEqual([1, 1], cd.cycle())
+        self.assertEqual([1, 1], cd.odd_cycle())
+        self.assertEqual(2, len(cd.bridges()))
+
+    def testParallelEdges(self):
+        g = graph.Graph(3)
+        g.add_edge(0, 1)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        cd = graph.CycleDetector(g)
+
+        self.assertEqual([1, 0, 1], cd.cycle())
+        self.assertTrue(cd.is_bipartite())
+        self.assertEqual([(1, 2)], cd.bridges())
+        self.assertEqual([1], cd.articulation_points())
+
+        simple = graph.Graph(3, simple=True)
+        simple.add_edge(0, 1)
+        simple.add_edge(0, 1)
+        self.assertFalse(graph.CycleDetector(simple).has_cycle())
+
+    def testEvenCycle(self):
+        g = graph.Graph(4)
+        for v in range(4):
+            g.add_edge(v, (v + 1) % 4)
+        cd = graph.CycleDetector(g.freeze())
+
+        self.assertEqual(5, len(cd.cycle()))
+        self.assertTrue(cd.is_bipartite())
+        self.assertEqual([], cd.bridges())
+        self.assertTrue(cd.is_biconnected())
+
+    def testRandomGraphs(self):
+        rnd = random.Random(17)
+        for _ in range(30):
+            numvertices = rnd.randint(1, 12)
+            edges = [(rnd.randrange(numvertices), rnd.randrange(numvertices)) for _ in range(rnd.randint(0, 14))]
+            g = graph.Graph(numvertices)
+            for v, w in edges:
+                g.add_edge(v, w)
+            cd = graph.CycleDetector(g)
+            count = graph.ConnectedComponents(g).count()
+
+            self.assertEqual(len(edges) > numvertices - count, cd.has_cycle())
+            bridges = set()
+            for i, (v, w) in enumerate(edges):
+                h = graph.Graph(numvertices)
+                for x, y in edges[:i] + edges[i + 1:]:
+                    h.add_edge(x, y)
+                if not graph.ConnectedComponents(h).connected(v, w):
+                    bridges.add((min(v, w), max(v, w)))
+            self.assertEqual(bridges, set((min(v, w), max(v, w)) for v, w in cd.bridges()))
+
+            articulation = []
+            for a in range(numvertices):
+                h = graph.Graph(numvertices)
+                for x, y in edges:
+                    if a not in (x, y):
+                        h.add_edge(x, y)
+                if graph.ConnectedComponents(h).count() - 1 > count:
+                    articulation.append(a)
+            self.assertEqual(articulation, cd.articulation_points())
+
+    def testDirected(self):
+        with self.assertRaises(ValueError):
+            graph.CycleDetector(graph.Graph(2, directed=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
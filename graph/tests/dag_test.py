@@ -0,0 +1,116 @@
+import random
+import time
+import unittest
+import graph
+from graph import dag
+
+
+class TopologicalSortTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testOrder(self):
+        g = graph.Graph.from_file('tinyDAG.txt', directed=True)
+        ts = graph.TopologicalSort(g)
+
+        self.assertTrue(ts.is_dag())
+        self.assertIsNone(ts.cycle())
+        order = ts.order()
+        self.assertEqual(list(range(g.num_vertices())), sorted(order))
+        for v in range(g.num_vertices()):
+            self.assertEqual(v, order[ts.rank(v)])
+            for w in g.adjacents(v):
+                self.assertLess(ts.rank(v), ts.rank(w))
+
+    def testCycle(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        ts = graph.TopologicalSort(g)
+
+        self.assertFalse(ts.is_dag())
+        self.assertIsNone(ts.order())
+        self.assertIsNone(ts.rank(0))
+        cycle = ts.cycle()
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(len(cycle) - 1, len(set(cycle)))
+        for v, w in zip(cycle, cycle[1:]):
+            self.assertTrue(w in g.adjacents(v))
+        with self.assertRaises(ValueError):
+            ts.critical_path()
+        with self.assertRaises(ValueError):
+            ts.reachable_counts()
+
+    def testSelfLoop(self):
+        g = graph.Graph(3, directed=True)
+        g.add_edge(0, 1)
+        g.add_edge(1, 1)
+        g.add_edge(1, 2)
+        ts = graph.TopologicalSort(g)
+
+        self.assertFalse(ts.is_dag())
+        self.assertEqual([1, 1], ts.cycle())
+
+    def testCriticalPath(self):
+        g = graph.Graph(6, directed=True)
+        for v, w in [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (2, 5)]:
+            g.add_edge(v, w)
+        ts = graph.TopologicalSort(g)
+
+        self.assertEqual(4, len(ts.longest_path()))
+        self.assertEqual(0, ts.longest_path()[0])
+        self.assertEqual(4, ts.longest_path()[-1])
+        self.assertEqual((13, [0, 1, 3, 4]), ts.critical_path([1, 5, 2, 3, 4, 1]))
+        self.assertEqual((12, [0, 2, 5]), ts.critical_path([1, 1, 1, 1, 1, 10]))
+
+        self.assertEqual((0, []), graph.TopologicalSort(graph.Graph(0, directed=True)).critical_path())
+
+    def testReachableCounts(self):
+        g = graph.Graph.from_file('tinyDAG.txt', directed=True)
+        g.add_edge(0, 6)
+        counts = graph.TopologicalSort(g).reachable_counts()
+        for v in range(g.num_vertices()):
+            self.assertEqual(graph.BreadthFirstSearch(g, v).count() - 1, counts[v])
+
+    def testReachableCountsRandom(self):
+        rnd = random.Random(13)
+        for _ in range(20):
+            n = rnd.randint(1, 40)
+            labels = list(range(n))
+            rnd.shuffle(labels)
+            g = graph.Graph(n, directed=True)
+            for _ in range(rnd.randint(0, 3 * n)):
+                v, w = sorted(rnd.sample(range(n), 2)) if n > 1 else (0, 0)
+                if v != w:
+                    g.add_edge(labels[v], labels[w])
+            counts = graph.TopologicalSort(g).reachable_counts()
+            for v in range(n):
+                self.assertEqual(graph.BreadthFirstSearch(g, v).count() - 1, counts[v])
+
+    def testReachableCountsScaling(self):
+        def best_time(n):
+            h = n // 2
+            g = graph.Graph(n, directed=True)
+            g.add_edges([(i, i + h) for i in range(h)])
+            ts = graph.TopologicalSort(g)
+            best = None
+            for _ in range(3):
+                start = time.perf_counter()
+                self.assertEqual(h, sum(ts.reachable_counts()))
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            return best
+
+        # a sparse DAG, where every vertex reaches at most one other: 8 times the vertexes, about 8 times the time
+        self.assertLess(best_time(160000), 24 * best_time(20000))
+
+    def testBitCount(self):
+        for bits in (0, 1, 6, (1 << 100) - 1, 1 << 1000 | 5):
+            self.assertEqual(dag._bin_count(bits), dag._bit_count(bits))
+        self.assertEqual(101, dag._bin_count((1 << 101) - 1))
+
+    def testUndirected(self):
+        with self.assertRaises(ValueError):
+            graph.TopologicalSort(graph.Graph.from_file('tinyG.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
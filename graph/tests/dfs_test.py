@@ -95,6 +95,44 @@ class DepthFirstSearchTest(unittest.TestCase):
         self.assertEqual([4, 6, 0], dfs.path_to(4))     # or [4, 5, 0]
         self.assertEqual([12, 9, 6, 0], dfs.path_to(12))  # or [12, 11, 9, 6, 0]
 
+    def testLongPath(self):
+        n = 20000   # far beyond the default recursion limit
+        g = graph.Graph(n)
+        for v in range(n - 1):
+            g.add_edge(v, v + 1)
+        dfs = graph.DepthFirstSearch(g, 0)
+        self.assertEqual(n, dfs.count())
+        self.assertTrue(dfs.connected(n - 1))
+        self.assertEqual(n, len(dfs.path_to(n - 1)))
+
+    def testSamePredecessorsAsRecursiveSearch(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        visited = [False] * g.num_vertices()
+        predecessor = [-1] * g.num_vertices()
+
+        def recursive_dfs(vertex):
+            visited[vertex] = True
+            for w in g.adjacents(vertex):
+                if not visited[w]:
+                    predecessor[w] = vertex
+                    recursive_dfs(w)
+
+        predecessor[0] = 0
+        recursive_dfs(0)
+        dfs = graph.DepthFirstSearch(g, 0)
+        self.assertEqual(visited, list(dfs._visited))
+        self.assertEqual(predecessor, list(dfs._predecessor))
+
+    def testPathsTo(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        dfs = graph.DepthFirstSearch(g, 0)
+        vertices = list(range(g.num_vertices())) + [4, 3]
+
+        self.assertEqual([dfs.path_to(v) for v in vertices], dfs.paths_to(vertices))
+        paths = dfs.paths_to([3, 4])
+        paths[1].append(-1)
+        self.assertEqual(dfs.path_to(3), paths[0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import graph
+
+
+class StronglyConnectedComponentsTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testTinyDG(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        scc = graph.StronglyConnectedComponents(g)
+
+        self.assertEqual(5, scc.count())
+        self.assertTrue(scc.connected(0, 4))
+        self.assertTrue(scc.connected(2, 5))
+        self.assertTrue(scc.connected(9, 12))
+        self.assertTrue(scc.connected(6, 8))
+        self.assertFalse(scc.connected(0, 1))
+        self.assertFalse(scc.connected(6, 7))
+        self.assertFalse(scc.connected(0, 9))
+
+        self.assertEqual(5, scc.groupsize(3))
+        self.assertEqual(4, scc.groupsize(11))
+        self.assertEqual(1, scc.groupsize(7))
+        self.assertEqual([0, 2, 3, 4, 5], scc.members(scc.group(0)))
+        self.assertEqual(13, sum(scc.group_sizes().values()))
+        self.assertEqual(13, len(scc.groups()))
+        with self.assertRaises(ValueError):
+            scc.members(5)
+
+    def testComponentsInTopologicalOrder(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        scc = graph.StronglyConnectedComponents(g)
+        for v in range(g.num_vertices()):
+            for w in g.adjacents(v):
+                self.assertTrue(scc.group(v) <= scc.group(w))
+        self.assertEqual(0, scc.group(7))     # 7 is the only source
+        self.assertEqual(4, scc.group(1))     # 1 is the only sink
+
+    def testCondensation(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        scc = graph.StronglyConnectedComponents(g)
+        dag = scc.condensation()
+
+        self.assertTrue(dag.is_directed())
+        self.assertEqual(5, dag.num_vertices())
+        self.assertEqual(graph.StronglyConnectedComponents(dag).count(), 5)
+        self.assertTrue(dag.has_edge(scc.group(7), scc.group(6)))
+        self.assertTrue(dag.has_edge(scc.group(0), scc.group(1)))
+        self.assertFalse(dag.has_edge(scc.group(1), scc.group(0)))
+        self.assertEqual(6, dag.num_edges())
+
+    def testDAGAndLongCycle(self):
+        dag = graph.Graph.from_file('tinyDAG.txt', directed=True)
+        self.assertEqual(13, graph.StronglyConnectedComponents(dag).count())
+
+        n = 50000
+        cycle = graph.Graph(n, directed=True)
+        for v in range(n):
+            cycle.add_edge(v, (v + 1) % n)
+        scc = graph.StronglyConnectedComponents(cycle)
+        self.assertEqual(1, scc.count())
+        self.assertEqual(n, scc.groupsize(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
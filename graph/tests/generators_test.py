@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+import graph
+from graph import generators
+
+
+class GeneratorsTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'graph.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testSeeded(self):
+        self.assertEqual(generators.erdos_renyi(100, 300, 7), generators.erdos_renyi(100, 300, 7))
+        self.assertNotEqual(generators.erdos_renyi(100, 300, 7), generators.erdos_renyi(100, 300, 8))
+        self.assertEqual(generators.preferential_attachment(100, 2, 7), generators.preferential_attachment(100, 2, 7))
+        self.assertEqual(generators.components(10, 5, 7), generators.components(10, 5, 7))
+
+    def testErdosRenyi(self):
+        numvertices, endpoints = generators.erdos_renyi(100, 300, 1)
+        self.assertEqual(100, numvertices)
+        self.assertEqual(600, len(endpoints))
+        self.assertTrue(all(0 <= v < 100 for v in endpoints))
+
+    def testPreferentialAttachment(self):
+        numvertices, endpoints = generators.preferential_attachment(1000, 3, 1)
+        g = graph.Graph(numvertices, simple=True)
+        g.add_edges(endpoints)
+
+        self.assertEqual(3 * (1000 - 3), g.num_edges())
+        self.assertEqual(1, graph.ConnectedComponents(g).count())
+        degrees = sorted((len(g.adjacents(v)) for v in range(numvertices)), reverse=True)
+        self.assertEqual(3, degrees[-1])
+        self.assertGreater(degrees[0], 10 * degrees[numvertices // 2])
+
+    def testGridAndPath(self):
+        numvertices, endpoints = generators.grid(3, 4)
+        self.assertEqual(12, numvertices)
+        self.assertEqual(3 * 3 + 2 * 4, len(endpoints) // 2)
+
+        numvertices, endpoints = generators.path(5)
+        self.assertEqual([0, 1, 1, 2, 2, 3, 3, 4], list(endpoints))
+        self.assertEqual(0, len(generators.path(1)[1]))
+
+    def testComponents(self):
+        numvertices, endpoints = generators.components(20, 7, 3)
+        g = graph.Graph(numvertices)
+        g.add_edges(endpoints)
+        cc = graph.ConnectedComponents(g)
+
+        self.assertEqual(140, numvertices)
+        self.assertEqual(20, cc.count())
+        self.assertEqual({7}, set(cc.group_sizes().values()))
+
+    def testWriteEdgeList(self):
+        numvertices, endpoints = generators.erdos_renyi(50, 120, 5)
+        generators.write_edge_list(self.path, numvertices, endpoints)
+        g = graph.Graph.from_file(self.path)
+
+        self.assertEqual(50, g.num_vertices())
+        self.assertEqual(120, g.num_edges())
+        expected = graph.Graph(numvertices)
+        expected.add_edges(endpoints)
+        self.assertEqual(str(expected), str(g))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -130,6 +130,127 @@ class GraphTest(unittest.TestCase):
         self.assertTrue(6 in g.adjacents(7))
         self.assertTrue(7 in g.adjacents(8))
 
+    # Simple graphs
+    def testSimpleGraphDoubleEdge(self):
+        g = graph.Graph(5, simple=True)
+        g.add_edge(1, 3)
+        g.add_edge(1, 3)
+        g.add_edge(3, 1)
+
+        self.assertTrue(g.is_simple())
+        self.assertEqual(1, g.num_edges())
+        self.assertEqual(1, len(g.adjacents(1)))
+        self.assertEqual(1, len(g.adjacents(3)))
+        self.assertTrue(g.has_edge(1, 3))
+        self.assertTrue(g.has_edge(3, 1))
+        self.assertFalse(g.has_edge(1, 2))
+
+    def testSimpleGraphSelfEdge(self):
+        g = graph.Graph(5, simple=True)
+        g.add_edge(3, 3)
+        g.add_edge(3, 3)
+
+        self.assertEqual(1, g.num_edges())
+        self.assertEqual(1, len(g.adjacents(3)))
+        self.assertTrue("3 => [3]" in str(g))
+        g.remove_edge(3, 3)
+        self.assertEqual(0, g.num_edges())
+        self.assertFalse(g.has_edge(3, 3))
+
+    def testSimpleDirectedGraph(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True, simple=True)
+        self.assertEqual(22, g.num_edges())
+        g.add_edge(0, 1)
+        self.assertEqual(22, g.num_edges())
+        self.assertTrue(g.has_edge(0, 1))
+        self.assertFalse(g.has_edge(1, 0))
+
+        g.add_edges([(1, 0), (0, 1), (1, 0)])
+        self.assertEqual(23, g.num_edges())
+        g.remove_edge(0, 1)
+        self.assertFalse(g.has_edge(0, 1))
+        self.assertTrue(g.has_edge(1, 0))
+        self.assertEqual(22, g.num_edges())
+
+    def testSimpleGraphSearches(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        simple = graph.Graph.from_file('mediumG.txt', simple=True)
+        self.assertEqual(str(g), str(simple))
+        self.assertEqual(graph.BreadthFirstSearch(g, 0).path_to(123), graph.BreadthFirstSearch(simple, 0).path_to(123))
+        self.assertEqual(graph.DepthFirstSearch(g, 0).path_to(123), graph.DepthFirstSearch(simple, 0).path_to(123))
+        self.assertEqual(str(g), str(simple.freeze()))
+
+    def testRemoveEdge(self):
+        g = graph.Graph(5)
+        uf = graph.UnionFind.from_graph(g, attach=True)
+        g.add_edge(1, 3)
+        g.add_edge(1, 3)
+        g.add_edge(2, 2)
+
+        g.remove_edge(3, 1)
+        self.assertEqual(2, g.num_edges())
+        self.assertEqual([3], g.adjacents(1))
+        self.assertEqual([1], g.adjacents(3))
+        self.assertTrue(uf.connected(1, 3))
+
+        g.remove_edge(1, 3)
+        self.assertFalse(g.has_edge(1, 3))
+        self.assertFalse(uf.connected(1, 3))
+        self.assertEqual(5, uf.count())
+
+        g.remove_edge(2, 2)
+        self.assertEqual([], g.adjacents(2))
+        self.assertEqual(0, g.num_edges())
+        with self.assertRaises(ValueError):
+            g.remove_edge(1, 3)
+
+    # Reverse adjacency
+    def testPredecessors(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        self.assertEqual([2, 6], sorted(g.predecessors(0)))
+        self.assertEqual(2, g.in_degree(0))
+
+        g.add_edge(8, 0)
+        g.add_edges([(9, 0)])
+        self.assertEqual([2, 6, 8, 9], sorted(g.predecessors(0)))
+        g.remove_edge(2, 0)
+        self.assertEqual([6, 8, 9], sorted(g.predecessors(0)))
+        g.add_vertices(1)
+        g.add_edge(0, 13)
+        self.assertEqual([0], g.predecessors(13))
+
+        for v in range(g.num_vertices()):
+            expected = [w for w in range(g.num_vertices()) for x in g.adjacents(w) if x == v]
+            self.assertEqual(sorted(expected), sorted(g.predecessors(v)))
+
+    def testPredecessorsUndirected(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        self.assertIs(g.adjacents(5), g.predecessors(5))
+        self.assertEqual(3, g.in_degree(5))
+
+    def testReverse(self):
+        for simple in (False, True):
+            g = graph.Graph.from_file('tinyDAG.txt', directed=True, simple=simple)
+            r = g.reverse()
+
+            self.assertTrue(r.is_directed())
+            self.assertEqual(simple, r.is_simple())
+            self.assertEqual(g.num_edges(), r.num_edges())
+            for v in range(g.num_vertices()):
+                for w in g.adjacents(v):
+                    self.assertTrue(r.has_edge(w, v))
+            rr = r.reverse()
+            for v in range(g.num_vertices()):
+                self.assertEqual(sorted(g.adjacents(v)), sorted(rr.adjacents(v)))
+
+        g = graph.Graph.from_file('tinyG.txt')
+        self.assertEqual(str(g), str(g.reverse()))
+
+    def testBidirectionalSearchOnDirectedGraph(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        search = graph.PointToPointSearch(g, 0, 2, bidirectional=True)
+        self.assertEqual(3, search.distance())
+
 
 if __name__ == '__main__':
     unittest.main()
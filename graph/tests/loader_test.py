@@ -0,0 +1,58 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+import graph
+from graph.loader import read_edge_list
+
+
+class LoaderTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testReadEdgeList(self):
+        numvertices, numedges, endpoints = read_edge_list('tinyG.txt')
+
+        self.assertEqual(13, numvertices)
+        self.assertEqual(13, numedges)
+        self.assertEqual(26, len(endpoints))
+        self.assertEqual([0, 5, 4, 3], list(endpoints[:4]))
+
+    def testReadEdgeListSmallChunks(self):
+        expected = read_edge_list('mediumG.txt')
+        for chunk_size in (1, 7, 100):
+            self.assertEqual(expected, read_edge_list('mediumG.txt', chunk_size))
+
+    def testReadEdgeListSmallFileSmallBuffer(self):
+        tracemalloc.start()
+        try:
+            read_edge_list('tinyG.txt', 1 << 24)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1 << 16)
+
+    def testReadEdgeListOddVertexes(self):
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as fh:
+            fh.write("3\n2\n0 1\n2\n")
+        try:
+            with self.assertRaises(ValueError):
+                read_edge_list(filename)
+        finally:
+            os.remove(filename)
+
+    def testCSRFromFile(self):
+        for filename, directed in (('tinyG.txt', False), ('mediumG.txt', False),
+                                   ('tinyDG.txt', True), ('tinyDAG.txt', True)):
+            g = graph.Graph.from_file(filename, directed)
+            csr = graph.CSRGraph.from_file(filename, directed)
+
+            self.assertEqual(g.num_vertices(), csr.num_vertices())
+            self.assertEqual(g.num_edges(), csr.num_edges())
+            self.assertEqual(directed, csr.is_directed())
+            self.assertEqual(str(g), str(csr))
+
+
+if __name__ == '__main__':
+    unittest.main()
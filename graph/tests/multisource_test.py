@@ -0,0 +1,51 @@
+import sys
+import unittest
+import graph
+
+
+class MultiSourceBreadthFirstSearchTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testSingleSourceSameAsBFS(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        bfs = graph.BreadthFirstSearch(g, 0)
+        msbfs = graph.MultiSourceBreadthFirstSearch(g, 0)
+
+        self.assertEqual(bfs.count(), msbfs.count())
+        self.assertEqual([123, 246, 244, 207, 122, 92, 171, 165, 68, 0], msbfs.path_to(123))
+        for v in range(g.num_vertices()):
+            self.assertEqual(bfs.distance(v), msbfs.distance(v))
+            self.assertEqual(0, msbfs.source(v))
+
+    def testMultiSource(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        msbfs = graph.MultiSourceBreadthFirstSearch(g, [3, 7])
+
+        self.assertEqual(9, msbfs.count())
+        self.assertEqual(3, msbfs.source(4))
+        self.assertEqual(1, msbfs.distance(4))
+        self.assertEqual(7, msbfs.source(8))
+        self.assertEqual([0, 5, 3], msbfs.path_to(0))
+        self.assertEqual(2, msbfs.distance(0))
+        self.assertFalse(msbfs.connected(9))
+        self.assertIsNone(msbfs.source(9))
+        self.assertIsNone(msbfs.path_to(9))
+        self.assertEqual(sys.maxsize, msbfs.distance(9))
+
+    def testBatchReusesBuffers(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        msbfs = graph.MultiSourceBreadthFirstSearch(g)
+
+        counts = [search.count() for search in msbfs.searches([0, 9, 7, [0, 9]])]
+        self.assertEqual([7, 4, 2, 11], counts)
+
+        msbfs.search(8)
+        self.assertEqual([7, 8], sorted(msbfs.reached()))
+        self.assertFalse(msbfs.connected(0))
+        self.assertFalse(msbfs.connected(9))
+        self.assertEqual([7, 8], msbfs.path_to(7))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import graph
+
+
+class LandmarkIndexTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'landmarks.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def assertExact(self, g, index):
+        for s in range(g.num_vertices()):
+            bfs = graph.BreadthFirstSearch(g, s)
+            for t in range(g.num_vertices()):
+                self.assertLessEqual(index.lower_bound(s, t), bfs.distance(t))
+                self.assertGreaterEqual(index.upper_bound(s, t), bfs.distance(t))
+                self.assertEqual(bfs.distance(t), index.distance(s, t))
+                path = index.path(s, t)
+                if bfs.connected(t):
+                    self.assertEqual(bfs.distance(t) + 1, len(path))
+                    self.assertEqual([s, t], [path[0], path[-1]])
+                    for v, w in zip(path, path[1:]):
+                        self.assertTrue(w in g.adjacents(v))
+                else:
+                    self.assertIsNone(path)
+
+    def testBoundsAndExactDistances(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        index = graph.LandmarkIndex.from_graph(g, 3)
+
+        self.assertEqual(0, index.landmarks()[0])
+        self.assertEqual(3, len(index.landmarks()))
+        self.assertExact(g, index)
+        self.assertEqual(sys.maxsize, index.lower_bound(0, 7))
+
+    def testDirected(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        self.assertExact(g, graph.LandmarkIndex.from_graph(g, 2))
+
+    def testMediumGraph(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        index = graph.LandmarkIndex.from_graph(g, 8)
+        bfs = graph.BreadthFirstSearch(g, 0)
+
+        for t in range(0, g.num_vertices(), 7):
+            self.assertEqual(bfs.distance(t), index.distance(0, t))
+        self.assertEqual(10, len(index.path(0, 123)))
+
+    def testRoundTrip(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        index = graph.LandmarkIndex.from_graph(g, 4)
+        index.save_binary(self.path)
+
+        for mmap in (True, False):
+            loaded = graph.LandmarkIndex.load_binary(self.path, g, mmap)
+            self.assertEqual(index.landmarks(), loaded.landmarks())
+            for s in range(g.num_vertices()):
+                for t in range(g.num_vertices()):
+                    self.assertEqual(index.lower_bound(s, t), loaded.lower_bound(s, t))
+                    self.assertEqual(index.upper_bound(s, t), loaded.upper_bound(s, t))
+            self.assertEqual(index.distance(0, 3), loaded.distance(0, 3))
+            loaded.close()
+
+        without_graph = graph.LandmarkIndex.load_binary(self.path)
+        with self.assertRaises(ValueError):
+            without_graph.path(0, 3)
+        without_graph.close()
+
+    def testBadFiles(self):
+        with open(self.path, 'wb') as fh:
+            fh.write(b'NOTANINDEX' * 4)
+        with self.assertRaises(ValueError):
+            graph.LandmarkIndex.load_binary(self.path)
+
+        graph.LandmarkIndex.from_graph(graph.Graph.from_file('tinyG.txt'), 2).save_binary(self.path)
+        with self.assertRaises(ValueError):
+            graph.LandmarkIndex.load_binary(self.path, graph.Graph(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
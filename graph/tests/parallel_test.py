@@ -0,0 +1,45 @@
+import unittest
+import graph
+import graph.parallel
+
+
+class ParallelBreadthFirstSearchTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def setUp(self):
+        self.min_chunk_size = graph.parallel.MIN_CHUNK_SIZE
+        graph.parallel.MIN_CHUNK_SIZE = 4     # expand even tiny levels in the workers
+
+    def tearDown(self):
+        graph.parallel.MIN_CHUNK_SIZE = self.min_chunk_size
+
+    def assertSameAsBFS(self, g, bfs, pbfs):
+        self.assertEqual(bfs.count(), pbfs.count())
+        for v in range(g.num_vertices()):
+            self.assertEqual(bfs.connected(v), pbfs.connected(v))
+            self.assertEqual(bfs.distance(v), pbfs.distance(v))
+            self.assertEqual(bfs.path_to(v), pbfs.path_to(v))
+
+    def testSerialFallback(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        pbfs = graph.parallel.ParallelBreadthFirstSearch(g, 0)
+        self.assertSameAsBFS(g, graph.BreadthFirstSearch(g, 0), pbfs)
+
+    def testParallelMediumGraph(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        pbfs = graph.parallel.ParallelBreadthFirstSearch(g, 0, workers=2, threshold=0)
+        self.assertSameAsBFS(g, graph.BreadthFirstSearch(g, 0), pbfs)
+        self.assertEqual([123, 246, 244, 207, 122, 92, 171, 165, 68, 0], pbfs.path_to(123))
+
+    def testSharedPool(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        with graph.parallel.SharedGraphPool(g, workers=2) as pool:
+            self.assertEqual(2, pool.workers())
+            for source in (0, 6, 7):
+                pbfs = graph.parallel.ParallelBreadthFirstSearch(g, source, pool=pool)
+                self.assertSameAsBFS(g, graph.BreadthFirstSearch(g, source), pbfs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import random
+import unittest
+import graph
+
+
+class PointToPointSearchTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def assertValidPath(self, g, path, source, target):
+        self.assertEqual(source, path[0])
+        self.assertEqual(target, path[-1])
+        for v, w in zip(path, path[1:]):
+            self.assertTrue(w in g.adjacents(v))
+
+    def testTinyGraph(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        for bidirectional in (False, True):
+            search = graph.PointToPointSearch(g, 0, 3, bidirectional)
+            self.assertTrue(search.connected())
+            self.assertEqual(2, search.distance())
+            self.assertValidPath(g, search.path(), 0, 3)
+
+            search = graph.PointToPointSearch(g, 0, 9, bidirectional)
+            self.assertFalse(search.connected())
+            self.assertIsNone(search.path())
+            self.assertIsNone(search.distance())
+
+            search = graph.PointToPointSearch(g, 4, 4, bidirectional)
+            self.assertEqual([4], search.path())
+            self.assertEqual(0, search.distance())
+
+    def testSameDistancesAsBFS(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        rnd = random.Random(3)
+        for _ in range(50):
+            source = rnd.randrange(g.num_vertices())
+            target = rnd.randrange(g.num_vertices())
+            bfs = graph.BreadthFirstSearch(g, source)
+            for bidirectional in (False, True):
+                search = graph.PointToPointSearch(g, source, target, bidirectional)
+                self.assertEqual(bfs.distance(target), search.distance())
+                self.assertValidPath(g, search.path(), source, target)
+
+    def testEarlyExit(self):
+        n = 10000
+        g = graph.Graph(n)
+        for v in range(n - 1):
+            g.add_edge(v, v + 1)
+        search = graph.PointToPointSearch(g, 5000, 5003)
+        self.assertEqual(3, search.distance())
+        self.assertTrue(search.count() < 10)
+
+    def testDirectedGraph(self):
+        g = graph.Graph.from_file('tinyDG.txt', directed=True)
+        search = graph.PointToPointSearch(g, 0, 2)
+        self.assertEqual(3, search.distance())
+        self.assertValidPath(g, search.path(), 0, 2)
+        self.assertFalse(graph.PointToPointSearch(g, 0, 7).connected())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import logging
+import unittest
+import graph
+
+
+class TraversalStatsTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testBreadthFirstSearch(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        stats = graph.TraversalStats()
+        bfs = graph.BreadthFirstSearch(g, 0, stats=stats)
+
+        self.assertEqual(graph.BreadthFirstSearch(g, 0).path_to(4), bfs.path_to(4))
+        self.assertEqual('BreadthFirstSearch', stats.traversal)
+        self.assertEqual(7, stats.vertices_visited)
+        self.assertEqual(16, stats.edges_scanned)
+        self.assertEqual(10, stats.redundant_checks)
+        self.assertEqual([1, 4, 2], stats.frontier_sizes)
+        self.assertEqual(['allocate', 'search'], sorted(stats.phases))
+        self.assertGreater(stats.peak_memory, 0)
+
+    def testDirectionOptimizing(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        top_down = graph.TraversalStats()
+        graph.BreadthFirstSearch(g, 0, stats=top_down)
+        optimizing = graph.TraversalStats()
+        bfs = graph.BreadthFirstSearch(g, 0, graph.BreadthFirstSearch.DIRECTION_OPTIMIZING, optimizing)
+
+        self.assertEqual(9, bfs.distance(123))
+        self.assertEqual(top_down.frontier_sizes, optimizing.frontier_sizes)
+        self.assertEqual(top_down.vertices_visited, optimizing.vertices_visited)
+        self.assertLess(optimizing.edges_scanned, top_down.edges_scanned)
+        self.assertTrue('bottom-up' in optimizing.phases)
+
+    def testDepthFirstSearch(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        stats = graph.TraversalStats()
+        dfs = graph.DepthFirstSearch(g, 0, stats)
+
+        self.assertEqual(graph.DepthFirstSearch(g, 0).path_to(3), dfs.path_to(3))
+        self.assertEqual(7, stats.vertices_visited)
+        self.assertEqual(16, stats.edges_scanned)
+        self.assertEqual(10, stats.redundant_checks)
+        self.assertEqual([], stats.frontier_sizes)
+
+    def testConnectedComponents(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        stats = graph.TraversalStats()
+        cc = graph.ConnectedComponents(g, stats)
+
+        self.assertEqual(3, cc.count())
+        self.assertEqual(4, cc.groupsize(12))
+        self.assertEqual(13, stats.vertices_visited)
+        self.assertEqual(26, stats.edges_scanned)
+        self.assertEqual(16, stats.redundant_checks)
+        self.assertEqual(['label'], sorted(stats.phases))
+
+    def testReporting(self):
+        reported = []
+        logger = logging.getLogger('graph.test')
+        stats = graph.TraversalStats(callback=lambda s: reported.append(s.as_dict()), logger=logger)
+        with self.assertLogs(logger, logging.INFO) as logs:
+            graph.ConnectedComponents(graph.Graph.from_file('tinyG.txt'), stats)
+            graph.BreadthFirstSearch(graph.Graph.from_file('tinyG.txt'), 9, stats=stats)
+
+        self.assertEqual(['ConnectedComponents', 'BreadthFirstSearch'], [r['traversal'] for r in reported])
+        self.assertEqual(4, reported[1]['vertices_visited'])
+        self.assertEqual(2, len(logs.output))
+        self.assertTrue('BreadthFirstSearch: 4 vertices visited' in logs.output[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
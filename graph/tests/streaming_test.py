@@ -0,0 +1,103 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+import graph
+from graph.streaming import EdgeReader
+
+
+class StreamingTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        with open('tinyG.txt', 'rb') as fh:
+            self.tiny = fh.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testReaderBatches(self):
+        reader = EdgeReader('tinyG.txt', batch_size=5)
+        batches = list(reader)
+
+        self.assertEqual(13, reader.numvertices)
+        self.assertEqual(13, reader.numedges)
+        self.assertEqual([6, 10, 10], [len(batch) for batch in batches])
+        self.assertEqual([0, 5, 4, 3], list(batches[0][:4]))
+
+    def testReaderWithoutHeader(self):
+        reader = EdgeReader(io.StringIO("1 2\n\n3 4 0.5\n5 6\n"))
+        self.assertEqual([[1, 2, 3, 4, 5, 6]], [list(batch) for batch in reader])
+        self.assertIsNone(reader.numvertices)
+
+    def testReaderCountsMatchByChance(self):
+        reader = EdgeReader(io.StringIO("0 1 9 9\n\n2 3\n"))
+        self.assertEqual([[0, 1, 2, 3]], [list(batch) for batch in reader])
+        with self.assertRaises(ValueError):
+            list(EdgeReader(io.StringIO("0 1 5\n7\n")))
+
+    def testReaderPairs(self):
+        reader = EdgeReader(iter([(0, 1), (1, 2), (2, 3)]), batch_size=2)
+        self.assertEqual([[0, 1, 1, 2], [2, 3]], [list(batch) for batch in reader])
+
+    def testReaderSingleVertex(self):
+        with self.assertRaises(ValueError):
+            list(EdgeReader(io.StringIO("1 2\n3\n4 5\n")))
+
+    def testCompressedFiles(self):
+        expected = str(graph.Graph.from_file('tinyG.txt'))
+        for extension, module in (('.gz', gzip), ('.bz2', bz2), ('.xz', lzma)):
+            filename = os.path.join(self.tmpdir, 'tinyG.txt' + extension)
+            with module.open(filename, 'wb') as fh:
+                fh.write(self.tiny)
+            g = graph.Graph.from_stream(filename, batch_size=4)
+            self.assertEqual(13, g.num_edges())
+            self.assertEqual(expected, str(g))
+
+    def testBinaryFileObject(self):
+        g = graph.Graph.from_stream(io.BytesIO(self.tiny), directed=True)
+        self.assertTrue(g.is_directed())
+        self.assertEqual(13, g.num_vertices())
+        self.assertEqual(str(graph.Graph.from_file('tinyG.txt', directed=True)), str(g))
+
+    def testGrow(self):
+        g = graph.Graph.from_stream([(0, 1), (5, 2)])
+        self.assertEqual(6, g.num_vertices())
+        self.assertEqual(2, g.num_edges())
+        self.assertTrue(5 in g.adjacents(2))
+
+        with self.assertRaises(IndexError):
+            graph.Graph(3).add_stream([(0, 1), (5, 2)], grow=False)
+
+    def testHeaderAddsIsolatedVertexes(self):
+        g = graph.Graph.from_stream(io.StringIO("10\n1\n0 1\n"))
+        self.assertEqual(10, g.num_vertices())
+
+    def testAddEdges(self):
+        g = graph.Graph(4)
+        uf = graph.UnionFind.from_graph(g, attach=True)
+        g.add_edges([(0, 1), (1, 2)])
+        self.assertEqual(2, g.num_edges())
+        self.assertEqual([0, 2], g.adjacents(1))
+        self.assertEqual(2, uf.count())
+
+        g.add_edges([(3, 6)], grow=True)
+        self.assertEqual(7, g.num_vertices())
+        self.assertEqual(4, uf.count())
+        self.assertTrue(uf.connected(3, 6))
+
+        with self.assertRaises(IndexError):
+            g.add_edges([(0, 7)])
+        with self.assertRaises(IndexError):
+            g.add_edges([(0, -1)])
+        self.assertEqual(3, g.num_edges())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+import graph
+from graph.symbol import LabelTable, LABELS_SUFFIX
+
+
+class SymbolGraphTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'routes.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testLoadFromFile(self):
+        g = graph.SymbolGraph.from_file('routes.txt')
+
+        self.assertEqual(10, g.num_vertices())
+        self.assertEqual(18, g.num_edges())
+        self.assertEqual(0, g.index('JFK'))
+        self.assertEqual('MCO', g.label(1))
+        self.assertTrue(g.contains('LAX'))
+        self.assertFalse(g.contains('SFO'))
+        self.assertIsNone(g.index('SFO'))
+        self.assertEqual(['JFK', 'MCO', 'ORD', 'DEN', 'HOU', 'DFW', 'PHX', 'ATL', 'LAX', 'LAS'],
+                         g.labels(range(g.num_vertices())))
+        self.assertIsNone(g.labels(None))
+        self.assertEqual(sorted(['ATL', 'MCO', 'ORD']), sorted(g.adjacents('JFK')))
+        self.assertRaises(KeyError, g.adjacents, 'SFO')
+
+    def testAdjacencyLists(self):
+        filename = os.path.join(self.tmpdir, 'movies.txt')
+        with open(filename, 'w') as fh:
+            fh.write("Alien/Weaver, Sigourney/Hurt, John\n")
+            fh.write("Heat/De Niro, Robert/Pacino, Al\n")
+            fh.write("Ronin/De Niro, Robert\n")
+            fh.write("Solaris\n")
+        g = graph.SymbolGraph.from_file(filename, '/')
+
+        self.assertEqual(8, g.num_vertices())
+        self.assertEqual(5, g.num_edges())
+        self.assertEqual(['Heat', 'Ronin'], sorted(g.adjacents('De Niro, Robert')))
+        self.assertEqual([], g.adjacents('Solaris'))
+
+    def testCompressedFileAndSmallBatches(self):
+        filename = os.path.join(self.tmpdir, 'routes.txt.gz')
+        with open('routes.txt', 'rb') as src, gzip.open(filename, 'wb') as dst:
+            dst.write(src.read())
+        g = graph.SymbolGraph.from_file(filename, batch_size=4)
+        expected = graph.SymbolGraph.from_file('routes.txt')
+
+        self.assertEqual(expected.num_vertices(), g.num_vertices())
+        self.assertEqual(expected.num_edges(), g.num_edges())
+        for v in range(g.num_vertices()):
+            self.assertEqual(expected.label(v), g.label(v))
+            self.assertEqual(expected.adjacents(g.label(v)), g.adjacents(g.label(v)))
+
+    def testAddEdge(self):
+        g = graph.SymbolGraph(directed=True)
+        g.add_edge('b3f1', 'a2c4')
+        g.add_edge('a2c4', 'e9d0')
+        g.add_edge('b3f1', 'a2c4')
+
+        self.assertEqual(3, g.num_vertices())
+        self.assertEqual(3, g.num_edges())
+        self.assertEqual(['a2c4', 'a2c4'], g.adjacents('b3f1'))
+        self.assertEqual([], g.adjacents('e9d0'))
+
+        g = graph.SymbolGraph(simple=True)
+        g.add_edge('x', 'y')
+        g.add_edge('y', 'x')
+        self.assertEqual(1, g.num_edges())
+
+    def testPathTo(self):
+        g = graph.SymbolGraph.from_file('routes.txt')
+        bfs = graph.BreadthFirstSearch(g.graph(), g.index('JFK'))
+
+        self.assertEqual(['JFK'], g.path_to(bfs, 'JFK'))
+        path = g.path_to(bfs, 'LAS')
+        self.assertEqual(4, len(path))
+        self.assertEqual(['ORD', 'JFK'], path[-2:])
+        self.assertEqual('LAS', path[0])
+        for v, w in zip(path, path[1:]):
+            self.assertIn(w, g.adjacents(v))
+
+        g.add_edge('SFO', 'OAK')
+        bfs = graph.BreadthFirstSearch(g.graph(), g.index('JFK'))
+        self.assertIsNone(g.path_to(bfs, 'OAK'))
+        dfs = graph.DepthFirstSearch(g.graph(), g.index('SFO'))
+        self.assertEqual(['OAK', 'SFO'], g.path_to(dfs, 'OAK'))
+
+    def testGroupAndMembers(self):
+        g = graph.SymbolGraph.from_file('routes.txt')
+        g.add_edge('SFO', 'OAK')
+        cc = graph.ConnectedComponents(g.graph())
+
+        self.assertEqual(g.group(cc, 'JFK'), g.group(cc, 'LAX'))
+        self.assertEqual(g.group(cc, 'SFO'), g.group(cc, 'OAK'))
+        self.assertNotEqual(g.group(cc, 'JFK'), g.group(cc, 'OAK'))
+        self.assertEqual(['OAK', 'SFO'], sorted(g.members(cc, 'OAK')))
+        self.assertEqual(10, len(g.members(cc, 'HOU')))
+
+        uf = graph.UnionFind.from_graph(g.graph())
+        self.assertEqual(g.group(uf, 'SFO'), g.group(uf, 'OAK'))
+
+    def testSaveAndLoadBinary(self):
+        g = graph.SymbolGraph.from_file('routes.txt')
+        g.add_edge('Zürich', 'ORD')
+        g.save_binary(self.path)
+        self.assertTrue(os.path.exists(self.path + LABELS_SUFFIX))
+
+        for mmap in (True, False):
+            loaded = graph.SymbolGraph.load_binary(self.path, mmap)
+            self.assertIsInstance(loaded.graph(), graph.CSRGraph)
+            self.assertEqual(g.num_vertices(), loaded.num_vertices())
+            self.assertEqual(g.num_edges(), loaded.num_edges())
+            for v in range(g.num_vertices()):
+                label = g.label(v)
+                self.assertEqual(label, loaded.label(v))
+                self.assertEqual(v, loaded.index(label))
+                self.assertEqual(sorted(g.adjacents(label)), sorted(loaded.adjacents(label)))
+            self.assertIsNone(loaded.index('SFO'))
+            self.assertIsNone(loaded.index(''))
+            self.assertIsNone(loaded.index('ZZZ'))
+            self.assertRaises(ValueError, loaded.add_edge, 'SFO', 'OAK')
+
+            bfs = graph.BreadthFirstSearch(loaded.graph(), loaded.index('Zürich'))
+            self.assertEqual(['DEN', 'ORD', 'Zürich'], loaded.path_to(bfs, 'DEN'))
+            loaded.save_binary(self.path + '.copy')
+            loaded.close()
+
+        copy = graph.SymbolGraph.load_binary(self.path + '.copy')
+        self.assertEqual([g.label(v) for v in range(g.num_vertices())],
+                         [copy.label(v) for v in range(copy.num_vertices())])
+        copy.close()
+
+    def testLabelTable(self):
+        table = LabelTable.from_labels([])
+        self.assertEqual(0, len(table))
+        self.assertIsNone(table.index('a'))
+
+        labels = ['delta', 'alpha', 'ärger', 'charlie', 'bravo', '']
+        table = LabelTable.from_labels(labels)
+        self.assertEqual(len(labels), len(table))
+        for v, label in enumerate(labels):
+            self.assertEqual(label, table.label(v))
+            self.assertEqual(v, table.index(label))
+        self.assertIsNone(table.index('echo'))
+
+    def testLoadBinaryErrors(self):
+        filename = os.path.join(self.tmpdir, 'bad.labels')
+        with open(filename, 'wb') as fh:
+            fh.write(b'NOTLABELS' * 8)
+        self.assertRaises(ValueError, LabelTable.load_binary, filename)
+
+        graph.Graph.from_file('tinyG.txt').save_binary(self.path)
+        LabelTable.from_labels(['a', 'b']).save_binary(self.path + LABELS_SUFFIX)
+        self.assertRaises(ValueError, graph.SymbolGraph.load_binary, self.path, False)
+
+
+if __name__ == '__main__':
+    unittest.main()
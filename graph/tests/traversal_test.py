@@ -0,0 +1,90 @@
+import itertools
+import unittest
+import graph
+from graph.traversal import bfs_iter, dfs_iter, PRE_ORDER, POST_ORDER
+
+
+class CountingGraph:
+    """Wraps a graph counting the calls to adjacents."""
+
+    def __init__(self, g):
+        self._graph = g
+        self.calls = 0
+
+    def adjacents(self, vertex):
+        self.calls += 1
+        return self._graph.adjacents(vertex)
+
+
+class TraversalTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testBfsSameAsBreadthFirstSearch(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        bfs = graph.BreadthFirstSearch(g, 0)
+        visited = list(bfs_iter(g, 0))
+
+        self.assertEqual(bfs.count(), len(visited))
+        self.assertEqual((0, 0, 0), visited[0])
+        depths = [depth for _, _, depth in visited]
+        self.assertEqual(sorted(depths), depths)
+        for vertex, parent, depth in visited:
+            self.assertEqual(bfs.distance(vertex), depth)
+            self.assertTrue(parent in g.adjacents(vertex) or vertex == 0)
+
+    def testBfsDepthLimit(self):
+        g = graph.Graph.from_file('tinyG.txt')
+
+        self.assertEqual([(0, 0, 0)], list(bfs_iter(g, 0, max_depth=0)))
+        self.assertEqual([0, 5, 1, 2, 6], [v for v, _, _ in bfs_iter(g, 0, max_depth=1)])
+        self.assertEqual(7, len(list(bfs_iter(g, 0, max_depth=5))))
+
+    def testBfsStopsEarly(self):
+        g = CountingGraph(graph.Graph.from_file('mediumG.txt'))
+        first = list(itertools.islice(bfs_iter(g, 0), 3))
+
+        self.assertEqual(3, len(first))
+        self.assertEqual(1, g.calls)
+
+    def testDfsSameAsDepthFirstSearch(self):
+        g = graph.Graph.from_file('mediumG.txt')
+        dfs = graph.DepthFirstSearch(g, 0)
+        events = list(dfs_iter(g, 0))
+        pre = [e for e in events if e[0] == PRE_ORDER]
+        post = [e for e in events if e[0] == POST_ORDER]
+
+        self.assertEqual(dfs.count(), len(pre))
+        self.assertEqual(dfs.count(), len(post))
+        self.assertEqual((PRE_ORDER, 0, 0, 0), events[0])
+        self.assertEqual((POST_ORDER, 0, 0, 0), events[-1])
+        for _, vertex, parent, depth in pre:
+            self.assertEqual(dfs.path_to(vertex)[1:2] or [0], [parent])
+            self.assertEqual(len(dfs.path_to(vertex)) - 1, depth)
+
+    def testDfsEventsNest(self):
+        g = graph.Graph(4)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(0, 3)
+
+        self.assertEqual([(PRE_ORDER, 0, 0, 0), (PRE_ORDER, 1, 0, 1), (PRE_ORDER, 2, 1, 2), (POST_ORDER, 2, 1, 2),
+                          (POST_ORDER, 1, 0, 1), (PRE_ORDER, 3, 0, 1), (POST_ORDER, 3, 0, 1), (POST_ORDER, 0, 0, 0)],
+                         list(dfs_iter(g, 0)))
+        self.assertEqual([(PRE_ORDER, 0, 0, 0), (PRE_ORDER, 1, 0, 1), (POST_ORDER, 1, 0, 1), (PRE_ORDER, 3, 0, 1),
+                          (POST_ORDER, 3, 0, 1), (POST_ORDER, 0, 0, 0)],
+                         list(dfs_iter(g, 0, max_depth=1)))
+        self.assertEqual([(PRE_ORDER, 0, 0, 0), (POST_ORDER, 0, 0, 0)], list(dfs_iter(g, 0, max_depth=0)))
+
+    def testDfsStopsEarly(self):
+        g = CountingGraph(graph.Graph.from_file('mediumG.txt'))
+        events = dfs_iter(g, 0)
+        found = next(vertex for event, vertex, _, _ in events if event == PRE_ORDER and vertex == 123)
+        events.close()
+
+        self.assertEqual(123, found)
+        self.assertLess(g.calls, 250)
+
+
+if __name__ == '__main__':
+    unittest.main()
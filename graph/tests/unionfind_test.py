@@ -0,0 +1,55 @@
+import random
+import unittest
+import graph
+
+
+class UnionFindTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def testEmpty(self):
+        uf = graph.UnionFind(5)
+        self.assertEqual(5, uf.count())
+        self.assertFalse(uf.connected(0, 1))
+        self.assertEqual(3, uf.group(3))
+        self.assertEqual(1, uf.groupsize(3))
+
+    def testUnion(self):
+        uf = graph.UnionFind(5)
+        self.assertTrue(uf.union(3, 4))
+        self.assertTrue(uf.union(4, 1))
+        self.assertFalse(uf.union(1, 3))
+
+        self.assertEqual(3, uf.count())
+        self.assertTrue(uf.connected(3, 1))
+        self.assertEqual(1, uf.group(4))
+        self.assertEqual(3, uf.groupsize(3))
+
+    def testSameAsConnectedComponents(self):
+        g = graph.Graph.from_file('tinyG.txt')
+        uf = graph.UnionFind.from_graph(g)
+        cc = graph.ConnectedComponents(g)
+
+        self.assertEqual(cc.count(), uf.count())
+        for v in range(g.num_vertices()):
+            self.assertEqual(cc.group(v), uf.group(v))
+            self.assertEqual(cc.groupsize(v), uf.groupsize(v))
+
+    def testAttachedToGraph(self):
+        rnd = random.Random(7)
+        g = graph.Graph(200)
+        uf = graph.UnionFind.from_graph(g, attach=True)
+        for _ in range(150):
+            g.add_edge(rnd.randrange(200), rnd.randrange(200))
+
+            cc = graph.ConnectedComponents(g)
+            self.assertEqual(cc.count(), uf.count())
+            self.assertEqual(cc.groups(), [uf.group(v) for v in range(200)])
+
+        g.detach(uf)
+        g.add_edge(0, 199)
+        self.assertEqual(cc.count(), uf.count())
+
+
+if __name__ == '__main__':
+    unittest.main()
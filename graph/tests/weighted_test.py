@@ -0,0 +1,104 @@
+import math
+import os
+import shutil
+import tempfile
+import unittest
+from graph.weighted import WeightedGraph, DijkstraSearch, AStarSearch
+
+
+class WeightedGraphTest(unittest.TestCase):
+
+    __runSlowTests = False
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def grid(self, size):
+        g = WeightedGraph(size * size)
+        for row in range(size):
+            for col in range(size):
+                v = row * size + col
+                if col + 1 < size:
+                    g.add_edge(v, v + 1, 1.0 + (row % 3))
+                if row + 1 < size:
+                    g.add_edge(v, v + size, 1.0 + (col % 2))
+        return g
+
+    def testFromFile(self):
+        g = WeightedGraph.from_file('tinyEWD.txt', directed=True)
+
+        self.assertEqual(8, g.num_vertices())
+        self.assertEqual(15, g.num_edges())
+        self.assertEqual([4, 2], list(g.adjacents(0)))
+        self.assertEqual([(4, 0.38), (2, 0.26)], list(g.edges(0)))
+        self.assertEqual([0.38, 0.26], list(g.weights(0)))
+        self.assertTrue("0 => [(4, 0.38), (2, 0.26)]" in str(g))
+
+        undirected = WeightedGraph.from_file('tinyEWD.txt')
+        self.assertEqual([(4, 0.38), (2, 0.26), (6, 0.58)], list(undirected.edges(0)))
+
+    def testBadFiles(self):
+        path = os.path.join(self.tmpdir, 'graph.txt')
+        with open(path, 'w') as fh:
+            fh.write("2\n1\n0 1\n")
+        with self.assertRaises(ValueError):
+            WeightedGraph.from_file(path)
+        with open(path, 'w') as fh:
+            fh.write("2\n1\n0 1 -1.5\n")
+        with self.assertRaises(ValueError):
+            WeightedGraph.from_file(path)
+        with self.assertRaises(ValueError):
+            WeightedGraph(2).add_edge(0, 1, -1)
+
+    def testDijkstra(self):
+        g = WeightedGraph.from_file('tinyEWD.txt', directed=True)
+        dijkstra = DijkstraSearch(g, 0)
+
+        expected = [0.0, 1.05, 0.26, 0.99, 0.38, 0.73, 1.51, 0.60]
+        for v in range(g.num_vertices()):
+            self.assertAlmostEqual(expected[v], dijkstra.distance(v))
+        self.assertEqual([6, 3, 7, 2, 0], dijkstra.path_to(6))
+        self.assertEqual([1, 5, 4, 0], dijkstra.path_to(1))
+        self.assertEqual(8, dijkstra.count())
+
+        unreached = WeightedGraph(3, directed=True)
+        unreached.add_edge(0, 1, 2)
+        dijkstra = DijkstraSearch(unreached, 0)
+        self.assertFalse(dijkstra.connected(2))
+        self.assertIsNone(dijkstra.path_to(2))
+        self.assertEqual(math.inf, dijkstra.distance(2))
+
+    def testEarlyExit(self):
+        g = WeightedGraph.from_file('tinyEWD.txt', directed=True)
+        dijkstra = DijkstraSearch(g, 0, 2)
+
+        self.assertEqual(2, dijkstra.count())
+        self.assertAlmostEqual(0.26, dijkstra.distance(2))
+        self.assertEqual([2, 0], dijkstra.path_to(2))
+
+    def testAStar(self):
+        size = 20
+        g = self.grid(size)
+        target = size * size - 1
+        dijkstra = DijkstraSearch(g, 0)
+
+        def manhattan(v):
+            return abs(v // size - target // size) + abs(v % size - target % size)
+
+        astar = AStarSearch(g, 0, target, manhattan)
+        self.assertAlmostEqual(dijkstra.distance(target), astar.distance(target))
+        path = astar.path()
+        self.assertEqual([0, target], [path[0], path[-1]])
+        self.assertAlmostEqual(astar.distance(target),
+                               sum(dict(g.edges(v))[w] for v, w in zip(path, path[1:])))
+        self.assertLess(astar.count(), DijkstraSearch(g, 0, target).count())
+
+        self.assertAlmostEqual(dijkstra.distance(target), AStarSearch(g, 0, target).distance(target))
+        self.assertIsNone(AStarSearch(WeightedGraph(2), 0, 1).path())
+
+
+if __name__ == '__main__':
+    unittest.main()
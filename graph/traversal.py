@@ -0,0 +1,83 @@
+"""
+Lazy traversals: generators that visit the graph only as far as their consumer asks for.
+"""
+
+# The events yielded by dfs_iter.
+PRE_ORDER = 'pre'
+POST_ORDER = 'post'
+
+
+def bfs_iter(graph, source: int, max_depth: int = None):
+    """Navigates the graph from the given source in breadth first order, one vertex at a time.
+
+    Every vertex is yielded as soon as it is discovered, so a consumer that stops early
+    (e.g. after the first N vertexes or at the first one matching a predicate)
+    does not pay for the rest of the component. The state is kept in dictionaries,
+    so the cost depends on the vertexes touched and not on the size of the graph.
+
+    :param graph: the graph we want to navigate.
+    :param source: the vertex where we start the navigation.
+    :param max_depth: the largest distance from the source of the vertexes to visit; by default there is no limit.
+    :return: a generator of (vertex, parent, depth) tuples, in order of distance from the source,
+        where parent is the vertex the vertex was discovered from (the source for the source itself)
+        and depth its distance from the source.
+    """
+    adjacents = graph.adjacents
+    depth = {source: 0}
+    yield source, source, 0
+    queue = [source]
+    i = 0
+    while i < len(queue):
+        v = queue[i]
+        i += 1
+        d = depth[v] + 1
+        if max_depth is not None and d > max_depth:
+            break
+        for w in adjacents(v):
+            if w not in depth:
+                depth[w] = d
+                yield w, v, d
+                queue.append(w)
+
+
+def dfs_iter(graph, source: int, max_depth: int = None):
+    """Navigates the graph from the given source in depth first order, one step at a time.
+
+    A vertex is entered (a PRE_ORDER event) before any of its descendants and left (a POST_ORDER event)
+    after all of them, in the same order followed by DepthFirstSearch.
+    The search advances only when the consumer asks for the next event, and stops when the consumer stops.
+
+    :param graph: the graph we want to navigate.
+    :param source: the vertex where we start the navigation.
+    :param max_depth: the largest depth in the search tree of the vertexes to visit; by default there is no limit.
+        A vertex is visited once, from the first path that reaches it,
+        so with a limit some vertexes within max_depth edges from the source may be missed.
+    :return: a generator of (event, vertex, parent, depth) tuples, where event is PRE_ORDER or POST_ORDER,
+        parent is the vertex the vertex was reached from (the source for the source itself)
+        and depth the depth of the vertex in the search tree.
+    """
+    adjacents = graph.adjacents
+    visited = {source}
+    vertexes = []
+    iterators = []
+    v, remaining, parent = source, iter(adjacents(source)), source
+    yield PRE_ORDER, source, source, 0
+    if max_depth is not None and max_depth < 1:
+        remaining = iter(())
+    while True:
+        for w in remaining:
+            if w not in visited:
+                visited.add(w)
+                vertexes.append((v, parent))
+                iterators.append(remaining)
+                depth = len(vertexes)
+                yield PRE_ORDER, w, v, depth
+                v, remaining, parent = w, iter(adjacents(w)), v
+                if max_depth is not None and depth >= max_depth:
+                    remaining = iter(())
+                break
+        else:
+            yield POST_ORDER, v, parent, len(vertexes)
+            if not vertexes:
+                break
+            (v, parent), remaining = vertexes.pop(), iterators.pop()
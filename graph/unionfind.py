@@ -0,0 +1,122 @@
+"""
+Union-find (disjoint sets) data type to answer connectivity queries on a growing graph.
+"""
+
+from array import array
+
+from graph.loader import VERTEX_TYPECODE
+
+
+class UnionFind:
+    """
+    Keeps track of the connected components of a graph while its edges are added, one at a time.\n
+    It answers the same queries of ConnectedComponents (connected, group, groupsize, count) with the same meaning:
+    in particular the group of a vertex is the smallest vertex of its component.
+    For directed graphs the components are the weakly connected ones, i.e. edge directions are ignored.
+
+    **Implementation notes**:
+    Every component is a tree stored in a flat array of parents, whose root identifies the component.
+    Union by size keeps the trees shallow and path compression flattens them on every find,
+    so that every operation takes nearly constant time, O(α(V)).
+    """
+
+    def __init__(self, numvertices: int):
+        """Creates a structure where each of the given number of vertices is a component by itself.
+
+        :param numvertices: the number of vertices.
+        :return: a union-find structure with no connections
+        :rtype: UnionFind
+        """
+        self._reset(numvertices)
+        self._graph = None
+
+    def _reset(self, numvertices: int):
+        self._parent = array(VERTEX_TYPECODE, range(numvertices))
+        self._size = array(VERTEX_TYPECODE, [1]) * numvertices
+        self._least = array(VERTEX_TYPECODE, range(numvertices))
+        self._count = numvertices
+
+    @classmethod
+    def from_graph(cls, graph, attach=False):
+        """Builds the components of the given graph.
+
+        :param graph: the graph to analyze.
+        :param attach: True to keep the structure attached to the graph, so that it is updated by every add_edge.
+        :return: a union-find structure with the components of the graph
+        :rtype: UnionFind
+        """
+        uf = cls(graph.num_vertices())
+        uf._union_all(graph)
+        if attach:
+            uf._graph = graph
+            graph.attach(uf)
+        return uf
+
+    def _union_all(self, graph):
+        for v in range(graph.num_vertices()):
+            for w in graph.adjacents(v):
+                self.union(v, w)
+
+    def find(self, vertex: int) -> int:
+        """:return: the root of the tree of the component the given vertex is part of."""
+        parent = self._parent
+        root = vertex
+        while parent[root] != root:
+            root = parent[root]
+        while parent[vertex] != root:
+            parent[vertex], vertex = root, parent[vertex]
+        return root
+
+    def union(self, v: int, w: int) -> bool:
+        """Merges the components of the two given vertexes.
+
+        :return: True if the two vertexes were in different components, False if they were already connected.
+        """
+        rv = self.find(v)
+        rw = self.find(w)
+        if rv == rw:
+            return False
+        if self._size[rv] < self._size[rw]:
+            rv, rw = rw, rv
+        self._parent[rw] = rv
+        self._size[rv] += self._size[rw]
+        if self._least[rw] < self._least[rv]:
+            self._least[rv] = self._least[rw]
+        self._count -= 1
+        return True
+
+    def edge_added(self, vertex1: int, vertex2: int):
+        """Called by the graph this structure is attached to when an edge is added."""
+        self.union(vertex1, vertex2)
+
+    def edge_removed(self, vertex1: int, vertex2: int):
+        """Called by the graph this structure is attached to when an edge is removed.
+
+        Components can not be split, so they are rebuilt from scratch, in time proportional to V + E.
+        """
+        self._reset(len(self._parent))
+        self._union_all(self._graph)
+
+    def vertices_added(self, count: int):
+        """Called by the graph this structure is attached to when vertices are added."""
+        numvertices = len(self._parent)
+        self._parent.extend(range(numvertices, numvertices + count))
+        self._size.extend(array(VERTEX_TYPECODE, [1]) * count)
+        self._least.extend(range(numvertices, numvertices + count))
+        self._count += count
+
+    def count(self) -> int:
+        """:return: The number of different connected components. """
+        return self._count
+
+    def connected(self, v: int, w: int) -> bool:
+        """ :return: True if the two vertexes are connected, False otherwise."""
+        return self.find(v) == self.find(w)
+
+    def group(self, vertex: int) -> int:
+        """:return: The id of the connected component the given vertex is part of."""
+        return self._least[self.find(vertex)]
+
+    def groupsize(self, vertex: int) -> int:
+        """:return: The size of the connected component the given vertex is part of."""
+        return self._size[self.find(vertex)]
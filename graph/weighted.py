@@ -0,0 +1,237 @@
+"""
+Weighted graph data type and shortest paths by total weight: Dijkstra's algorithm and A* search.
+"""
+
+from array import array
+import heapq
+import math
+
+from graph.loader import VERTEX_TYPECODE, WEIGHT_TYPECODE, read_weighted_edge_list
+
+
+class WeightedGraph:
+    """
+    Directed or undirected graph where every edge has a non negative weight, e.g. a length or a travel time.\n
+    Vertexes are named with consecutive numbers starting from 0, as in Graph.
+    adjacents() returns the same sequences as Graph does, so that all the unweighted searches work on it unchanged.
+
+    **Implementation notes**:
+    For every vertex two parallel typed arrays are kept: the adjacent vertexes and the weights of the edges to them,
+    so an edge costs a machine integer and a machine double, not a Python object.
+    """
+
+    def __init__(self, numvertices, directed=False):
+        """Creates a graph with the given number of vertices and no edges.
+
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :return: an empty graph with a structure to hold weighted edges for the given number of vertexes
+        :rtype: WeightedGraph
+        """
+        self._numvertices = numvertices
+        self._directed = directed
+        self._numedges = 0
+        self._targets = [array(VERTEX_TYPECODE) for _ in range(numvertices)]
+        self._weights = [array(WEIGHT_TYPECODE) for _ in range(numvertices)]
+
+    @classmethod
+    def from_file(cls, filename: str, directed=False):
+        """Loads a weighted graph definition from a file.
+
+        First line must contain the number of vertexes;
+        second line must contain the number of edges;
+        from third line onward there must be two integers representing the two vertexes to be connected by and edge,
+        followed by the weight of the edge.
+
+        :param filename: the name of the file containing the graph definition.
+        :param directed: True if the graph is a directed graph; default is False, i.e. an undirected graph.
+        :return: a graph built from the information stored in the file
+        :rtype: WeightedGraph
+        """
+        numvertices, _, endpoints, weights = read_weighted_edge_list(filename)
+        graph = cls(numvertices, directed)
+        if weights and min(weights) < 0:
+            raise ValueError("File " + filename + " contains an edge with a negative weight.")
+        targets = graph._targets
+        vertex_weights = graph._weights
+        vertexes = iter(endpoints)
+        for (v, w), weight in zip(zip(vertexes, vertexes), weights):
+            targets[v].append(w)
+            vertex_weights[v].append(weight)
+            if not directed:
+                targets[w].append(v)
+                vertex_weights[w].append(weight)
+        graph._numedges = len(weights)
+        return graph
+
+    def is_directed(self):
+        """:return: True if the graph is a directed graph, False if is an undirected graph."""
+        return self._directed
+
+    def num_vertices(self) -> int:
+        """:return: the number of vertexes in the graph."""
+        return self._numvertices
+
+    def num_edges(self) -> int:
+        """:return: the number of edges in the graph."""
+        return self._numedges
+
+    def add_edge(self, vertex1, vertex2, weight: float):
+        """
+        Add an edge connecting vertex1 to vertex2 with the given weight.
+
+        :param vertex1: the first vertex of the edge being added.
+        :param vertex2: the second vertex of the edge being added.
+        :param weight: the weight of the edge, that can not be negative.
+        :return: None
+        """
+        if weight < 0:
+            raise ValueError("Edge weights can not be negative: " + str(weight))
+        self._targets[vertex1].append(vertex2)
+        self._weights[vertex1].append(weight)
+        if not self._directed:
+            self._targets[vertex2].append(vertex1)
+            self._weights[vertex2].append(weight)
+        self._numedges += 1
+
+    def adjacents(self, vertex):
+        return self._targets[vertex]
+
+    def weights(self, vertex):
+        """:return: the weights of the edges from the given vertex, in the same order of its adjacents."""
+        return self._weights[vertex]
+
+    def edges(self, vertex):
+        """:return: an iterator of (adjacent, weight) pairs for the edges from the given vertex."""
+        return zip(self._targets[vertex], self._weights[vertex])
+
+    def __str__(self):
+        lines = []
+        for v in range(self._numvertices):
+            lines.append(str(v) + " => " + str(list(self.edges(v))) + "\n")
+        return "".join(lines)
+
+
+class DijkstraSearch:
+    """
+    Finds the paths of least total weight from the given source vertex to the vertexes connected with it.\n
+    When a target vertex is given the search stops as soon as the target is reached: then the results are final
+    for the target and for the vertexes nearer to the source than the target, the other vertexes may not be reached.
+
+    **Implementation notes**:
+    The priority queue is a binary heap (heapq) of (priority, distance, vertex) entries with lazy deletion:
+    when a shorter path to a vertex is found a new entry is pushed, instead of decreasing the key of the old one,
+    and the entries that are out of date are skipped when popped. It takes time proportional to E log E.
+    """
+
+    def __init__(self, graph: WeightedGraph, source_vertex: int, target_vertex: int = None):
+        """Navigate the given WeightedGraph from the given source vertex using Dijkstra's algorithm.
+
+        :param graph: the graph we want to navigate.
+        :param source_vertex: the vertex where we start the navigation.
+        :param target_vertex: the vertex where to stop the navigation, if any.
+        :return: a DijkstraSearch object to query the graph starting from the given source vertex.
+        """
+        self._source = source_vertex
+        self._target = target_vertex
+        self._distance = array(WEIGHT_TYPECODE, [math.inf]) * graph.num_vertices()
+        self._predecessor = array(VERTEX_TYPECODE, [-1]) * graph.num_vertices()
+        self._count = 0
+        self._search(graph, None)
+
+    def _search(self, graph: WeightedGraph, heuristic):
+        distance = self._distance
+        predecessor = self._predecessor
+        targets = graph.adjacents
+        weights = graph.weights
+        target = self._target
+
+        distance[self._source] = 0
+        predecessor[self._source] = self._source
+        heap = [(heuristic(self._source) if heuristic is not None else 0, 0, self._source)]
+        while heap:
+            _, d, v = heapq.heappop(heap)
+            if d > distance[v]:
+                continue
+            self._count += 1
+            if v == target:
+                break
+            for w, weight in zip(targets(v), weights(v)):
+                dw = d + weight
+                if dw < distance[w]:
+                    distance[w] = dw
+                    predecessor[w] = v
+                    heapq.heappush(heap, (dw + heuristic(w) if heuristic is not None else dw, dw, w))
+
+    def connected(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know if it is connected to the source fro the current Graph.
+        :return: True if the given vertex is connected to the source, False otherwise.
+        """
+        return self._predecessor[vertex] != -1
+
+    def count(self) -> int:
+        """:return: How many vertexes have been settled, i.e. taken from the queue, including the source."""
+        return self._count
+
+    def path_to(self, vertex: int):
+        """Find the path of least weight from the given vertex to the source.
+
+        :param vertex: the vertex to find a path to the source
+        :return: a list with the vertexes to navigate to get to the source if it is connected or None otherwise
+        """
+        path = None
+        if self.connected(vertex):
+            path = []
+            while vertex != self._source:
+                path.append(vertex)
+                vertex = self._predecessor[vertex]
+            path.append(self._source)
+
+        return path
+
+    def distance(self, vertex: int):
+        """
+        :param vertex: the vertex we want to know the distance from the source.
+        :return: the total weight of the path of least weight between the given vertex and the source,
+            math.inf if it is not connected.
+        """
+        return self._distance[vertex]
+
+
+class AStarSearch(DijkstraSearch):
+    """
+    Finds the path of least total weight from a source to a target vertex,
+    guided by a heuristic estimate of the weight still needed to get to the target.\n
+    The heuristic must never overestimate the weight of the path from a vertex to the target (it is admissible):
+    e.g. the straight line distance when weights are road lengths.
+    The better the estimate, the fewer the vertexes explored; with no heuristic this is Dijkstra's algorithm.
+
+    **Implementation notes**:
+    This is Dijkstra's algorithm where the priority of a vertex is its distance from the source plus its heuristic.
+    With lazy deletion a vertex is settled again when a shorter path to it is found,
+    so the path found is a shortest one even when the heuristic is admissible but not consistent.
+    """
+
+    def __init__(self, graph: WeightedGraph, source_vertex: int, target_vertex: int, heuristic=None):
+        """Searches the path of least weight between the given vertexes.
+
+        :param graph: the graph we want to navigate.
+        :param source_vertex: the vertex where the path starts.
+        :param target_vertex: the vertex where the path ends.
+        :param heuristic: a function returning, for a vertex, an estimate of the weight of its path to the target
+            that is never larger than the actual one; by default 0.
+        :return: an AStarSearch object to query the path found.
+        """
+        self._source = source_vertex
+        self._target = target_vertex
+        self._distance = array(WEIGHT_TYPECODE, [math.inf]) * graph.num_vertices()
+        self._predecessor = array(VERTEX_TYPECODE, [-1]) * graph.num_vertices()
+        self._count = 0
+        self._search(graph, heuristic)
+
+    def path(self):
+        """:return: a list with the vertexes of the path, from the source to the target, or None if there is no path."""
+        path = self.path_to(self._target)
+        if path is not None:
+            path.reverse()
+        return path